@@ -0,0 +1,110 @@
+"""Kart kurulumu: saniyede kaç TaskCard oluşturulabiliyor?
+
+Panodaki gibi her kart kurulur, stili uygulanır (ensurePolished) ve boyutu
+sorulur (sizeHint). Karşılaştırma için eski yol da taklit edilir: kart başına
+f-string stylesheet + hemen kurulan (gizli) detay alanı.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_card_build --cards 2000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication
+
+from taskscope.models.rows import SubTaskRow, TaskRow
+from taskscope.ui.task_card import TaskCard
+
+THEME_QSS = Path(__file__).resolve().parent.parent / "taskscope" / "resources" / "theme.qss"
+
+# Eski TaskCard.__init__ içindeki kart başına stylesheet
+LEGACY_QSS = """
+    QFrame#TaskCard {{
+        background: #FFFFFF;
+        border: 1px solid {0};
+        border-left: 5px solid {0};
+        border-radius: 8px;
+    }}
+    QLabel#Title {{ font-size: 15px; font-weight: 700; color: #0F1E19; }}
+    QLabel#Meta {{ color: #718096; font-size: 11px; }}
+    QFrame#TaskCard[done="true"] QLabel#Title {{ color: #A0AEC0; text-decoration: line-through; }}
+    QFrame#TaskCard[selected="true"] {{ background: #EBF8FF; border: 2px solid #3182CE; }}
+"""
+LEGACY_BORDER = {"Yüksek": "#E53E3E", "Düşük": "#38A169"}
+
+
+def make_rows(n: int) -> list[TaskRow]:
+    now = datetime.now()
+    return [
+        TaskRow(id=i + 1, title=f"Görev {i}", description="açıklama " * 8, status="todo",
+                priority=("Yüksek", "Orta", "Düşük")[i % 3], tags="iş, acil" if i % 2 else "",
+                project="Genel", due_at=now + timedelta(hours=i) if i % 3 else None, is_done=i % 4 == 0,
+                created_at=now, updated_at=now, subtask_total=3, subtask_done=i % 4)
+        for i in range(n)
+    ]
+
+
+def _subtasks(task_id: int) -> list[SubTaskRow]:
+    return [SubTaskRow(id=task_id * 10 + j, task_id=task_id, title=f"adım {j}", is_done=j % 2 == 0)
+            for j in range(3)]
+
+
+def build(t: TaskRow) -> TaskCard:
+    return TaskCard(t.id, t.title, t.description, t.due_at, t.is_done, t.priority, t.tags,
+                    subtask_counts=(t.subtask_done, t.subtask_total), subtask_loader=_subtasks)
+
+
+def build_legacy(t: TaskRow) -> TaskCard:
+    card = build(t)
+    card.setStyleSheet(LEGACY_QSS.format(LEGACY_BORDER.get(t.priority, "#86CDB9")))
+    card._build_detail()
+    card.detail_widget.setVisible(False)
+    return card
+
+
+def measure(label: str, factory, rows: list[TaskRow], repeat: int) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        cards = []
+        for t in rows:
+            card = factory(t)
+            card.ensurePolished()
+            card.sizeHint()
+            cards.append(card)
+        best = min(best, time.perf_counter() - t0)
+        for card in cards:
+            card.deleteLater()
+        QApplication.processEvents()
+        del cards
+    return {"label": label, "cards": len(rows), "best_ms": best * 1000, "per_sec": len(rows) / best}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    app.setStyleSheet(THEME_QSS.read_text(encoding="utf-8"))
+
+    rows = make_rows(args.cards)
+    results = [measure("eski (kart başına QSS + detay)", build_legacy, rows, args.repeat),
+               measure("paylaşılan QSS + tembel detay", build, rows, args.repeat)]
+
+    print(f"{args.cards} kart")
+    print(f"{'yol':<34}{'süre (ms)':>12}{'kart/sn':>12}")
+    for r in results:
+        print(f"{r['label']:<34}{r['best_ms']:>12.1f}{r['per_sec']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Liste yükleme: ORM varlıkları vs. hafif TaskRow satırları.
+
+10k görev x 10 alt görevlik geçici bir veritabanında eski joined-load yolu,
+list_tasks (selectinload) ve list_task_rows süre ve bellek açısından ölçülür:
+
+    python -m benchmarks.bench_list_load --tasks 10000 --subtasks 10
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker, joinedload
+
+from taskscope.db.database import init_db
+from taskscope.models.task import Task, SubTask
+from taskscope.repositories.task_repo import TaskRepo
+
+
+def seed(engine, tasks: int, subtasks: int) -> None:
+    now = datetime.now()
+    task_rows = [
+        dict(id=i + 1, title=f"Görev {i}", description="açıklama " * 5, status="todo", priority="Orta",
+             tags="iş", project="Genel", due_at=now + timedelta(hours=i % 500) if i % 3 else None,
+             is_done=i % 4 == 0, created_at=now - timedelta(minutes=i), updated_at=now)
+        for i in range(tasks)
+    ]
+    sub_rows = [
+        dict(task_id=t + 1, title=f"adım {j}", is_done=j % 2 == 0)
+        for t in range(tasks) for j in range(subtasks)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Task), task_rows)
+        if sub_rows:
+            conn.execute(insert(SubTask), sub_rows)
+
+
+def measure(label: str, fn, repeat: int) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"label": label, "rows": len(result), "best_ms": best * 1000, "peak_mb": peak / 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--subtasks", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite+pysqlite:///{Path(tmp) / 'bench.db'}")
+        init_db(engine)
+        seed(engine, args.tasks, args.subtasks)
+        Session = sessionmaker(bind=engine, autoflush=False, future=True)
+
+        def joined():
+            # Eski yol: lazy="joined" -> LEFT OUTER JOIN kartezyen + unique()
+            with Session() as s:
+                stmt = select(Task).options(joinedload(Task.subtasks)).order_by(
+                    Task.is_done.asc(), Task.due_at.is_(None).asc(), Task.created_at.desc())
+                return list(s.execute(stmt).unique().scalars().all())
+
+        def orm_selectin():
+            with Session() as s:
+                return TaskRepo(s).list_tasks()
+
+        def rows():
+            with Session() as s:
+                return TaskRepo(s).list_task_rows()
+
+        results = [measure("ORM joined (eski)", joined, args.repeat),
+                   measure("ORM selectinload", orm_selectin, args.repeat),
+                   measure("TaskRow projeksiyon", rows, args.repeat)]
+        engine.dispose()
+
+    print(f"{args.tasks} görev x {args.subtasks} alt görev")
+    print(f"{'yol':<22}{'satır':>8}{'süre (ms)':>12}{'tepe bellek (MB)':>18}")
+    for r in results:
+        print(f"{r['label']:<22}{r['rows']:>8}{r['best_ms']:>12.1f}{r['peak_mb']:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Depolama profillerine göre "tıklama başına commit" yazma gecikmesi.
+
+TaskRepo her işlemde kendi commit'ini yapar (set_done, set_subtask_done...).
+Bu betik her profil için geçici bir veritabanı kurar ve tek tek set_done
+çağrılarının süresini ölçer:
+
+    python -m benchmarks.bench_storage_profiles --tasks 2000 --clicks 300
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from taskscope.db.database import init_db
+from taskscope.db.storage import PROFILES, install_storage_profile
+from taskscope.models.task import Task
+from taskscope.repositories.task_repo import TaskRepo
+
+
+def bench_profile(name: str, db_path: Path, tasks: int, clicks: int) -> dict:
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", connect_args={"check_same_thread": False})
+    install_storage_profile(engine, PROFILES[name])
+    init_db(engine)
+    session = sessionmaker(bind=engine, autoflush=False, future=True)()
+    repo = TaskRepo(session)
+    ids = [repo.create_task(f"Görev {i}", "", None).id for i in range(min(tasks, clicks))]
+    if tasks > len(ids):
+        # Geri kalan görevler tek işlemde; ölçülen kısım değil
+        session.add_all(Task(title=f"Dolgu {i}", description="") for i in range(tasks - len(ids)))
+        session.commit()
+
+    samples = []
+    for n in range(clicks):
+        task_id = ids[n % len(ids)]
+        t0 = time.perf_counter()
+        repo.set_done(task_id, n % 2 == 0)
+        samples.append((time.perf_counter() - t0) * 1000)
+    session.close()
+    engine.dispose()
+
+    samples.sort()
+    return {
+        "profile": name,
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "max_ms": samples[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--clicks", type=int, default=300)
+    parser.add_argument("--dir", help="veritabanlarının oluşturulacağı klasör (disk türü önemli)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = [bench_profile(name, Path(tmp) / f"{name}.db", args.tasks, args.clicks) for name in PROFILES]
+
+    print(f"{'profil':<10}{'ort.':>10}{'p50':>10}{'p95':>10}{'maks':>10}   (ms / commit)")
+    for r in results:
+        print(f"{r['profile']:<10}{r['mean_ms']:>10.3f}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['max_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
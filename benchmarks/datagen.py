@@ -0,0 +1,129 @@
+"""Gerçekçi sentetik TaskScope veritabanı üretici.
+
+Alt görev sayısı, bitiş tarihi dağılımı, etiketler, projeler ve açıklama
+uzunlukları değişkendir; aynı tohumla her zaman aynı veri üretilir:
+
+    python -m benchmarks.datagen --tasks 100000 --out /tmp/taskscope-100k.db
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from taskscope.db.database import Base, init_db
+from taskscope.models.task import Task, SubTask, RANK_STEP
+
+WORDS = (
+    "rapor toplantı müşteri sunum bütçe tasarım test hata sürüm dokümantasyon analiz "
+    "planlama sözleşme fatura teklif kod inceleme veritabanı sunucu yedek güvenlik "
+    "arayüz kullanıcı geri bildirim pazarlama kampanya içerik blog eğitim ekip hedef "
+    "performans ölçüm entegrasyon api mobil web tasarımı yayın takvim onay revizyon"
+).split()
+TAGS = ("iş", "acil", "kişisel", "okul", "ev", "sağlık", "alışveriş", "finans", "proje", "araştırma")
+PROJECTS = ("Genel", "Genel", "Genel", "Web Sitesi", "Mobil Uygulama", "Pazarlama", "Finans", "İK",
+            "Altyapı", "Müşteri A", "Müşteri B", "Tez", "Ev Tadilatı")
+PRIORITIES = ("Yüksek", "Orta", "Orta", "Düşük")
+REMINDERS = ("15,0", "15,0", "60,15,0", "1440,60,0", "0")
+CHUNK = 20_000
+
+
+def _sentence(rng: random.Random, lo: int, hi: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+def _due(rng: random.Random, now: datetime) -> datetime | None:
+    r = rng.random()
+    if r < 0.25:
+        return None                                                   # tarihsiz
+    if r < 0.35:
+        return now - timedelta(minutes=rng.randint(1, 30 * 24 * 60))  # gecikmiş
+    if r < 0.45:
+        return now + timedelta(minutes=rng.randint(1, 12 * 60))       # bugün
+    if r < 0.65:
+        return now + timedelta(days=rng.uniform(1, 7))                # bu hafta
+    return now + timedelta(days=rng.uniform(7, 180))                  # ileri tarih
+
+
+def _subtask_count(rng: random.Random) -> int:
+    # Çoğu görevde birkaç alt görev, az sayıda görevde çok
+    r = rng.random()
+    if r < 0.35:
+        return 0
+    if r < 0.85:
+        return rng.randint(1, 4)
+    return rng.randint(5, 15)
+
+
+def generate(engine: Engine, tasks: int, seed: int = 42, now: datetime | None = None) -> dict:
+    """Boş bir veritabanını doldurur; (görev, alt görev) sayılarını döner.
+
+    Tablolar FTS tetikleyicileri olmadan doldurulur, arama indeksi en sonda
+    init_db içinde tek seferde kurulur.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    Base.metadata.create_all(bind=engine)
+    ranks: dict[str, float] = {}
+    subtask_total = 0
+    next_id = 1
+    with engine.begin() as conn:
+        while next_id <= tasks:
+            task_rows, sub_rows = [], []
+            for task_id in range(next_id, min(next_id + CHUNK, tasks + 1)):
+                is_done = rng.random() < 0.3
+                status = "done" if is_done else ("in_progress" if rng.random() < 0.3 else "todo")
+                ranks[status] = ranks.get(status, 0.0) + RANK_STEP
+                created = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+                tags = ", ".join(rng.sample(TAGS, rng.choice((0, 1, 1, 2, 3))))
+                task_rows.append(dict(
+                    id=task_id, title=_sentence(rng, 2, 6).capitalize(),
+                    description=_sentence(rng, 0, 60), status=status,
+                    priority=rng.choice(PRIORITIES), tags=tags, project=rng.choice(PROJECTS),
+                    due_at=_due(rng, now), is_done=is_done, reminders=rng.choice(REMINDERS),
+                    sort_rank=ranks[status], created_at=created,
+                    updated_at=created + timedelta(minutes=rng.randint(0, 10_000)),
+                ))
+                for j in range(_subtask_count(rng)):
+                    sub_rows.append(dict(task_id=task_id, title=_sentence(rng, 1, 4),
+                                         is_done=is_done or rng.random() < 0.4))
+            conn.execute(insert(Task), task_rows)
+            if sub_rows:
+                conn.execute(insert(SubTask), sub_rows)
+            subtask_total += len(sub_rows)
+            next_id += CHUNK
+    init_db(engine)
+    return {"tasks": tasks, "subtasks": subtask_total}
+
+
+def generate_file(path: Path, tasks: int, seed: int = 42) -> dict:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    engine = create_engine(f"sqlite+pysqlite:///{path}")
+    try:
+        return generate(engine, tasks, seed)
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    counts = generate_file(args.out, args.tasks, args.seed)
+    print(f"{counts['tasks']} görev, {counts['subtasks']} alt görev -> {args.out} "
+          f"({time.perf_counter() - t0:.1f} sn)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Depo sorgularının EXPLAIN QUERY PLAN regresyon kontrolü.
+
+Her senaryo TaskRepo üzerinden gerçek sorguları çalıştırır; çalışan tüm
+SELECT/UPDATE/DELETE ifadeleri yakalanıp planları incelenir. Tam tablo
+taraması ya da izin verilmemiş geçici B-tree sıralaması bulunursa, ya da
+senaryosu olmayan bir public TaskRepo metodu varsa hata listelenir ve komut
+sıfırdan farklı kodla çıkar:
+
+    python -m benchmarks.query_plans
+"""
+from __future__ import annotations
+
+import inspect
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from taskscope.db.database import init_db
+from taskscope.repositories.task_repo import TaskRepo
+
+
+@dataclass
+class Scenario:
+    label: str
+    run: Callable[[TaskRepo], object]
+    # Sınırlı bir kümeyi (tarih aralığı, FTS eşleşmesi) sıralayan sorgular için
+    allow_temp_sort: bool = False
+    # Seçici sorgularda indeks üzerinden bile olsa tarama (SCAN) kabul edilmez
+    selective: bool = False
+    # Bilerek tüm tabloyu okuyan sorgular (dışa aktarma)
+    full_scan: bool = False
+
+
+@dataclass
+class PlanIssue:
+    label: str
+    sql: str
+    detail: str
+
+    def __str__(self) -> str:
+        return f"[{self.label}] {self.detail}\n    {' '.join(self.sql.split())[:300]}"
+
+
+# Tekrar senaryolarının oluşturduğu serinin id'si
+_series: list[int] = []
+
+
+def _apply_remote_update(repo: TaskRepo) -> None:
+    # Var olan göreve alt görev listesi ve tekrar kuralı (seri yeniden kurulur)
+    at = "9999-01-02 00:00:00.000"
+    task = repo.get_task(11)
+    repo.apply_changes([
+        [task.uid, "subtasks", [["x", 1], ["y", 0]], at, "uzak"],
+        [task.uid, "due_at", (datetime.now() + timedelta(hours=2)).isoformat(), at, "uzak"],
+        [task.uid, "recurrence", "FREQ=DAILY", at, "uzak"],
+    ])
+
+
+def _apply_remote(repo: TaskRepo) -> None:
+    # Başka cihazdan: yeni görev, alan değişikliği ve silme
+    at = "9999-01-01 00:00:00.000"
+    repo.apply_changes([
+        ["uzak-1", "*", {"title": "Uzak görev", "status": "todo", "tags": "iş", "subtasks": [["a", 0]]}, at, "uzak"],
+        [repo.get_task(5).uid, "title", "Uzakta değişti", at, "uzak"],
+        [repo.get_task(6).uid, "-", None, at, "uzak"],
+    ])
+
+
+def _walk_pages(repo: TaskRepo, mode: str, **kw) -> None:
+    # Küçük sayfalarla tüm grupları ve imleçli devam sorgularını dolaş
+    for _ in repo.iter_task_pages("", mode, page_size=3, **kw):
+        pass
+
+
+def _list_scenarios() -> list[Scenario]:
+    out = []
+    for mode in ("all", "today", "week", "done", "undone"):
+        bounded = mode in ("today", "week")
+        out.append(Scenario(f"list_tasks({mode})", lambda r, m=mode: r.list_tasks("", m),
+                            allow_temp_sort=bounded, selective=bounded))
+        out.append(Scenario(f"list_tasks({mode}, search)", lambda r, m=mode: r.list_tasks("gör", m),
+                            allow_temp_sort=True))
+        out.append(Scenario(f"list_tasks({mode}, search, rank)", lambda r, m=mode: r.list_tasks("gör", m, "rank"),
+                            allow_temp_sort=True))
+        out.append(Scenario(f"list_task_rows({mode})", lambda r, m=mode: r.list_task_rows("", m),
+                            allow_temp_sort=bounded, selective=bounded))
+        out.append(Scenario(f"list_task_rows({mode}, search)", lambda r, m=mode: r.list_task_rows("gör", m),
+                            allow_temp_sort=True))
+        out.append(Scenario(f"list_task_page({mode})", lambda r, m=mode: _walk_pages(r, m),
+                            allow_temp_sort=bounded, selective=True))
+        out.append(Scenario(f"list_task_page({mode}, todo)", lambda r, m=mode: _walk_pages(r, m, status="todo"),
+                            allow_temp_sort=bounded, selective=True))
+    return out
+
+
+SCENARIOS: list[Scenario] = _list_scenarios() + [
+    Scenario("list_task_page(board, todo)", lambda r: _walk_pages(r, "all", order="board", status="todo"),
+             selective=True),
+    Scenario("list_task_page(board, done)", lambda r: _walk_pages(r, "done", order="board", status="done"),
+             selective=True),
+    Scenario("list_task_page(rank)", lambda r: r.list_task_page("gör", order="rank", limit=3), allow_temp_sort=True),
+    # VE eşleşmesi eşleşen ilişki satırlarını task_id'ye göre gruplar (sınırlı küme)
+    Scenario("list_task_page(tags, all)", lambda r: _walk_pages(r, "all", tags=["iş", "acil"]),
+             allow_temp_sort=True, selective=True),
+    Scenario("list_task_page(tags, any)", lambda r: _walk_pages(r, "all", tags=["iş", "acil"], match_all=False),
+             selective=True),
+    Scenario("list_task_page(project)", lambda r: _walk_pages(r, "all", project="Web"), selective=True),
+    Scenario("list_task_page(undone, project)", lambda r: _walk_pages(r, "undone", project="Web"), selective=True),
+    Scenario("count_tasks(project)", lambda r: r.count_tasks("", "all", project="Web"), selective=True),
+    Scenario("get_projects", lambda r: r.get_projects()),
+    Scenario("project_counts", lambda r: r.project_counts()),
+    Scenario("count_tasks(tags)", lambda r: r.count_tasks("", "all", tags=["acil"])),
+    Scenario("tag_counts", lambda r: r.tag_counts()),
+    Scenario("tag_counts(week, tags)", lambda r: r.tag_counts("", "week", ["iş"]), allow_temp_sort=True),
+    Scenario("count_tasks", lambda r: r.count_tasks()),
+    Scenario("count_tasks(week)", lambda r: r.count_tasks("", "week"), selective=True),
+    Scenario("task_stats", lambda r: r.task_stats()),
+    Scenario("count_overdue", lambda r: r.count_overdue(), selective=True),
+    Scenario("get_task", lambda r: r.get_task(1), selective=True),
+    Scenario("get_task_row", lambda r: r.get_task_row(1), selective=True),
+    Scenario("get_task_rows", lambda r: r.get_task_rows([1, 2, 3]), selective=True),
+    Scenario("iter_task_pages", lambda r: list(r.iter_task_pages("", "undone", page_size=3))),
+    Scenario("count_by_status", lambda r: r.count_by_status()),
+    Scenario("count_by_project", lambda r: r.count_by_project()),
+    Scenario("list_subtasks", lambda r: r.list_subtasks(1), allow_temp_sort=True, selective=True),
+    Scenario("list_reminder_window",
+             lambda r: r.list_reminder_window(datetime.now() - timedelta(hours=1), datetime.now() + timedelta(days=1)),
+             selective=True),
+    Scenario("update_task", lambda r: r.update_task(1, "Görev", "", None, "Orta", ""), selective=True),
+    Scenario("update_status", lambda r: r.update_status(1, "in_progress"), selective=True),
+    Scenario("set_done", lambda r: r.set_done(1, True), selective=True),
+    Scenario("move_task", lambda r: r.move_task(3, "in_progress", None), selective=True),
+    Scenario("move_task(after)", lambda r: r.move_task(4, "in_progress", 3), selective=True),
+    Scenario("rebalance_ranks", lambda r: r.rebalance_ranks("todo")),
+    Scenario("set_subtask_done", lambda r: r.set_subtask_done(1, True), selective=True),
+    # Alt görev listesi günlüğe id sırasıyla yazılır (tek görevin alt görevleri sıralanır)
+    Scenario("create_task", lambda r: r.create_task("Yeni görev", "", None, subtasks=["a"]), allow_temp_sort=True,
+             selective=True),
+    Scenario("delete_task", lambda r: r.delete_task(2), selective=True),
+    # Tekrarlayan seri: oluşturma yakın örnekleri de ekler; kural değişince yeniden kurulur
+    Scenario("create_task(recurrence)", lambda r: _series.append(
+        r.create_task("Standup", "", datetime.now() + timedelta(hours=1), recurrence="FREQ=DAILY").id
+    ), selective=True),
+    Scenario("materialize_occurrences", lambda r: r.materialize_occurrences(datetime.now() + timedelta(days=12)),
+             selective=True),
+    Scenario("update_task(series)", lambda r: r.update_task(
+        _series[-1], "Standup", "a", r.get_task(_series[-1]).due_at, "Orta", "iş"
+    ), selective=True),
+    Scenario("update_task(recurrence)", lambda r: r.update_task(
+        _series[-1], "Standup", "", r.get_task(_series[-1]).due_at, "Orta", "", recurrence="FREQ=WEEKLY"
+    ), selective=True),
+    Scenario("delete_task(series)", lambda r: r.delete_task(_series[-1]), selective=True),
+    # Toplu işlemler: id listeleri parça parça IN (...) ile
+    Scenario("bulk_create", lambda r: r.bulk_create([{"title": "Toplu", "tags": "iş", "subtasks": ["a"]},
+                                                     {"title": "Toplu 2"}]),
+             allow_temp_sort=True, selective=True),
+    Scenario("bulk_set_status", lambda r: r.bulk_set_status([7, 8], "in_progress"), selective=True),
+    Scenario("bulk_set_due", lambda r: r.bulk_set_due([7, 8], datetime.now() + timedelta(days=1)), selective=True),
+    Scenario("bulk_retag", lambda r: r.bulk_retag([7, 8], add=["yeni"], remove=["acil"]), selective=True),
+    Scenario("bulk_delete", lambda r: r.bulk_delete([9, 10]), selective=True),
+    Scenario("import_tasks", lambda r: r.import_tasks([
+        {"title": "İçe aktarılan", "tags": "iş, yeni", "subtasks": ["a", ("b", True)]},
+        {"title": "İçe aktarılan 2", "status": "done"},
+    ]), allow_temp_sort=True, selective=True),
+    # Görevler rowid sırasıyla baştan sona okunur; alt görevler id aralığıyla
+    Scenario("export_chunks", lambda r: list(r.export_chunks(5)), allow_temp_sort=True, full_scan=True),
+    # Eşitleme: günlük imleçle okunur, uygulama uid ile eşleşir
+    Scenario("changes_since", lambda r: r.changes_since(10, 50, exclude_origin="uzak"), selective=True),
+    Scenario("apply_changes", _apply_remote, allow_temp_sort=True, selective=True),
+    Scenario("apply_changes(subtasks, recurrence)", _apply_remote_update, allow_temp_sort=True, selective=True),
+    Scenario("sync_device", lambda r: r.sync_device(), selective=True),
+    Scenario("sync_cursors", lambda r: r.sync_cursors("http://x"), selective=True),
+    Scenario("set_sync_cursors", lambda r: r.set_sync_cursors("http://x", pull=1, push=2), selective=True),
+    # Arşiv senaryoları en sonda: set_done ile biten görevler arşive gidip geri gelir
+    Scenario("archive_done", lambda r: r.archive_done(datetime.utcnow() + timedelta(minutes=1))),
+    Scenario("list_archived", lambda r: r.list_archived(limit=3)),
+    Scenario("list_archived(search)", lambda r: r.list_archived("gör"), allow_temp_sort=True),
+    Scenario("count_archived(search)", lambda r: r.count_archived("gör")),
+    Scenario("restore_tasks", lambda r: r.restore_tasks([a.id for a in r.list_archived()])),
+]
+
+# Sorgu senaryosu gerekmeyen metotlar (dinleyiciler, transaction sarmalayıcısı)
+_NOT_QUERIES = {"subscribe", "unsubscribe", "transaction"}
+
+_CHECKED = ("SELECT", "UPDATE", "DELETE", "WITH")
+_BARE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+_INDEX_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)? USING (?:COVERING )?INDEX")
+
+
+def make_engine() -> Engine:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    init_db(engine)
+    return engine
+
+
+def _seed(repo: TaskRepo) -> None:
+    now = datetime.now()
+    for i in range(20):
+        due = now + timedelta(hours=i - 5) if i % 3 else None
+        repo.create_task(f"Görev {i}", "açıklama", due, tags="iş, acil" if i % 2 else "iş", subtasks=[f"adım {i}"],
+                         project="Web" if i % 3 else "Genel")
+
+
+def analyze(engine: Engine, scenarios: list[Scenario] = SCENARIOS) -> list[PlanIssue]:
+    session_factory = sessionmaker(bind=engine, autoflush=False, future=True)
+    _seed(TaskRepo(session_factory()))
+
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(_CHECKED):
+            captured.append((statement, parameters))
+
+    issues: list[PlanIssue] = []
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        for sc in scenarios:
+            captured.clear()
+            session = session_factory()
+            try:
+                sc.run(TaskRepo(session))
+            finally:
+                session.close()
+            for sql, params in list(captured):
+                issues.extend(_check_plan(engine, sc, sql, params))
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return issues
+
+
+def _check_plan(engine: Engine, sc: Scenario, sql: str, params) -> list[PlanIssue]:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params).all()
+    issues = []
+    for row in rows:
+        detail = row[3]
+        if _BARE_SCAN.match(detail) and "VIRTUAL TABLE" not in detail and not sc.full_scan:
+            issues.append(PlanIssue(sc.label, sql, f"tam tablo taraması: {detail}"))
+        elif "AUTOMATIC" in detail:
+            # Eksik indeks yüzünden her sorguda tablo taranıp geçici indeks kuruluyor
+            issues.append(PlanIssue(sc.label, sql, f"otomatik indeks: {detail}"))
+        elif sc.selective and _INDEX_SCAN.match(detail):
+            issues.append(PlanIssue(sc.label, sql, f"seçici sorguda indeks taraması: {detail}"))
+        elif "USE TEMP B-TREE" in detail and not sc.allow_temp_sort:
+            issues.append(PlanIssue(sc.label, sql, f"geçici sıralama: {detail}"))
+    return issues
+
+
+def uncovered(scenarios: list[Scenario] = SCENARIOS) -> list[str]:
+    """Senaryosu olmayan public TaskRepo metotları (etiketin parantezden önceki kısmı metot adıdır)"""
+    covered = {sc.label.split("(")[0] for sc in scenarios}
+    public = {name for name, _ in inspect.getmembers(TaskRepo, callable) if not name.startswith("_")}
+    return sorted(public - covered - _NOT_QUERIES)
+
+
+def main() -> int:
+    issues = analyze(make_engine())
+    for issue in issues:
+        print(f"❌ {issue}")
+    missing = uncovered()
+    for name in missing:
+        print(f"❌ [{name}] senaryosu yok")
+    if issues or missing:
+        print(f"{len(issues)} plan sorunu, {len(missing)} senaryosuz metot bulundu.")
+        return 1
+    print(f"✅ {len(SCENARIOS)} senaryonun sorgu planları temiz.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Depo ve veri katmanı kıyaslama paketi (ekransız çalışır).
+
+Her boyut için sentetik bir veritabanı üretilir (benchmarks.datagen, önbelleğe
+alınır) ve şunlar ölçülür: her filter_mode için list_tasks (aramalı ve
+aramasız), create_task, set_done, update_status ve bir
+NotificationWorker.check_deadlines taraması. Sonuçlar JSON olarak yazılır;
+kayıtlı bir temel ölçümle karşılaştırılıp eşiği aşan yavaşlamalar işaretlenir:
+
+    python -m benchmarks.suite --sizes 1k,10k --out sonuc.json
+    python -m benchmarks.suite --sizes 1k,10k --baseline temel.json --threshold 1.25
+    python -m benchmarks.suite --sizes 1k,10k --out temel.json   # yeni temel
+
+Temel ölçümle karşılaştırmada yavaşlama bulunursa çıkış kodu 1'dir.
+"""
+from __future__ import annotations
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import gc
+import json
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import generate_file
+from taskscope.db.database import init_db
+from taskscope.models.task import Task
+from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.notification_service import NotificationWorker
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+FILTER_MODES = ("all", "today", "week", "done", "undone")
+SEARCH_TEXT = "rapor"
+# Bu kadar milisaniyenin altındaki farklar gürültü sayılır
+NOISE_MS = 0.5
+
+
+class _SilentWorker(NotificationWorker):
+    """Bildirim göstermeden sayan işçi (iş parçacığı başlatılmaz)"""
+
+    def __init__(self, session_factory):
+        super().__init__(session_factory)
+        TaskRepo.unsubscribe(self.on_tasks_changed)
+        self.sent = 0
+
+    def send_notification(self, title, message):
+        self.sent += 1
+
+
+def _timed(fn, repeat: int, per_op: int = 1) -> dict:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000 / per_op)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "runs": repeat}
+
+
+def run_size(label: str, tasks: int, data_dir: Path, repeat: int, seed: int) -> dict:
+    template = data_dir / f"taskscope-{label}-s{seed}.db"
+    if not template.exists():
+        t0 = time.perf_counter()
+        counts = generate_file(template, tasks, seed)
+        print(f"  {label}: {counts['tasks']} görev / {counts['subtasks']} alt görev üretildi "
+              f"({time.perf_counter() - t0:.1f} sn)", file=sys.stderr)
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Yazma senaryoları şablonu değiştirmesin
+        work = Path(tmp) / "work.db"
+        shutil.copy(template, work)
+        engine = create_engine(f"sqlite+pysqlite:///{work}", connect_args={"check_same_thread": False})
+        init_db(engine)
+        Session = sessionmaker(bind=engine, autoflush=False, future=True)
+        # Milyon satırda tam liste yüklemesi dakikalar sürer; tekrar sayısı azaltılır
+        heavy_repeat = repeat if tasks <= 100_000 else 1
+
+        for mode in FILTER_MODES:
+            def list_plain(m=mode):
+                with Session() as s:
+                    TaskRepo(s).list_tasks("", m)
+
+            def list_search(m=mode):
+                with Session() as s:
+                    TaskRepo(s).list_tasks(SEARCH_TEXT, m)
+
+            results[f"list_tasks({mode})"] = _timed(list_plain, heavy_repeat)
+            results[f"list_tasks({mode}, search)"] = _timed(list_search, heavy_repeat)
+
+        rng = random.Random(seed)
+        session = Session()
+        repo = TaskRepo(session)
+        max_id = session.execute(select(func.max(Task.id))).scalar_one()
+        ops = 50
+
+        def create():
+            for i in range(ops):
+                repo.create_task(f"Kıyas görevi {i}", "açıklama", datetime.now() + timedelta(days=1),
+                                 tags="iş", subtasks=["a", "b"])
+
+        def set_done():
+            for _ in range(ops):
+                repo.set_done(rng.randint(1, max_id), rng.random() < 0.5)
+
+        def update_status():
+            for _ in range(ops):
+                repo.update_status(rng.randint(1, max_id), rng.choice(("todo", "in_progress", "done")))
+
+        results["create_task"] = _timed(create, repeat, ops)
+        results["set_done"] = _timed(set_done, repeat, ops)
+        results["update_status"] = _timed(update_status, repeat, ops)
+        session.close()
+
+        worker = _SilentWorker(Session)
+
+        def scan():
+            worker._dirty = True  # her turda pencere yeniden sorgulansın
+            worker.notified_tasks.clear()
+            worker.check_deadlines()
+
+        results["check_deadlines"] = _timed(scan, repeat)
+        engine.dispose()
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Temel ölçüme göre threshold katından fazla yavaşlayanlar"""
+    regressions = []
+    for size, scenarios in current["results"].items():
+        base_size = baseline.get("results", {}).get(size, {})
+        for name, cur in scenarios.items():
+            base = base_size.get(name)
+            if base is None:
+                continue
+            ratio = cur["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf")
+            if ratio > threshold and cur["median_ms"] - base["median_ms"] > NOISE_MS:
+                regressions.append(f"{size} {name}: {base['median_ms']:.2f} -> {cur['median_ms']:.2f} ms "
+                                   f"(x{ratio:.2f})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1k,10k", help=f"virgülle: {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", type=Path, default=Path(tempfile.gettempdir()) / "taskscope-bench",
+                        help="üretilen veritabanlarının önbelleği")
+    parser.add_argument("--out", type=Path, help="sonuç JSON dosyası")
+    parser.add_argument("--baseline", type=Path, help="karşılaştırılacak temel JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="yavaşlama eşiği (oran)")
+    args = parser.parse_args()
+
+    labels = [s.strip().lower() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in labels if s not in SIZES]
+    if unknown:
+        parser.error(f"bilinmeyen boyut: {', '.join(unknown)}")
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for label in labels:
+        print(f"▶ {label}", file=sys.stderr)
+        report["results"][label] = run_size(label, SIZES[label], args.data_dir, args.repeat, args.seed)
+
+    for label, scenarios in report["results"].items():
+        print(f"\n{label}")
+        print(f"{'senaryo':<30}{'medyan (ms)':>14}{'en iyi (ms)':>14}")
+        for name, r in scenarios.items():
+            print(f"{name:<30}{r['median_ms']:>14.2f}{r['min_ms']:>14.2f}")
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nSonuçlar: {args.out}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} yavaşlama (eşik x{args.threshold}):")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"\n✅ Temel ölçüme göre yavaşlama yok (eşik x{args.threshold})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Write-behind tutarlılığı: BackgroundWriter'ın commit ettiği düzenleme GUI oturumunda görünüyor mu?
+
+MainWindow.edit_task akışı taklit edilir: GUI oturumu görevi (ve alt görevlerini) bir kez
+okur, düzenleme ve alt görev işareti yazıcıya gönderilir, writer.flush() sonrası aynı
+oturumdan get_task ile tekrar okunur. Eski değerler görülürse (kimlik haritasında kalmış
+nesne) komut sıfırdan farklı kodla çıkar:
+
+    python -m benchmarks.writer_consistency
+"""
+from __future__ import annotations
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+import tempfile
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from taskscope.db.database import init_db
+from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.background_writer import BackgroundWriter
+
+
+def check(path: Path) -> list[str]:
+    engine = create_engine(f"sqlite+pysqlite:///{path}", connect_args={"check_same_thread": False})
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, future=True)
+    gui = session_factory()
+    repo = TaskRepo(gui)
+    writer = BackgroundWriter(session_factory)
+    problems = []
+    try:
+        task = repo.create_task("Eski başlık", "eski", None, subtasks=["adım"])
+        gui.commit()
+        task_id, subtask_id = task.id, task.subtasks[0].id
+
+        # İlk düzenleyici açılışı: nesne GUI oturumunun kimlik haritasına girer
+        t = repo.get_task(task_id)
+        writer.submit("update_task", task_id, "Yeni başlık", "yeni", t.due_at, t.priority, t.tags,
+                      t.reminders, t.project, t.recurrence, key=("edit", task_id))
+        writer.submit("set_subtask_done", subtask_id, True, key=("subtask", subtask_id))
+        writer.flush()
+
+        # İkinci açılış: edit_task ile aynı yol
+        t = repo.get_task(task_id)
+        if (t.title, t.description) != ("Yeni başlık", "yeni"):
+            problems.append(f"görev eski değerlerle okundu: {t.title!r}, {t.description!r}")
+        if not t.subtasks[0].is_done:
+            problems.append("alt görev eski değerle okundu: is_done=False")
+    finally:
+        writer.stop()
+        gui.close()
+        engine.dispose()
+    return problems
+
+
+def main() -> int:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        problems = check(Path(tmp) / "writer.db")
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        return 1
+    print("✅ Yazıcının commit ettiği düzenleme bir sonraki açılışta görünüyor.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
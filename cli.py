@@ -0,0 +1,325 @@
+"""TaskScope komut satırı: arayüz olmadan toplu içe / dışa aktarma.
+
+JSONL ve CSV iki yönde de akışla işlenir; bellek kullanımı dosya boyutundan
+bağımsızdır:
+
+    python cli.py import gorevler.jsonl
+    python cli.py import eski_arac.csv --chunk 10000
+    python cli.py export yedek.jsonl
+    python cli.py export - --format csv > gorevler.csv
+    python cli.py archive --days 180
+    python cli.py sync http://127.0.0.1:8765
+
+Alanlar: title (zorunlu), description, status, priority, tags, project, due_at,
+reminders, is_done, created_at, updated_at, subtasks. Tarihler ISO 8601'dir.
+JSONL'de subtasks ["başlık", ...] ya da [{"title": ..., "is_done": ...}, ...];
+CSV'de "[x] biten | [ ] açık" biçiminde tek sütundur.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from taskscope.db.storage import PROFILES, choose_profile, install_storage_profile
+
+FIELDS = ("id", "title", "description", "status", "priority", "tags", "project", "due_at",
+          "reminders", "is_done", "created_at", "updated_at", "subtasks")
+STATUSES = ("todo", "in_progress", "done")
+DEFAULT_CHUNK = 5000
+# CSV alt görev sütunu: "[x] biten | [ ] açık"
+SUBTASK_SEP = " | "
+
+
+class RecordError(ValueError):
+    pass
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="veritabanı dosyası (varsayılan: uygulamanınki)")
+    parser.add_argument("--storage-profile", choices=sorted(PROFILES),
+                        help="SQLite depolama profili (varsayılan: balanced veya TASKSCOPE_STORAGE_PROFILE)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="JSONL/CSV dosyasından görev ekle")
+    imp.add_argument("path", help="kaynak dosya ('-' = stdin)")
+    imp.add_argument("--format", choices=("jsonl", "csv"), help="varsayılan: dosya uzantısı")
+    imp.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="transaction başına görev")
+    imp.add_argument("--strict", action="store_true", help="hatalı satırda dur (varsayılan: atla)")
+
+    exp = sub.add_parser("export", help="tüm görevleri JSONL/CSV olarak yaz")
+    exp.add_argument("path", help="hedef dosya ('-' = stdout)")
+    exp.add_argument("--format", choices=("jsonl", "csv"), help="varsayılan: dosya uzantısı")
+    exp.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="okuma parçası")
+
+    arc = sub.add_parser("archive", help="eski bitmiş görevleri arşive taşı")
+    arc.add_argument("--days", type=int, help="bu kadar gün önce bitenler (varsayılan: TASKSCOPE_ARCHIVE_DAYS veya 90)")
+
+    syn = sub.add_parser("sync", help="eşitleme sunucusuyla değişiklikleri gönder / çek")
+    syn.add_argument("url", help="sunucu adresi (python -m taskscope.services.sync_server)")
+    syn.add_argument("--batch", type=int, default=1000, help="istek başına günlük satırı")
+    return parser.parse_args(argv)
+
+
+def _format(path: str, fmt: str | None) -> str:
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _open_session(db: Path | None, profile_name: str | None):
+    from taskscope.db.database import init_db
+    if db is None:
+        from taskscope.db.database import ENGINE as engine
+        if profile_name:
+            install_storage_profile(engine, choose_profile(profile_name))
+    else:
+        engine = create_engine(f"sqlite+pysqlite:///{db}", future=True)
+        install_storage_profile(engine, choose_profile(profile_name))
+    init_db(engine)
+    return sessionmaker(bind=engine, autoflush=False, future=True)()
+
+
+# --- Kayıt dönüşümleri ---
+def _parse_dt(value) -> datetime | None:
+    if value in (None, ""):
+        return None
+    try:
+        return datetime.fromisoformat(str(value).strip().replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        raise RecordError(f"geçersiz tarih: {value!r}")
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "evet", "yes", "x")
+
+
+def _parse_subtasks(value) -> list[tuple[str, bool]]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        out = []
+        for part in value.split(SUBTASK_SEP.strip()):
+            part = part.strip()
+            done = part[:3].lower() == "[x]"
+            if part[:3].lower() in ("[x]", "[ ]"):
+                part = part[3:].strip()
+            if part:
+                out.append((part, done))
+        return out
+    out = []
+    for st in value:
+        if isinstance(st, str):
+            out.append((st, False))
+        elif isinstance(st, dict):
+            out.append((str(st.get("title", "")), _parse_bool(st.get("is_done", False))))
+        else:
+            out.append((str(st[0]), _parse_bool(st[1])))
+    return out
+
+
+def to_record(raw: dict) -> dict:
+    """Dosyadan okunan ham satırı TaskRepo.import_tasks kaydına çevirir"""
+    title = (raw.get("title") or "").strip()
+    if not title:
+        raise RecordError("title boş")
+    status = (raw.get("status") or "").strip() or None
+    if status is not None and status not in STATUSES:
+        raise RecordError(f"bilinmeyen status: {status!r}")
+    rec = {
+        "title": title[:200],
+        "description": raw.get("description") or "",
+        "status": status,
+        "priority": raw.get("priority") or None,
+        "tags": raw.get("tags") if isinstance(raw.get("tags"), str) else ", ".join(raw.get("tags") or ()),
+        "project": raw.get("project") or None,
+        "due_at": _parse_dt(raw.get("due_at")),
+        "reminders": raw.get("reminders") if raw.get("reminders") not in (None, "") else None,
+        "created_at": _parse_dt(raw.get("created_at")),
+        "updated_at": _parse_dt(raw.get("updated_at")),
+        "subtasks": _parse_subtasks(raw.get("subtasks")),
+    }
+    if raw.get("is_done") not in (None, ""):
+        rec["is_done"] = _parse_bool(raw["is_done"])
+    return rec
+
+
+def _dt_out(value: datetime | None) -> str | None:
+    return value.isoformat(timespec="seconds") if value else None
+
+
+def _iter_raw(stream, fmt: str):
+    """(satır_no, ham_dict) üretir; dosya satır satır okunur"""
+    if fmt == "csv":
+        for n, row in enumerate(csv.DictReader(stream), start=2):
+            yield n, row
+        return
+    for n, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield n, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield n, RecordError(f"geçersiz JSON: {e.msg}")
+
+
+class _Progress:
+    def __init__(self, label: str):
+        self.label = label
+        self.t0 = time.perf_counter()
+        self.count = 0
+
+    def add(self, n: int) -> None:
+        self.count += n
+        elapsed = time.perf_counter() - self.t0
+        rate = self.count / elapsed if elapsed else 0
+        print(f"\r  {self.count:>10,} {self.label} ({rate:,.0f}/sn)", end="", file=sys.stderr, flush=True)
+
+    def done(self) -> float:
+        print(file=sys.stderr)
+        return time.perf_counter() - self.t0
+
+
+# --- Komutlar ---
+def cmd_import(args) -> int:
+    from taskscope.repositories.task_repo import TaskRepo
+    fmt = _format(args.path, args.format)
+    session = _open_session(args.db, args.storage_profile)
+    repo = TaskRepo(session)
+    progress = _Progress("görev içe aktarıldı")
+    skipped: list[str] = []
+    stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    try:
+        chunk: list[dict] = []
+        for n, raw in _iter_raw(stream, fmt):
+            try:
+                if isinstance(raw, RecordError):
+                    raise raw
+                chunk.append(to_record(raw))
+            except RecordError as e:
+                if args.strict:
+                    print(f"\n❌ Satır {n}: {e}", file=sys.stderr)
+                    return 1
+                skipped.append(f"satır {n}: {e}")
+                continue
+            if len(chunk) >= args.chunk:
+                progress.add(len(repo.import_tasks(chunk)))
+                chunk = []
+        if chunk:
+            progress.add(len(repo.import_tasks(chunk)))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        session.close()
+    seconds = progress.done()
+    print(f"✅ {progress.count} görev {seconds:.1f} sn'de içe aktarıldı.", file=sys.stderr)
+    if skipped:
+        print(f"⚠️ {len(skipped)} satır atlandı:", file=sys.stderr)
+        for line in skipped[:10]:
+            print(f"   {line}", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args) -> int:
+    from taskscope.repositories.task_repo import TaskRepo
+    fmt = _format(args.path, args.format)
+    session = _open_session(args.db, args.storage_profile)
+    repo = TaskRepo(session)
+    progress = _Progress("görev dışa aktarıldı")
+    out = sys.stdout if args.path == "-" else open(args.path, "w", encoding="utf-8", newline="")
+    try:
+        writer = csv.DictWriter(out, FIELDS) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+        for records in repo.export_chunks(args.chunk):
+            buf = io.StringIO() if writer is None else None
+            for rec in records:
+                for key in ("due_at", "created_at", "updated_at"):
+                    rec[key] = _dt_out(rec[key])
+                if writer:
+                    rec["subtasks"] = SUBTASK_SEP.join(
+                        f"[{'x' if done else ' '}] {title}" for title, done in rec["subtasks"]
+                    )
+                    rec["is_done"] = int(rec["is_done"])
+                    writer.writerow(rec)
+                else:
+                    rec["subtasks"] = [{"title": title, "is_done": bool(done)} for title, done in rec["subtasks"]]
+                    rec["is_done"] = bool(rec["is_done"])
+                    buf.write(json.dumps(rec, ensure_ascii=False))
+                    buf.write("\n")
+            if buf is not None:
+                out.write(buf.getvalue())
+            progress.add(len(records))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        session.close()
+    seconds = progress.done()
+    print(f"✅ {progress.count} görev {seconds:.1f} sn'de dışa aktarıldı.", file=sys.stderr)
+    return 0
+
+
+def cmd_archive(args) -> int:
+    from taskscope.repositories.task_repo import TaskRepo
+    from taskscope.services.archive import archive_days, archive_cutoff
+    days = archive_days(None if args.days is None else str(args.days))
+    cutoff = archive_cutoff(days)
+    if cutoff is None:
+        print("Arşivleme kapalı (0 gün).", file=sys.stderr)
+        return 0
+    session = _open_session(args.db, args.storage_profile)
+    try:
+        t0 = time.perf_counter()
+        moved = TaskRepo(session).archive_done(cutoff)
+    finally:
+        session.close()
+    print(f"✅ {days} günden eski {moved} görev {time.perf_counter() - t0:.1f} sn'de arşive taşındı.", file=sys.stderr)
+    return 0
+
+
+def cmd_sync(args) -> int:
+    from taskscope.repositories.task_repo import TaskRepo
+    from taskscope.services.sync import SyncError, sync
+    if args.batch <= 0:
+        print("--batch pozitif olmalı", file=sys.stderr)
+        return 2
+    session = _open_session(args.db, args.storage_profile)
+    try:
+        t0 = time.perf_counter()
+        result = sync(TaskRepo(session), args.url, args.batch)
+    except SyncError as e:
+        print(f"❌ Eşitleme başarısız: {e}", file=sys.stderr)
+        return 1
+    finally:
+        session.close()
+    print(f"✅ {result.pushed} değişiklik gönderildi, {result.pulled} çekildi ({result.applied} uygulandı), "
+          f"{time.perf_counter() - t0:.1f} sn.", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "archive":
+        return cmd_archive(args)
+    if args.command == "sync":
+        return cmd_sync(args)
+    if args.chunk <= 0:
+        print("--chunk pozitif olmalı", file=sys.stderr)
+        return 2
+    return cmd_import(args) if args.command == "import" else cmd_export(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,46 @@
+import time
+_T0 = time.perf_counter()  # --startup-profile: import süreleri de ölçülsün
+
 import sys
 import os
+import argparse
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt, QFile, QTextStream
-from taskscope.db.database import init_db
+from taskscope.db.database import init_db, ENGINE
+from taskscope.db.storage import PROFILES, choose_profile, set_storage_profile, start_checkpointer
+from taskscope.services.startup_profile import StartupProfile
+from taskscope.services import tracing
 from taskscope.ui.main_window import MainWindow
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="TaskScope")
+    parser.add_argument("--storage-profile", choices=sorted(PROFILES),
+                        help="SQLite depolama profili (varsayılan: balanced veya TASKSCOPE_STORAGE_PROFILE)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Açılış aşamalarının sürelerini yazdır")
+    # Qt'nin kendi argümanları (-style vb.) QApplication'a kalsın
+    args, qt_args = parser.parse_known_args()
+    return args, [sys.argv[0]] + qt_args
+
 def main():
+    args, qt_argv = parse_args()
+    profile = StartupProfile(args.startup_profile, _T0)
+    profile.mark("importlar")
+    if args.storage_profile:
+        set_storage_profile(ENGINE, choose_profile(args.storage_profile))
+    # TASKSCOPE_TRACE ayarlıysa depo metotları ve SQL ifadeleri ölçülür (kapalıyken maliyetsiz)
+    tracing.enable_from_env(ENGINE)
+
     # 1. Yüksek Çözünürlük Ayarları
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     
     # 2. Veritabanını Başlat
     init_db()
+    profile.mark("init_db")
 
-    app = QApplication(sys.argv)
+    app = QApplication(qt_argv)
     
     # 3. Font Ayarı (Senin istediğin Segoe UI)
     font = QFont("Segoe UI", 9)
@@ -27,6 +53,9 @@ def main():
     # Eğer theme.qss ana dizinde değilse resources altına bakar
     if not qss_file.exists():
         qss_file = QFile("taskscope/resources/theme.qss")
+    # Kart stilleri de buradan geldiği için başka dizinden çalıştırınca da bulunsun
+    if not qss_file.exists():
+        qss_file = QFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "taskscope", "resources", "theme.qss"))
         
     if qss_file.open(QFile.ReadOnly | QFile.Text):
         stream = QTextStream(qss_file)
@@ -34,11 +63,19 @@ def main():
         print("✅ Tasarım (QSS) başarıyla yüklendi.")
     else:
         print("⚠️ theme.qss bulunamadı! Varsayılan renkler kullanılacak.")
+    profile.mark("QApplication + QSS")
 
-    w = MainWindow()
+    # Pencere önce gösterilir; veri, bildirim servisi ve gizli sayfalar ilk çizimden sonra
+    w = MainWindow(profile)
+    profile.mark("pencere kurulumu")
     w.show()
 
-    sys.exit(app.exec())
+    # WAL dosyasını arka planda küçük tut
+    checkpointer = start_checkpointer(ENGINE)
+    code = app.exec()
+    if checkpointer:
+        checkpointer.stop()
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,149 @@
+"""Eşitleme için değişiklik günlüğü (changes tablosu, models/task.py Change).
+
+Görev tablosundaki tetikleyiciler her yazmayı alan bazında günlüğe ekler; böylece
+TaskRepo'nun ORM, Core ve toplu yolları (cli import dahil) ayrı kod yazmadan kaydedilir.
+Alt görev listesi ise TaskRepo'dan görev başına bir kez yazılır (log_subtasks); satır
+başına tetikleyici her alt görevde tüm listeyi yeniden yazardı.
+
+    *         yeni görev, tüm alanlar tek JSON nesnesinde
+    <alan>    değişen tek alan (title, due_at, subtasks, ...), değer JSON
+    -         silme (tombstone)
+
+sort_rank, updated_at ve materialized_until yereldir, günlüğe girmez. sync_state.muted
+açıkken (arşivleme, uzaktan gelen değişikliklerin uygulanması) tetikleyiciler yazmaz.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+from taskscope.db.database import install_id
+
+# Eşitlenen görev sütunları; series (serinin uid'si) ve subtasks ayrıca eklenir
+FIELDS = ("title", "description", "status", "priority", "tags", "project", "due_at", "reminders",
+          "is_done", "created_at", "recurrence")
+NEW = "*"
+DELETED = "-"
+
+# changed_at: UTC, milisaniye; yerel saat geride kalsa da görülen en büyük saatten küçük olmaz
+_CLOCK = "max(strftime('%Y-%m-%d %H:%M:%f', 'now'), s.clock)"
+_ACTIVE = "s.id = 1 AND NOT s.muted"
+_SERIES_UID = "(SELECT uid FROM tasks WHERE id = {0}.series_id)"
+_SUBTASKS = ("(SELECT json_group_array(json_array(title, is_done)) FROM "
+             "(SELECT title, is_done FROM subtasks WHERE task_id = {0} ORDER BY id))")
+_INSERT = "INSERT INTO changes(uid, field, value, changed_at, origin)"
+# log_subtasks'te IN (...) listesi bu boyutta parçalanır (SQLite parametre sınırı)
+_CHUNK = 500
+
+
+def _object(row: str) -> str:
+    pairs = ", ".join(f"'{f}', {row}.{f}" for f in FIELDS)
+    return f"json_object({pairs}, 'series', {_SERIES_UID.format(row)})"
+
+
+def _changed_fields() -> str:
+    parts = [f"SELECT '{f}' AS field, json_quote(new.{f}) AS value WHERE old.{f} IS NOT new.{f}" for f in FIELDS]
+    parts.append(f"SELECT 'series', json_quote({_SERIES_UID.format('new')}) WHERE old.series_id IS NOT new.series_id")
+    return "\n            UNION ALL ".join(parts)
+
+
+_DDL = [
+    # Eski sürümlerin satır başına alt görev tetikleyicileri
+    "DROP TRIGGER IF EXISTS subtasks_log_ai",
+    "DROP TRIGGER IF EXISTS subtasks_log_au",
+    "DROP TRIGGER IF EXISTS subtasks_log_ad",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_log_ai AFTER INSERT ON tasks BEGIN
+        {_INSERT}
+        SELECT new.uid, '{NEW}', {_object('new')}, {_CLOCK}, s.device FROM sync_state s WHERE {_ACTIVE};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_log_au AFTER UPDATE ON tasks BEGIN
+        {_INSERT}
+        SELECT new.uid, f.field, f.value, {_CLOCK}, s.device FROM sync_state s, (
+            {_changed_fields()}
+        ) f WHERE {_ACTIVE};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_log_ad AFTER DELETE ON tasks BEGIN
+        {_INSERT}
+        SELECT old.uid, '{DELETED}', NULL, {_CLOCK}, s.device FROM sync_state s WHERE {_ACTIVE};
+    END""",
+]
+
+# Yeni görevin listesi tetikleyicinin yazdığı "*" satırına eklenir; sonraki değişiklikler ayrı satır
+_SUBTASKS_NEW = text(f"""
+    UPDATE changes SET value = json_set(value, '$.subtasks', json({_SUBTASKS.format('t.id')}))
+    FROM tasks t, sync_state s
+    WHERE t.id IN :ids AND {_ACTIVE}
+      AND changes.seq = (SELECT max(c.seq) FROM changes c WHERE c.uid = t.uid AND c.field = '{NEW}')
+""").bindparams(bindparam("ids", expanding=True))
+_SUBTASKS_CHANGED = text(f"""
+    {_INSERT}
+    SELECT t.uid, 'subtasks', {_SUBTASKS.format('t.id')}, {_CLOCK}, s.device
+    FROM tasks t, sync_state s WHERE t.id IN :ids AND {_ACTIVE}
+""").bindparams(bindparam("ids", expanding=True))
+
+# İlk kurulum: mevcut görevler kendi updated_at saatleriyle "yeni görev" olarak günlüğe girer
+_BACKFILL = f"""
+    {_INSERT}
+    SELECT t.uid, '{NEW}', json_set({_object('t')}, '$.subtasks', json({_SUBTASKS.format('t.id')})),
+           strftime('%Y-%m-%d %H:%M:%f', t.updated_at), :device
+    FROM tasks t ORDER BY t.id
+"""
+
+
+def install_changelog(engine: Engine) -> None:
+    """Tetikleyicileri kurar; ilk kurulumda cihaz kimliği verir ve mevcut görevleri günlüğe ekler.
+
+    Veritabanı başka bir kuruluma kopyalanmışsa (kayıtlı kurulum kimliği farklı) yeni cihaz
+    kimliği alınır ve sunucu imleçleri sıfırlanır; aynı kimlikli iki cihaz birbirinin
+    değişikliklerini görmezdi. Host adına bakılmaz: DHCP ya da .local çakışmasıyla değişir ve
+    her değişimde tüm günlük yeniden aktarılırdı.
+    """
+    owner = install_id()
+    with engine.begin() as conn:
+        state = conn.execute(text("SELECT host FROM sync_state WHERE id = 1")).first()
+        # Eski veritabanı: uid sütunu sonradan eklendi (indeksli, yeni kurulumda boş geçer)
+        conn.execute(text("UPDATE tasks SET uid = lower(hex(randomblob(16))) WHERE uid IS NULL"))
+        if state is None:
+            device = uuid4().hex
+            conn.execute(text("UPDATE archived_tasks SET uid = lower(hex(randomblob(16))) WHERE uid IS NULL"))
+            conn.execute(text(_BACKFILL), {"device": device})
+            conn.execute(
+                text("INSERT INTO sync_state (id, device, host, clock, muted) VALUES (1, :d, :h, '', 0)"),
+                {"d": device, "h": owner or ""},
+            )
+        elif owner is None or state.host == owner:
+            pass
+        elif not _is_install_id(state.host):
+            # Eski sürüm host adını yazıyordu (ya da kimlik o an kaydedilemedi): bu kurulum sahiplenir
+            conn.execute(text("UPDATE sync_state SET host = :h WHERE id = 1"), {"h": owner})
+        else:
+            conn.execute(text("UPDATE sync_state SET device = :d, host = :h WHERE id = 1"),
+                         {"d": uuid4().hex, "h": owner})
+            conn.execute(text("DELETE FROM sync_peers"))
+        for ddl in _DDL:
+            conn.execute(text(ddl))
+
+
+def _is_install_id(value: str) -> bool:
+    return len(value) == 32 and all(c in "0123456789abcdef" for c in value)
+
+
+def log_subtasks(conn: Connection, task_ids: list[int], created: bool = False) -> None:
+    """Görevlerin alt görev listesini görev başına bir kez günlüğe yazar (çağıranın transaction'ında).
+
+    created: görevler bu transaction'da eklendi, liste "*" satırına girer. Susturulmuşken yazmaz.
+    """
+    stmt = _SUBTASKS_NEW if created else _SUBTASKS_CHANGED
+    for i in range(0, len(task_ids), _CHUNK):
+        conn.execute(stmt, {"ids": task_ids[i:i + _CHUNK]})
+
+
+@contextmanager
+def muted(conn: Connection):
+    """Blok içindeki yazmalar günlüğe girmez (bayrak commit'ten önce geri kapanır)"""
+    conn.execute(text("UPDATE sync_state SET muted = 1 WHERE id = 1"))
+    yield
+    conn.execute(text("UPDATE sync_state SET muted = 0 WHERE id = 1"))
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from platformdirs import user_data_dir
+from uuid import uuid4
+from platformdirs import user_config_dir, user_data_dir
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import URL
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
+from taskscope.db.storage import choose_profile, install_storage_profile
+
 APP_NAME = "TaskScope"
 APP_AUTHOR = "TaskScope"
 
@@ -21,6 +24,29 @@ def get_db_path() -> Path:
     return data_dir / "taskscope.db"
 
 
+def install_id() -> str | None:
+    """Bu kurulumun (kullanıcı + makine) kalıcı rastgele kimliği, veritabanı dosyasının dışında.
+
+    Kopyalanan veritabanı başka kurulumda açılınca eşitleme bunu fark eder. Dosya yazılamazsa
+    None döner (her açılışta yeni kimlik üretilmesin).
+    """
+    path = Path(user_config_dir(APP_NAME, APP_AUTHOR)) / "install-id"
+    try:
+        value = path.read_text(encoding="utf-8").strip()
+        if value:
+            return value
+    except OSError:
+        pass
+    value = uuid4().hex
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(value, encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️ Kurulum kimliği kaydedilemedi: {e}")
+        return None
+    return value
+
+
 DB_PATH = get_db_path()
 
 DATABASE_URL = URL.create(
@@ -34,11 +60,105 @@ ENGINE = create_engine(
     future=True,
     connect_args={"check_same_thread": False},
 )
+# WAL, synchronous, önbellek vb. her bağlantıda profile göre ayarlanır
+install_storage_profile(ENGINE, choose_profile())
 
 SessionLocal = sessionmaker(bind=ENGINE, autoflush=False, autocommit=False, future=True)
 
 
-def init_db() -> None:
+def init_db(engine: Engine = ENGINE) -> None:
     # Model importu şart: tabloyu görsün
     from taskscope.models.task import Task  # noqa: F401
-    Base.metadata.create_all(bind=ENGINE)
+    from taskscope.db.fts import install_fts
+    from taskscope.db.changelog import install_changelog
+    from taskscope.db.watch import install_change_marks
+    Base.metadata.create_all(bind=engine)
+    added = _ensure_columns(engine)
+    if ("tasks", "sort_rank") in added:
+        _backfill_sort_ranks(engine)
+    _ensure_indexes(engine)
+    _backfill_tags(engine)
+    # Arama indeksi (ilk kurulumda mevcut görevler tek seferde aktarılır)
+    install_fts(engine)
+    # Eşitleme günlüğü tetikleyicileri (eski görevlere uid ve ilk kayıt burada)
+    install_changelog(engine)
+    # Süreçler arası değişiklik tespiti için tablo sayaçları (db/watch.py)
+    install_change_marks(engine)
+
+
+def _ensure_columns(engine: Engine) -> set[tuple[str, str]]:
+    """Eski veritabanlarına sonradan eklenen sütunları ALTER TABLE ile ekle.
+
+    Yeni sütunlar ya NULL olabilmeli ya da server_default taşımalı.
+    Eklenen (tablo, sütun) çiftlerini döner ki gerekirse veri doldurulsun.
+    """
+    added = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")}
+            if not existing:
+                continue
+            for col in table.columns:
+                if col.name in existing:
+                    continue
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {col.name} {col.type.compile(engine.dialect)}"
+                if col.server_default is not None:
+                    ddl += f" DEFAULT '{col.server_default.arg}'"
+                conn.exec_driver_sql(ddl)
+                added.add((table.name, col.name))
+    return added
+
+
+def _backfill_sort_ranks(engine: Engine) -> None:
+    """Pano sırası yeni eklendiyse her kolonu eski görünüm sırasıyla (en yeni üstte) numarala"""
+    from taskscope.models.task import RANK_STEP
+    with engine.begin() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT id, status FROM tasks ORDER BY status, created_at DESC, id DESC"
+        ).all()
+        params, prev, n = [], None, 0
+        for task_id, status in rows:
+            n = n + 1 if status == prev else 1
+            prev = status
+            params.append((n * RANK_STEP, task_id))
+        if params:
+            conn.exec_driver_sql("UPDATE tasks SET sort_rank = ? WHERE id = ?", params)
+
+
+def _backfill_tags(engine: Engine) -> None:
+    """Virgüllü Task.tags metinlerini tags / task_tags tablolarına böler.
+
+    Sadece ilişki tablosu boşken ve etiketli görev varken çalışır (eski veritabanı ya da
+    dışarıdan doldurulmuş tablo); iki kontrol de LIMIT 1 ile ucuzdur.
+    """
+    from taskscope.models.task import split_tags, tag_key
+    with engine.begin() as conn:
+        if conn.exec_driver_sql("SELECT 1 FROM task_tags LIMIT 1").first():
+            return
+        if not conn.exec_driver_sql("SELECT 1 FROM tasks WHERE tags != '' LIMIT 1").first():
+            return
+        names, links = {}, []
+        for task_id, tags in conn.exec_driver_sql("SELECT id, tags FROM tasks WHERE tags != ''"):
+            for name in split_tags(tags):
+                names.setdefault(tag_key(name), name)
+                links.append((task_id, tag_key(name)))
+        conn.exec_driver_sql("INSERT OR IGNORE INTO tags (name, key) VALUES (?, ?)",
+                             [(name, key) for key, name in names.items()])
+        ids = dict(conn.exec_driver_sql("SELECT key, id FROM tags").all())
+        conn.exec_driver_sql("INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
+                             [(task_id, ids[key]) for task_id, key in links])
+
+
+def _ensure_indexes(engine: Engine) -> None:
+    """create_all mevcut tablolara yeni indeks eklemez; eski veritabanları için eksikleri kur.
+
+    İfade indekslerini SQLAlchemy yansıtamadığı için isimler sqlite_master'dan okunur.
+    """
+    with engine.begin() as conn:
+        # ix_tasks_project_order'ın öneki; yazmalarda boşuna güncellenmesin
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_tasks_project")
+        existing = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(bind=conn)
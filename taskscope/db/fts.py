@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import text, literal_column, column, table, func
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+# Görev başına tek satır: rowid = tasks.id, alt görev başlıkları tek sütunda
+FTS_TABLE = "tasks_fts"
+fts_table = table(FTS_TABLE, column("rowid"))
+
+# Alan ağırlıkları: başlık > etiket > alt görev > açıklama
+BM25_WEIGHTS = (10.0, 1.0, 5.0, 2.0)
+
+_SUBTASK_TITLES = "(SELECT coalesce(group_concat(title, ' '), '') FROM subtasks WHERE task_id = {0})"
+
+_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, tags, subtasks,
+        tokenize = 'unicode61 remove_diacritics 0'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description, tags, subtasks)
+        VALUES (new.id, new.title, new.description, new.tags, {_SUBTASK_TITLES.format('new.id')});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, tags ON tasks BEGIN
+        UPDATE {FTS_TABLE} SET title = new.title, description = new.description, tags = new.tags
+        WHERE rowid = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS subtasks_fts_ai AFTER INSERT ON subtasks BEGIN
+        UPDATE {FTS_TABLE} SET subtasks = {_SUBTASK_TITLES.format('new.task_id')} WHERE rowid = new.task_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS subtasks_fts_au AFTER UPDATE OF title ON subtasks BEGIN
+        UPDATE {FTS_TABLE} SET subtasks = {_SUBTASK_TITLES.format('new.task_id')} WHERE rowid = new.task_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS subtasks_fts_ad AFTER DELETE ON subtasks BEGIN
+        UPDATE {FTS_TABLE} SET subtasks = {_SUBTASK_TITLES.format('old.task_id')} WHERE rowid = old.task_id;
+    END""",
+]
+
+_BACKFILL = f"""
+    INSERT INTO {FTS_TABLE}(rowid, title, description, tags, subtasks)
+    SELECT t.id, t.title, t.description, t.tags, {_SUBTASK_TITLES.format('t.id')} FROM tasks t
+"""
+
+# Arşivin ayrı indeksi (rowid = archived_tasks.id). Arşiv sadece toplu taşımayla değiştiği için
+# tetikleyici yok; depo taşırken index_archive / unindex_archive çağırır.
+ARCHIVE_FTS_TABLE = "archive_fts"
+archive_fts_table = table(ARCHIVE_FTS_TABLE, column("rowid"))
+
+_ARCHIVE_DDL = f"""CREATE VIRTUAL TABLE IF NOT EXISTS {ARCHIVE_FTS_TABLE} USING fts5(
+    title, description, tags, subtasks,
+    tokenize = 'unicode61 remove_diacritics 0'
+)"""
+
+_ARCHIVE_BACKFILL = f"""
+    INSERT INTO {ARCHIVE_FTS_TABLE}(rowid, title, description, tags, subtasks)
+    SELECT a.id, a.title, a.description, a.tags,
+           (SELECT coalesce(group_concat(title, ' '), '') FROM archived_subtasks WHERE archive_id = a.id)
+    FROM archived_tasks a
+"""
+
+_available: "WeakKeyDictionary[Engine, bool]" = WeakKeyDictionary()
+
+
+def install_fts(engine: Engine) -> bool:
+    """FTS tablosunu ve tetikleyicileri kurar; tablo yeni oluştuysa mevcut görevleri doldurur.
+
+    SQLite FTS5 olmadan derlenmişse False döner ve arama LIKE ile devam eder.
+    """
+    try:
+        with engine.begin() as conn:
+            existed = _table_exists(conn, FTS_TABLE)
+            for ddl in _DDL:
+                conn.execute(text(ddl))
+            if not existed:
+                conn.execute(text(_BACKFILL))
+            if not _table_exists(conn, ARCHIVE_FTS_TABLE):
+                conn.execute(text(_ARCHIVE_DDL))
+                conn.execute(text(_ARCHIVE_BACKFILL))
+        _available[engine] = True
+    except OperationalError:
+        _available[engine] = False
+    return _available[engine]
+
+
+# Toplu eklemede geçici olarak kaldırılan satır tetikleyicileri
+_INSERT_TRIGGERS = ("tasks_fts_ai", "subtasks_fts_ai")
+
+
+@contextmanager
+def deferred_insert_index(conn: Connection):
+    """Toplu eklemede arama indeksini satır satır değil, en sonda tek INSERT ... SELECT ile doldurur.
+
+    Satır tetikleyicileri her alt görevde görevin belgesini yeniden yazar; bunun yerine ekleme
+    tetikleyicileri aynı transaction içinde kaldırılıp geri kurulur ve blok içinde eklenen
+    görevler (yazma kilidi alındıktan sonraki en büyük id'nin üstü) tek seferde indekslenir.
+    DDL de transaction'a dahil olduğu için hata olursa her şey geri alınır.
+    """
+    if not fts_available(conn.engine):
+        yield
+        return
+    for name in _INSERT_TRIGGERS:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    last_id = conn.execute(text("SELECT coalesce(max(id), 0) FROM tasks")).scalar_one()
+    yield
+    conn.execute(text(_BACKFILL + " WHERE t.id > :last"), {"last": last_id})
+    for ddl in _DDL:
+        conn.execute(text(ddl))
+
+
+def _table_exists(conn: Connection, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :n"), {"n": name}
+    ).first() is not None
+
+
+def index_archive(conn: Connection, after_id: int) -> None:
+    """archived_tasks'a after_id'den sonra eklenen görevleri (alt görevleriyle) indeksler"""
+    if fts_available(conn.engine):
+        conn.execute(text(_ARCHIVE_BACKFILL + " WHERE a.id > :after"), {"after": after_id})
+
+
+def unindex_archive(conn: Connection, archive_ids: list[int]) -> None:
+    if fts_available(conn.engine) and archive_ids:
+        conn.execute(text(f"DELETE FROM {ARCHIVE_FTS_TABLE} WHERE rowid = :id"), [{"id": i} for i in archive_ids])
+
+
+def fts_available(engine: Engine) -> bool:
+    if engine not in _available:
+        with engine.connect() as conn:
+            _available[engine] = _table_exists(conn, FTS_TABLE)
+    return _available[engine]
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(search_text: str) -> str:
+    """Yazarken arama: her kelime önek olarak aranır, kelimeler VE ile bağlanır"""
+    tokens = _TOKEN_RE.findall(search_text)
+    return " ".join(f'"{tok}"*' for tok in tokens)
+
+
+def match_clause(query: str, fts_name: str = FTS_TABLE):
+    return literal_column(fts_name).op("MATCH")(query)
+
+
+def bm25_rank():
+    return func.bm25(literal_column(FTS_TABLE), *BM25_WEIGHTS)
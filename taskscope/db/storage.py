@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PROFILE_ENV = "TASKSCOPE_STORAGE_PROFILE"
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """Her yeni SQLite bağlantısına uygulanan PRAGMA ayarları"""
+    name: str
+    journal_mode: str
+    synchronous: str
+    mmap_size: int            # bayt, 0 = kapalı
+    cache_size: int           # negatif değer KiB cinsinden
+    busy_timeout: int         # ms
+    checkpoint_interval: float  # sn, 0 = arka plan checkpoint yok
+
+
+PROFILES: dict[str, StorageProfile] = {
+    # Her commit diske yazılmadan dönmez; elektrik kesintisinde bile veri kaybı yok
+    "durable": StorageProfile("durable", "WAL", "FULL", 0, -8_000, 5_000, 30),
+    # WAL + NORMAL: commit fsync beklemez, çökme sonrası veritabanı yine tutarlı kalır
+    "balanced": StorageProfile("balanced", "WAL", "NORMAL", 64 * 1024 * 1024, -32_000, 5_000, 60),
+    # fsync yok: işletim sistemi çökerse son işlemler kaybolabilir
+    "fast": StorageProfile("fast", "WAL", "OFF", 256 * 1024 * 1024, -64_000, 5_000, 120),
+}
+DEFAULT_PROFILE = "balanced"
+
+_profiles: "WeakKeyDictionary[Engine, StorageProfile]" = WeakKeyDictionary()
+
+
+def choose_profile(name: str | None = None) -> StorageProfile:
+    """İsimle (yoksa ortam değişkeniyle) profil seçer; bilinmeyen isimde varsayılana düşer"""
+    name = (name or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE).strip().lower()
+    if name not in PROFILES:
+        print(f"⚠️ Bilinmeyen depolama profili '{name}', '{DEFAULT_PROFILE}' kullanılıyor.")
+        name = DEFAULT_PROFILE
+    return PROFILES[name]
+
+
+def apply_pragmas(dbapi_connection, profile: StorageProfile) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={profile.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={profile.synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(profile.mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size={int(profile.cache_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(profile.busy_timeout)}")
+    finally:
+        cursor.close()
+
+
+def install_storage_profile(engine: Engine, profile: StorageProfile) -> None:
+    """Motorun her yeni bağlantısına profili uygular (connect olayı ile)"""
+    if engine not in _profiles:
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            apply_pragmas(dbapi_connection, _profiles[engine])
+    _profiles[engine] = profile
+
+
+def set_storage_profile(engine: Engine, profile: StorageProfile) -> None:
+    """Profili değiştirir; havuzdaki eski bağlantılar kapatılır ki yeni ayarlar geçerli olsun"""
+    install_storage_profile(engine, profile)
+    engine.dispose()
+
+
+def current_profile(engine: Engine) -> StorageProfile | None:
+    return _profiles.get(engine)
+
+
+class WalCheckpointer(threading.Thread):
+    """WAL dosyasını arka planda PASSIVE checkpoint ile küçük tutar.
+
+    PASSIVE okuyucu/yazıcıları beklemez; kapanışta TRUNCATE ile WAL sıfırlanır.
+    """
+
+    def __init__(self, engine: Engine, interval: float):
+        super().__init__(name="WalCheckpointer", daemon=True)
+        self.engine = engine
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.checkpoint("PASSIVE")
+
+    def checkpoint(self, mode: str = "PASSIVE") -> None:
+        try:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})")
+        except Exception as e:
+            print(f"Checkpoint hatası: {e}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        self.checkpoint("TRUNCATE")
+
+
+def start_checkpointer(engine: Engine) -> WalCheckpointer | None:
+    profile = current_profile(engine)
+    if profile is None or profile.journal_mode.upper() != "WAL" or profile.checkpoint_interval <= 0:
+        return None
+    worker = WalCheckpointer(engine, profile.checkpoint_interval)
+    worker.start()
+    return worker
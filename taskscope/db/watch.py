@@ -0,0 +1,172 @@
+"""Başka bağlantıların commit'lerini ucuza fark etme: PRAGMA data_version + change_marks.
+
+data_version, bu bağlantı dışında biri commit ettiğinde değişir; açık bir bağlantıda okumak
+WAL indeksine (paylaşılan bellek) bakmaktan ibarettir, diske inmez. Değiştiyse change_marks
+okunur: izlenen her tablo için bir sayaç (writer = '') ve izleyen sürecin kendi yazmalarını
+sayan satır (writer = süreç jetonu). Sayaçlar satır tetikleyicisiyle değil, motorun commit
+yolunda artar: transaction içinde izlenen tablolara yazan ifadeler not edilir, commit'te
+tek bir UPDATE ile (tablo başına bir kez) hem genel hem jeton satırı artırılır; 50k satırlık
+bir içe aktarma da tek artış demektir. Toplam artış kendi artışından büyükse tabloyu başka
+bir süreç (ikinci pencere, cli import, eşitleme) değiştirmiştir; kendi yazmalarımızı zaten
+TaskRepo bildirimleri taşır.
+
+Bütün yazan süreçler (uygulama, cli.py, eşitleme sunucusu) init_db üzerinden geçtiğinden
+sayaçları artıran olaylar orada kurulur; SQLAlchemy dışından yazan araçlar görülmez.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+import weakref
+from functools import lru_cache
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+
+# Görünümlerin okuduğu tablolar (task_tags hep tasks.tags ile birlikte değişir)
+WATCHED = ("tasks", "subtasks", "archived_tasks")
+# Kilitli veritabanında yoklama beklemesin; sonraki turda tekrar denenir
+BUSY_TIMEOUT = 0.2
+# Bağlantının açık transaction'ında yazılan izlenen tablolar (connection_record.info anahtarı)
+_PENDING = "change_marks_pending"
+
+_DDL = [
+    """CREATE TABLE IF NOT EXISTS change_marks (
+        name TEXT NOT NULL,
+        writer TEXT NOT NULL DEFAULT '',
+        version INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (name, writer)
+    ) WITHOUT ROWID""",
+    *(f"INSERT OR IGNORE INTO change_marks (name, writer, version) VALUES ('{t}', '', 0)" for t in WATCHED),
+    # Önceki sürümün satır tetikleyicileri (her satırda iki UPDATE) artık commit yolunda
+    *(f"DROP TRIGGER IF EXISTS {t}_mark_{suffix}" for t in WATCHED for suffix in ("ai", "au", "ad")),
+]
+
+# INSERT/REPLACE/UPDATE/DELETE ifadesinin hedef tablosu (önde WITH olabilir)
+_DML = re.compile(
+    r"\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)"
+    r"\s+(?:main\.)?[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+_WRITE_PREFIXES = ("INSERT", "REPLACE", "UPDATE", "DELETE", "WITH")
+# Motor -> sayaçları artırılan yazar satırları ('' ve izleyen sürecin jetonu)
+_writers: weakref.WeakKeyDictionary[Engine, list[str]] = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1024)
+def _watched_target(statement: str) -> str | None:
+    if not statement.lstrip()[:7].upper().startswith(_WRITE_PREFIXES):
+        return None
+    m = _DML.search(statement)
+    name = m.group(1).lower() if m else None
+    return name if name in WATCHED else None
+
+
+def install_change_marks(engine: Engine) -> None:
+    with engine.begin() as conn:
+        for ddl in _DDL:
+            conn.execute(text(ddl))
+    track_writes(engine)
+
+
+def track_writes(engine: Engine) -> None:
+    """İzlenen tablolara yazan transaction'lar commit edilirken sayaçları (tablo başına bir kez) artırır.
+
+    İfadeler before_cursor_execute'ta hedef tablolarına göre not edilir (executemany tek
+    ifadedir); artış commit'ten hemen önce aynı transaction'da yapılır ki sayaç ile veri
+    birlikte görünsün. Geri alınan transaction'ın notları silinir.
+    """
+    if engine in _writers:
+        return
+    writers = _writers[engine] = [""]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _note(conn, cursor, statement, parameters, context, executemany):
+        table = _watched_target(statement)
+        if table is not None:
+            conn.info.setdefault(_PENDING, set()).add(table)
+
+    @event.listens_for(engine, "commit")
+    def _bump(conn: Connection):
+        tables = conn.info.pop(_PENDING, None)
+        if not tables:
+            return
+        names, who = sorted(tables), list(writers)
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(
+                f"UPDATE change_marks SET version = version + 1 "
+                f"WHERE name IN ({', '.join('?' * len(names))}) AND writer IN ({', '.join('?' * len(who))})",
+                [*names, *who],
+            )
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "rollback")
+    def _forget(conn: Connection):
+        conn.info.pop(_PENDING, None)
+
+    @event.listens_for(engine, "reset")
+    def _forget_on_reset(dbapi_connection, connection_record, reset_state):
+        # Havuza dönerken yapılan geri alma Connection.rollback'ten geçmez
+        connection_record.info.pop(_PENDING, None)
+
+
+def track_local_writes(engine: Engine, token: str) -> None:
+    """Bu sürecin commit'leri jeton satırını da artırsın (kendi yazmalarımız değişiklik sayılmasın)"""
+    track_writes(engine)
+    if token not in _writers[engine]:
+        _writers[engine].append(token)
+
+
+class ChangeProbe:
+    """Ayrı, otomatik commit'li bir bağlantıda data_version ve change_marks okur.
+
+    poll() son çağrıdan beri başka süreçlerin değiştirdiği izlenen tabloları döner.
+    """
+
+    def __init__(self, path: str, token: str):
+        self.token = token
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        try:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO change_marks (name, writer, version) VALUES (?, ?, 0)",
+                [(t, token) for t in WATCHED],
+            )
+            self._version = self._data_version()
+            self._marks = self._read_marks()
+        except sqlite3.Error:
+            self.conn.close()
+            raise
+
+    def _data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _read_marks(self) -> dict[str, tuple[int, int]]:
+        """tablo -> (toplam, bu sürecin payı)"""
+        total, own = {}, {}
+        for name, writer, version in self.conn.execute(
+            "SELECT name, writer, version FROM change_marks WHERE writer IN ('', ?)", (self.token,)
+        ):
+            (own if writer else total)[name] = version
+        return {t: (total.get(t, 0), own.get(t, 0)) for t in WATCHED}
+
+    def poll(self) -> frozenset[str]:
+        version = self._data_version()
+        if version == self._version:
+            return frozenset()
+        marks = self._read_marks()
+        changed = frozenset(
+            t for t in WATCHED
+            if marks[t][0] - self._marks[t][0] > marks[t][1] - self._marks[t][1]
+        )
+        self._version, self._marks = version, marks
+        return changed
+
+    def close(self) -> None:
+        try:
+            self.conn.execute("DELETE FROM change_marks WHERE writer = ?", (self.token,))
+        except sqlite3.Error:
+            pass  # kalan satır zararsız: kimse artırmaz
+        finally:
+            self.conn.close()
@@ -0,0 +1,190 @@
+"""Tekrar kuralları: RRULE'un küçük bir alt kümesi.
+
+    FREQ=DAILY|WEEKLY|MONTHLY  INTERVAL=n  BYDAY=MO,WE (haftalık)
+    BYMONTHDAY=15 ya da -1 = ayın son günü (aylık)  COUNT=n  UNTIL=20261231
+
+Serinin ilk görevi (due_at = başlangıç) ilk örnektir ve COUNT'a dahildir. Sonraki
+örnekler TaskRepo.materialize_occurrences ile sadece horizon()'a kadar satır olur.
+"""
+from __future__ import annotations
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator
+
+FREQS = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_KEYS = {"FREQ", "INTERVAL", "BYDAY", "BYMONTHDAY", "COUNT", "UNTIL"}
+_DAY_NAMES = ("Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz")
+# Örnekler bugünün başından bu kadar gün ilerisine kadar oluşturulur: Bu Hafta (7 gün),
+# bildirim penceresi (6 saat) ve günün geri kalanı bu aralığa sığar
+MATERIALIZE_DAYS = 9
+# Bitmiş kuralın materialized_until değeri; bir daha genişletilmez
+ENDED = datetime(9999, 12, 31)
+# Hiç örnek üretmeyen kurallarda (ör. her yıl 30 Şubat) sonsuz döngüye karşı
+MAX_PERIODS = 100_000
+
+
+class RuleError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Rule:
+    freq: str
+    interval: int = 1
+    byday: tuple[int, ...] = ()          # 0 = Pazartesi
+    bymonthday: int | None = None
+    count: int | None = None
+    until: date | None = None            # dahil
+
+
+@lru_cache(maxsize=256)
+def parse_rule(text: str) -> Rule:
+    """"FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10" -> Rule; baştaki "RRULE:" kabul edilir"""
+    text = text.strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[6:]
+    parts = {}
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise RuleError(f"geçersiz parça: {part!r}")
+        parts[key.strip().upper()] = value.strip().upper()
+    unknown = set(parts) - _KEYS
+    if unknown:
+        raise RuleError(f"desteklenmeyen: {', '.join(sorted(unknown))}")
+    freq = parts.get("FREQ", "")
+    if freq not in FREQS:
+        raise RuleError(f"FREQ {', '.join(FREQS)} olmalı")
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+        bymonthday = int(parts["BYMONTHDAY"]) if "BYMONTHDAY" in parts else None
+        until = datetime.strptime(parts["UNTIL"][:8], "%Y%m%d").date() if "UNTIL" in parts else None
+        byday = tuple(sorted({WEEKDAYS.index(d.strip()) for d in parts["BYDAY"].split(",")})) \
+            if "BYDAY" in parts else ()
+    except ValueError as e:
+        raise RuleError(f"geçersiz değer: {e}")
+    if interval < 1 or (count is not None and count < 1):
+        raise RuleError("INTERVAL ve COUNT pozitif olmalı")
+    if bymonthday is not None and not (1 <= bymonthday <= 31 or bymonthday == -1):
+        raise RuleError("BYMONTHDAY 1-31 ya da -1 olmalı")
+    if byday and freq != "WEEKLY" or bymonthday is not None and freq != "MONTHLY":
+        raise RuleError("BYDAY sadece WEEKLY, BYMONTHDAY sadece MONTHLY ile")
+    return Rule(freq, interval, byday, bymonthday, count, until)
+
+
+def format_rule(rule: Rule) -> str:
+    """Kuralın kanonik metni (veritabanına bu yazılır)"""
+    parts = [f"FREQ={rule.freq}"]
+    if rule.interval != 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.byday:
+        parts.append("BYDAY=" + ",".join(WEEKDAYS[d] for d in rule.byday))
+    if rule.bymonthday is not None:
+        parts.append(f"BYMONTHDAY={rule.bymonthday}")
+    if rule.count is not None:
+        parts.append(f"COUNT={rule.count}")
+    if rule.until is not None:
+        parts.append(f"UNTIL={rule.until:%Y%m%d}")
+    return ";".join(parts)
+
+
+def normalize_rule(text: str | None) -> str | None:
+    """Boş -> None, geçerliyse kanonik metin; geçersizse RuleError"""
+    if not (text or "").strip():
+        return None
+    return format_rule(parse_rule(text))
+
+
+def describe(text: str | None) -> str:
+    """Kartlar ve diyalog için kısa Türkçe açıklama: "Her 2 haftada Pzt, Çar · 10 kez" """
+    if not text:
+        return ""
+    try:
+        rule = parse_rule(text)
+    except RuleError:
+        return text
+    unit, every = {"DAILY": ("gün", "günde"), "WEEKLY": ("hafta", "haftada"), "MONTHLY": ("ay", "ayda")}[rule.freq]
+    out = f"Her {unit}" if rule.interval == 1 else f"Her {rule.interval} {every}"
+    if rule.byday:
+        out += " " + ", ".join(_DAY_NAMES[d] for d in rule.byday)
+    if rule.bymonthday is not None:
+        out += " son gün" if rule.bymonthday == -1 else f" {rule.bymonthday}."
+    if rule.count is not None:
+        out += f" · {rule.count} kez"
+    if rule.until is not None:
+        out += f" · {rule.until:%d.%m.%Y} tarihine kadar"
+    return out
+
+
+def horizon(now: datetime | None = None) -> datetime:
+    """Örneklerin oluşturulacağı üst sınır; gün başına hizalı ki gün içinde tekrar yazma olmasın"""
+    now = now or datetime.now()
+    return datetime(now.year, now.month, now.day) + timedelta(days=MATERIALIZE_DAYS)
+
+
+def expand(rule: Rule, dtstart: datetime, after: datetime, until: datetime) -> tuple[list[datetime], bool]:
+    """after < t < until aralığındaki örnekler ve kuralın bitip bitmediği.
+
+    COUNT başlangıçtan sayıldığı için yineleme hep dtstart'tan başlar; kural ilerledikçe
+    dönem başına sabit iş yapılır ve sonuç materialized_until'da saklandığından sadece
+    yeni pencere için çalışır.
+    """
+    out = []
+    n = 1  # dtstart ilk örnek
+    for t in _iter_after_start(rule, dtstart, until):
+        n += 1
+        if rule.count is not None and n > rule.count:
+            return out, True
+        if rule.until is not None and t.date() > rule.until:
+            return out, True
+        if t > after:
+            out.append(t)
+    ended = (rule.count is not None and n >= rule.count) or (rule.until is not None and until.date() > rule.until)
+    return out, ended
+
+
+def _iter_after_start(rule: Rule, dtstart: datetime, end: datetime) -> Iterator[datetime]:
+    """dtstart'tan sonraki örnekler, end'e (hariç) kadar, sırayla"""
+    step = rule.interval
+    if rule.freq == "DAILY":
+        for k in range(1, MAX_PERIODS):
+            t = dtstart + timedelta(days=k * step)
+            if t >= end:
+                return
+            yield t
+    elif rule.freq == "WEEKLY":
+        days = rule.byday or (dtstart.weekday(),)
+        week0 = dtstart - timedelta(days=dtstart.weekday())
+        for k in range(MAX_PERIODS):
+            week = week0 + timedelta(weeks=k * step)
+            if week >= end:
+                return
+            for d in days:
+                t = week + timedelta(days=d)
+                if t >= end:
+                    return
+                if t > dtstart:
+                    yield t
+    else:
+        day = rule.bymonthday or dtstart.day
+        for k in range(MAX_PERIODS):
+            y, m = divmod(dtstart.month - 1 + k * step, 12)
+            y += dtstart.year
+            m += 1
+            if datetime(y, m, 1) >= end:
+                return
+            last = calendar.monthrange(y, m)[1]
+            d = last if day == -1 else day
+            if d > last:
+                continue  # o ayda bu gün yok (RFC 5545 gibi atlanır)
+            t = dtstart.replace(year=y, month=m, day=d)
+            if t >= end:
+                return
+            if t > dtstart:
+                yield t
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class SubTaskRow:
+    id: int
+    task_id: int
+    title: str
+    is_done: bool
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRow:
+    """Liste ve pano için salt okunur görev satırı (ORM kimlik haritasına girmez)"""
+    id: int
+    title: str
+    description: str
+    status: str
+    priority: str
+    tags: str
+    project: str
+    due_at: datetime | None
+    is_done: bool
+    created_at: datetime
+    updated_at: datetime
+    # Alt görevler liste olarak değil, sayı olarak gelir; kart açılınca yüklenir
+    subtask_total: int = 0
+    subtask_done: int = 0
+    # Pano kolonundaki sıra (list_task_page(order="board") imleci için)
+    sort_rank: float = 0.0
+    # Tekrarlayan serinin ilk görevi ya da bir örneği
+    recurring: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedRow:
+    """Arşiv penceresi satırı; id arşiv anahtarıdır (restore_tasks bunu alır)"""
+    id: int
+    task_id: int
+    title: str
+    tags: str
+    project: str
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime
+    subtask_total: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeBatch:
+    """changes_since sonucu: [uid, field, value, changed_at, origin] listeleri, yeni imleç, devamı var mı"""
+    changes: list[list]
+    cursor: int
+    more: bool
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStats:
+    """İstatistik sayfasının tüm verisi: birkaç GROUP BY satırı, görev listesi değil"""
+    total: int
+    done: int
+    overdue: int
+    by_status: dict[str, int]
+    by_project: dict[str, int]
@@ -1,20 +1,105 @@
 from __future__ import annotations
 from datetime import datetime
 from typing import List
-from sqlalchemy import Integer, String, Boolean, DateTime, Text, ForeignKey
+from uuid import uuid4
+from sqlalchemy import Integer, String, Boolean, DateTime, Text, Float, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from taskscope.db.database import Base
 
+# Varsayılan hatırlatmalar: 15 dakika kala ve süre dolduğunda (dakika cinsinden, virgülle ayrılmış)
+DEFAULT_REMINDERS = "15,0"
+MAX_REMINDER_MINUTES = 7 * 24 * 60
+
+DEFAULT_PROJECT = "Genel"
+
+# Pano kolonundaki sıra: kesirli sort_rank; ara eklemeler iki komşunun ortası
+RANK_STEP = 1024.0
+
+
+def parse_reminders(text: str | None) -> list[int]:
+    """"15, 0" -> [15, 0]. Geçersiz ve aralık dışı değerler atlanır, tekrarlar ayıklanır."""
+    offsets = set()
+    for part in (text or "").replace(";", ",").split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) <= MAX_REMINDER_MINUTES:
+            offsets.add(int(part))
+    return sorted(offsets, reverse=True)
+
+
+def split_tags(tags: str | None) -> list[str]:
+    """"iş, acil" -> ["iş", "acil"] (sıra korunur, tekrarlar atılır)"""
+    out, seen = [], set()
+    for t in (tags or "").split(","):
+        t = t.strip()
+        if t and tag_key(t) not in seen:
+            seen.add(tag_key(t))
+            out.append(t)
+    return out
+
+
+def tag_key(name: str) -> str:
+    # "İ".lower() noktalı iki karakter verir; "İş" ile "iş" aynı etiket sayılsın
+    return name.strip().replace("İ", "i").lower()
+
+
+def new_uid() -> str:
+    return uuid4().hex
+
+
+def occurrence_uid(series_uid: str, due_at: datetime) -> str:
+    # Her cihaz aynı örneği aynı uid ile oluşturur; eşitlemede kopya değil, aynı görev olur
+    return f"{series_uid}@{due_at:%Y%m%dT%H%M%S}"
+
 class SubTask(Base):
     __tablename__ = "subtasks"
+    __table_args__ = (
+        # Alt görev yükleme, FTS tetikleyicileri ve (toplam, biten) sayımları için kapsayan indeks
+        Index("ix_subtasks_task_done", "task_id", "is_done"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     is_done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     task: Mapped["Task"] = relationship("Task", back_populates="subtasks")
 
+class Tag(Base):
+    """Normalleştirilmiş etiket; key küçük harfli ad (eşleşme büyük/küçük harfe duyarsız)"""
+    __tablename__ = "tags"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    key: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+
+class TaskTag(Base):
+    """Görev-etiket ilişkisi; Task.tags metni görüntü için aynen tutulur"""
+    __tablename__ = "task_tags"
+    __table_args__ = (
+        # Etiket filtresi ve facet sayımı: tag_id -> task_id tek indeks taraması
+        Index("ix_task_tags_tag_task", "tag_id", "task_id"),
+    )
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id"), primary_key=True)
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # list_tasks sıralaması: is_done, due_at IS NULL, created_at DESC (+ id ile kesin sıra)
+        Index("ix_tasks_list_order", "is_done", text("due_at IS NULL"), text("created_at DESC"), text("id DESC")),
+        # Bildirim taraması (is_done = 0 AND due_at) ve Bugün / Bu Hafta aralıkları
+        Index("ix_tasks_open_due", "is_done", "due_at"),
+        # Proje filtresi list_tasks sırasıyla; GROUP BY project, is_done (sayımlar) de bunu tarar
+        Index("ix_tasks_project_order", "project", "is_done", text("due_at IS NULL"),
+              text("created_at DESC"), text("id DESC")),
+        # İstatistik sayfası: GROUP BY status tablo yerine bu indeksi tarar
+        Index("ix_tasks_status", "status"),
+        # Pano kolonu: status = ? ORDER BY sort_rank, id
+        Index("ix_tasks_status_rank", "status", "sort_rank"),
+        # Genişletilecek seriler (kısmi: sadece tekrar kuralı olan satırlar)
+        Index("ix_tasks_recurring", "materialized_until", sqlite_where=text("recurrence IS NOT NULL")),
+        # Serinin gelecekteki örnekleri (kural değişince silinir / alanlar aktarılır)
+        Index("ix_tasks_series", "series_id", "due_at", sqlite_where=text("series_id IS NOT NULL")),
+        # Eşitlemede cihazlar arası kimlik
+        Index("ix_tasks_uid", "uid", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -24,14 +109,107 @@ class Task(Base):
     status: Mapped[str] = mapped_column(String(20), default="todo") # todo, in_progress, done
     priority: Mapped[str] = mapped_column(String(20), default="Orta")
     tags: Mapped[str] = mapped_column(String(200), default="")
-    project: Mapped[str] = mapped_column(String(100), default="Genel")
+    project: Mapped[str] = mapped_column(String(100), default=DEFAULT_PROJECT)
     # -----------------------------------------------
 
     due_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Bitiş zamanından kaç dakika önce hatırlatılacağı, örn. "15,0"
+    reminders: Mapped[str] = mapped_column(String(100), default=DEFAULT_REMINDERS,
+                                           server_default=DEFAULT_REMINDERS, nullable=False)
+    # Pano kolonunda sıra (küçük üstte); taşımada sadece taşınan satır değişir
+    sort_rank: Mapped[float] = mapped_column(Float, default=0.0, server_default="0", nullable=False)
     is_done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Tekrar kuralı (models/recurrence.py) sadece serinin ilk görevinde; due_at başlangıçtır
+    recurrence: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    # Seride: örnekler bu ana kadar satır olarak oluşturuldu (genişletme önbelleği)
+    materialized_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Örnekte: serinin ilk görevinin id'si
+    series_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Cihazlar arası kalıcı kimlik (id her veritabanında farklıdır); eski satırlara db/changelog.py verir
+    uid: Mapped[str | None] = mapped_column(String(64), default=new_uid, nullable=True)
 
     subtasks: Mapped[List[SubTask]] = relationship(
-        "SubTask", back_populates="task", cascade="all, delete-orphan", lazy="joined"
+        "SubTask", back_populates="task", cascade="all, delete-orphan", lazy="select"
     )
+
+class ArchivedTask(Base):
+    """Arşive taşınmış bitmiş görev (sıcak tablonun dışında).
+
+    Sütunlar Task ile aynıdır; id arşivin kendi anahtarıdır, task_id görevin eski id'si
+    (silinen en büyük id yeniden verilebildiği için anahtar olarak kullanılmaz).
+    """
+    __tablename__ = "archived_tasks"
+    __table_args__ = (
+        # Arşiv listesi: en son arşivlenen önce
+        Index("ix_archived_tasks_order", text("archived_at DESC"), text("id DESC")),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="done")
+    priority: Mapped[str] = mapped_column(String(20), default="Orta")
+    tags: Mapped[str] = mapped_column(String(200), default="")
+    project: Mapped[str] = mapped_column(String(100), default=DEFAULT_PROJECT)
+    due_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    reminders: Mapped[str] = mapped_column(String(100), default=DEFAULT_REMINDERS, nullable=False)
+    is_done: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    uid: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+class ArchivedSubTask(Base):
+    __tablename__ = "archived_subtasks"
+    __table_args__ = (
+        # Alt görev sayısı ve geri yükleme: archive_id -> (id sırasıyla) alt görevler
+        Index("ix_archived_subtasks_archive", "archive_id"),
+    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    archive_id: Mapped[int] = mapped_column(ForeignKey("archived_tasks.id"), nullable=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    is_done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+class Change(Base):
+    """Değişiklik günlüğü (sadece eklenir). Satırları db/changelog.py tetikleyicileri yazar.
+
+    field: "*" yeni görev (value tüm alanların JSON nesnesi), "-" silme, diğerleri tek alan.
+    changed_at (UTC, ms) ve origin (cihaz) alan bazında son-yazan-kazanır karşılaştırmasıdır.
+    """
+    __tablename__ = "changes"
+    __table_args__ = (
+        # Uygulamada görev başına alan saatleri ve silme kontrolü
+        Index("ix_changes_uid_field", "uid", "field"),
+        # seq imleç olarak kullanılır; silinen en büyük değer yeniden verilmesin
+        {"sqlite_autoincrement": True},
+    )
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    uid: Mapped[str] = mapped_column(String(64), nullable=False)
+    field: Mapped[str] = mapped_column(String(20), nullable=False)
+    value: Mapped[str | None] = mapped_column(Text, nullable=True)
+    changed_at: Mapped[str] = mapped_column(String(23), nullable=False)
+    origin: Mapped[str] = mapped_column(String(32), nullable=False)
+
+class SyncState(Base):
+    """Tek satır (id = 1): bu veritabanının cihaz kimliği, mantıksal saat ve susturma bayrağı"""
+    __tablename__ = "sync_state"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device: Mapped[str] = mapped_column(String(32), nullable=False)
+    # Veritabanını kullanan kurulumun kimliği (database.install_id; eski sürümlerde host adı).
+    # Kopyalanan veritabanı başka kurulumda yeni cihaz kimliği alsın
+    host: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Görülen en büyük changed_at; yerel saat geride kalsa da yeni değişiklikler bundan büyük olur
+    clock: Mapped[str] = mapped_column(String(23), nullable=False, default="")
+    # Açıkken tetikleyiciler günlüğe yazmaz (aynı transaction içinde geri kapatılır)
+    muted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+class SyncPeer(Base):
+    """Eşitlenen sunucu başına imleçler: çekilen son uzak seq, gönderilen son yerel seq"""
+    __tablename__ = "sync_peers"
+    url: Mapped[str] = mapped_column(String(500), primary_key=True)
+    pull_cursor: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    push_cursor: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    synced_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
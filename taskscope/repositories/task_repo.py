@@ -1,24 +1,102 @@
 from __future__ import annotations
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from sqlalchemy import select, update, delete, or_, distinct
-from sqlalchemy.orm import Session
-from taskscope.models.task import Task, SubTask
+from typing import Callable, Iterator, Sequence
+from sqlalchemy import select, update, delete, insert, or_, distinct, func, tuple_, literal, DateTime
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased, selectinload
+from taskscope.models.task import (
+    Task, SubTask, Tag, TaskTag, ArchivedTask, ArchivedSubTask, Change, SyncState, SyncPeer,
+    DEFAULT_REMINDERS, DEFAULT_PROJECT, RANK_STEP, split_tags, tag_key, new_uid, occurrence_uid,
+)
+from taskscope.models.rows import TaskRow, SubTaskRow, TaskStats, ArchivedRow, ChangeBatch
+from taskscope.models.recurrence import ENDED, RuleError, expand, horizon, normalize_rule, parse_rule
+from taskscope.db import fts, changelog
+from taskscope.db.changelog import NEW, DELETED
+
+PAGE_SIZE = 100
+# Arşiv penceresinde bir seferde gösterilen satır
+ARCHIVE_PAGE = 200
+# Arşive aynen taşınan görev sütunları (id, sort_rank ve archived_at hariç)
+_ARCHIVED_COLUMNS = ("title", "description", "status", "priority", "tags", "project", "due_at", "reminders",
+                     "is_done", "created_at", "updated_at", "uid")
+# Toplu işlemlerde IN (...) listesi bu boyutta parçalanır (SQLite parametre sınırı)
+BULK_CHUNK = 500
+# Eşitlemede bir istekte gönderilen / çekilen en fazla günlük satırı
+SYNC_BATCH = 1000
+# Eşitlenen alanlar: günlükteki görev sütunları, serinin uid'si ve alt görev listesi
+SYNC_FIELDS = (*changelog.FIELDS, "series", "subtasks")
+# Uzaktan None gelebilecek alanlar (diğerleri NOT NULL)
+_NULLABLE_FIELDS = {"due_at", "recurrence", "series"}
+_NEVER = ("", "")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """list_task_page imleci: sıralama grubu ve grup içindeki son (created_at, id).
+
+    Alaka (bm25) sırasında sadece offset kullanılır.
+    """
+    group: int = 0
+    after: tuple | None = None
+    offset: int = 0
+
 
 class TaskRepo:
+    # Değişiklik dinleyicileri: callback(kind, task_id); kind = "created" | "updated" | "deleted".
+    # Commit'ten sonra, çağıran iş parçacığında çalışır. Toplu işlemler de görev başına bildirir;
+    # task_id None sadece hangi satırların değiştiği bilinmeyen işlemlerde (içe aktarma, eşitleme).
+    _listeners: list[Callable[[str, int | None], None]] = []
+
     def __init__(self, session: Session):
         self.session = session
+        # transaction() içindeyken commit ve bildirimler ertelenir
+        self._pending_events: list[tuple[str, int | None]] | None = None
+
+    @classmethod
+    def subscribe(cls, callback: Callable[[str, int | None], None]) -> None:
+        cls._listeners.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[str, int | None], None]) -> None:
+        if callback in cls._listeners:
+            cls._listeners.remove(callback)
+
+    def _notify(self, kind: str, task_id: int | None) -> None:
+        if self._pending_events is not None:
+            self._pending_events.append((kind, task_id))
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(kind, task_id)
+            except Exception as e:
+                print(f"Değişiklik dinleyicisi hatası: {e}")
+
+    def _notify_each(self, kind: str, task_ids: Sequence[int]) -> None:
+        for task_id in dict.fromkeys(task_ids):
+            self._notify(kind, task_id)
 
     def create_task(self, title: str, description: str, due_at: datetime | None, 
-                   priority: str = "Orta", tags: str = "", subtasks: list[str] = None) -> Task:
-        
+                   priority: str = "Orta", tags: str = "", subtasks: list[str] = None,
+                   reminders: str = DEFAULT_REMINDERS, project: str = DEFAULT_PROJECT,
+                   recurrence: str | None = None) -> Task:
+        # Tekrar bitiş tarihinden başlar; tarihsiz görevde kural yok sayılır
+        rule = normalize_rule(recurrence) if due_at is not None else None
         task = Task(
             title=title.strip(), 
             description=description.strip(), 
             due_at=due_at,
             priority=priority,
             tags=tags,
+            project=_clean_project(project),
+            reminders=reminders,
             status="todo", # Varsayılan durum
-            is_done=False
+            is_done=False,
+            sort_rank=self._top_rank("todo"),  # yeni görev kolonun en üstüne
+            recurrence=rule,
+            materialized_until=due_at if rule else None,
         )
         
         if subtasks:
@@ -27,74 +105,1187 @@ class TaskRepo:
                     task.subtasks.append(SubTask(title=st.strip(), is_done=False))
 
         self.session.add(task)
-        self.session.commit()
+        self.session.flush()
+        if task.subtasks:
+            changelog.log_subtasks(self.session.connection(), [task.id], created=True)
+        self._set_tags({task.id: tags})
+        created = self._expand_series([task], horizon()) if rule else []
+        self._commit()
         self.session.refresh(task)
+        self._notify("created", task.id)
+        self._notify_each("created", created)
         return task
 
     def update_task(self, task_id: int, title: str, description: str, due_at: datetime | None,
-                   priority: str, tags: str) -> None:
-        stmt = (
-            update(Task).where(Task.id == task_id)
-            .values(title=title.strip(), description=description.strip(), due_at=due_at,
-                    priority=priority, tags=tags, updated_at=datetime.utcnow())
-        )
-        self.session.execute(stmt)
-        self.session.commit()
+                   priority: str, tags: str, reminders: str | None = None, project: str | None = None,
+                   recurrence: str | None = None) -> None:
+        """recurrence: None = değişmez, "" = tekrarı kaldır.
+
+        Kural ya da başlangıç (due_at) değişirse serinin gelecekteki açık örnekleri silinip yeniden
+        oluşturulur; değişmezse diğer alanlar o örneklere aktarılır.
+        """
+        values = dict(title=title.strip(), description=description.strip(), due_at=due_at,
+                      priority=priority, tags=tags, updated_at=datetime.utcnow())
+        if reminders is not None:
+            values["reminders"] = reminders
+        if project is not None:
+            values["project"] = _clean_project(project)
+        current = self.session.execute(select(Task.recurrence, Task.due_at).where(Task.id == task_id)).first()
+        rule = current.recurrence if current is not None and recurrence is None else normalize_rule(recurrence)
+        if due_at is None:
+            rule = None
+        values["recurrence"] = rule
+        now = datetime.now()
+        reset = current is not None and (rule != current.recurrence or (rule is not None and due_at != current.due_at))
+        removed, created, updated = [], [], []
+        if reset:
+            removed = self._future_occurrences([task_id], now)
+            self._delete_rows(removed)
+            values["materialized_until"] = due_at if rule else None
+        self.session.execute(update(Task).where(Task.id == task_id).values(**values))
+        self._set_tags({task_id: tags})
+        if rule is not None and reset:
+            created = self._expand_series([self.session.get(Task, task_id)], horizon())
+        elif rule is not None:
+            updated = self._future_occurrences([task_id], now)
+            if updated:
+                shared = {k: v for k, v in values.items() if k not in ("due_at", "recurrence", "materialized_until")}
+                for chunk in _chunks(updated):
+                    self.session.execute(update(Task).where(Task.id.in_(chunk)).values(**shared))
+                self._set_tags(dict.fromkeys(updated, tags))
+        self._commit()
+        self._notify("updated", task_id)
+        self._notify_each("deleted", removed)
+        self._notify_each("created", created)
+        self._notify_each("updated", updated)
 
     # --- KANBAN İÇİN GEREKLİ OLAN FONKSİYON ---
     def update_status(self, task_id: int, new_status: str) -> None:
         is_done = (new_status == "done")
-        stmt = update(Task).where(Task.id == task_id).values(status=new_status, is_done=is_done)
+        stmt = (
+            update(Task).where(Task.id == task_id)
+            .values(status=new_status, is_done=is_done, sort_rank=_top_rank_expr(new_status),
+                    updated_at=datetime.utcnow())
+        )
         self.session.execute(stmt)
-        self.session.commit()
+        self._commit()
+        self._notify("updated", task_id)
     # ------------------------------------------
 
     def delete_task(self, task_id: int) -> None:
-        stmt = delete(Task).where(Task.id == task_id)
-        self.session.execute(stmt)
-        self.session.commit()
+        # Seri silinirse henüz gelmemiş açık örnekleri de gider; geçmiştekiler kalır
+        occurrence_ids = self._future_occurrences([task_id], datetime.now())
+        self._delete_rows([task_id, *occurrence_ids])
+        self._commit()
+        self._notify("deleted", task_id)
+        self._notify_each("deleted", occurrence_ids)
 
     def set_done(self, task_id: int, is_done: bool) -> None:
         new_status = "done" if is_done else "todo"
-        stmt = update(Task).where(Task.id == task_id).values(is_done=is_done, status=new_status, updated_at=datetime.utcnow())
+        stmt = update(Task).where(Task.id == task_id).values(
+            is_done=is_done, status=new_status, sort_rank=_top_rank_expr(new_status), updated_at=datetime.utcnow()
+        )
         self.session.execute(stmt)
-        self.session.commit()
+        self._commit()
+        self._notify("updated", task_id)
         
     def set_subtask_done(self, subtask_id: int, is_done: bool) -> None:
         stmt = update(SubTask).where(SubTask.id == subtask_id).values(is_done=is_done)
         self.session.execute(stmt)
-        self.session.commit()
+        # Ana görevin sürümü de değişsin ki görünümler kartı güncellesin
+        parent_id = self.session.execute(
+            select(SubTask.task_id).where(SubTask.id == subtask_id)
+        ).scalar_one_or_none()
+        self.session.execute(update(Task).where(Task.id == parent_id).values(updated_at=datetime.utcnow()))
+        if parent_id is not None:
+            changelog.log_subtasks(self.session.connection(), [parent_id])
+        self._commit()
+        if parent_id is not None:
+            self._notify("updated", parent_id)
+
+    # --- PANO SIRASI ---
+    def move_task(self, task_id: int, new_status: str, after_id: int | None) -> float:
+        """Görevi new_status kolonunda after_id'nin hemen altına (None: en üste) taşır.
+
+        Sadece taşınan satır güncellenir: sort_rank komşuların ortasıdır. Ortada yer
+        kalmadıysa (float hassasiyeti) o kolon bir kez yeniden numaralanır.
+        """
+        rank = self._rank_between(task_id, new_status, after_id)
+        if rank is None:
+            self.rebalance_ranks(new_status, commit=False)
+            rank = self._rank_between(task_id, new_status, after_id)
+        stmt = (
+            update(Task).where(Task.id == task_id)
+            .values(status=new_status, is_done=(new_status == "done"), sort_rank=rank,
+                    updated_at=datetime.utcnow())
+        )
+        self.session.execute(stmt)
+        self._commit()
+        self._notify("updated", task_id)
+        return rank
+
+    def rebalance_ranks(self, status: str, commit: bool = True) -> None:
+        """Kolonu mevcut sırasıyla RANK_STEP aralıklarla yeniden numaralar (updated_at değişmez)"""
+        ids = self.session.execute(
+            select(Task.id).where(Task.status == status).order_by(Task.sort_rank, Task.id)
+        ).scalars().all()
+        params = [{"id": task_id, "sort_rank": (i + 1) * RANK_STEP} for i, task_id in enumerate(ids)]
+        if params:
+            self.session.execute(update(Task), params)
+        if commit:
+            self._commit()
+
+    def _top_rank(self, status: str) -> float:
+        return self.session.execute(select(_top_rank_expr(status))).scalar_one()
+
+    def _rank_between(self, task_id: int, status: str, after_id: int | None) -> float | None:
+        """Komşuların arasındaki sıra değeri; yer yoksa None"""
+        col = select(Task.sort_rank, Task.id).where(Task.status == status, Task.id != task_id)
+        lo = None
+        if after_id is not None:
+            lo = self.session.execute(
+                select(Task.sort_rank, Task.id).where(Task.id == after_id)
+            ).first()
+        if lo is None:
+            hi = self.session.execute(col.order_by(Task.sort_rank, Task.id).limit(1)).first()
+            return hi[0] - RANK_STEP if hi else RANK_STEP
+        hi = self.session.execute(
+            col.where(tuple_(Task.sort_rank, Task.id) > tuple_(lo[0], lo[1]))
+            .order_by(Task.sort_rank, Task.id).limit(1)
+        ).first()
+        if hi is None:
+            return lo[0] + RANK_STEP
+        mid = (lo[0] + hi[0]) / 2
+        # Eşit değerler (toplu işlem) veya hassasiyet sonu: ortada yer yok
+        if not (lo[0] < mid < hi[0]):
+            return None
+        return mid
+
+    # --- TOPLU İŞLEMLER: hepsi tek transaction, tek commit; bildirimler commit'ten sonra ---
+    def bulk_create(self, items: list[dict]) -> list[int]:
+        """items: create_task argümanlarıyla aynı anahtarlar (title zorunlu). Yeni id'leri döner."""
+        tasks = []
+        top = self._top_rank("todo")
+        for it in items:
+            title = (it.get("title") or "").strip()
+            if not title:
+                continue
+            task = Task(
+                title=title,
+                description=(it.get("description") or "").strip(),
+                due_at=it.get("due_at"),
+                priority=it.get("priority", "Orta"),
+                tags=it.get("tags", ""),
+                project=_clean_project(it.get("project")),
+                reminders=it.get("reminders", DEFAULT_REMINDERS),
+                status="todo",
+                is_done=False,
+            )
+            for st in it.get("subtasks") or []:
+                if st.strip():
+                    task.subtasks.append(SubTask(title=st.strip(), is_done=False))
+            tasks.append(task)
+        if not tasks:
+            return []
+        # Listedeki sıra kolonda da korunsun: ilk öğe en üstte
+        for i, task in enumerate(tasks):
+            task.sort_rank = top - RANK_STEP * (len(tasks) - 1 - i)
+        ids: list[int] = []
+        with self._batch("created", ids):
+            self.session.add_all(tasks)
+            self.session.flush()
+            changelog.log_subtasks(self.session.connection(), [t.id for t in tasks if t.subtasks], created=True)
+            self._set_tags({t.id: t.tags for t in tasks})
+            ids += [t.id for t in tasks]
+        return ids
+
+    def import_tasks(self, records: list[dict]) -> list[int]:
+        """Dışarıdan gelen bir parça kaydı tek transaction'da ekler (cli.py import).
+
+        Kayıtlar Task sütunlarını (status, is_done, created_at dahil) ve isteğe bağlı
+        subtasks listesini ("başlık" ya da (başlık, bitti_mi)) taşır. ORM nesnesi kurulmaz:
+        görevler RETURNING'li tek executemany, alt görevler ve etiket bağları birer tane.
+        Görevler kolonlarının sonuna, geliş sırasıyla eklenir.
+        """
+        if not records:
+            return []
+        now = datetime.utcnow()
+        conn = self.session.connection()
+        ranks: dict[str, float] = {}
+        rows = []
+        for rec in records:
+            is_done = bool(rec.get("is_done", rec.get("status") == "done"))
+            status = rec.get("status") or ("done" if is_done else "todo")
+            rank = _next_rank(conn, ranks, status)
+            rows.append(dict(
+                title=rec["title"].strip(),
+                description=(rec.get("description") or "").strip(),
+                status=status,
+                priority=rec.get("priority") or "Orta",
+                tags=", ".join(split_tags(rec.get("tags"))),
+                project=_clean_project(rec.get("project")),
+                due_at=rec.get("due_at"),
+                reminders=rec.get("reminders") if rec.get("reminders") is not None else DEFAULT_REMINDERS,
+                is_done=is_done,
+                sort_rank=rank,
+                created_at=rec.get("created_at") or now,
+                updated_at=rec.get("updated_at") or rec.get("created_at") or now,
+            ))
+        with self._batch("created"):
+            # Core üzerinden: ORM toplu ekleme satırları farklı sütun kümelerine bölüp küçük parçalar yollar.
+            # SQLite'ta sıralı RETURNING satır satır çalışır; bunun yerine ilk satır tek başına eklenir
+            # (yazma kilidi artık bizde), kalanlar ardışık id'lerle tek executemany.
+            with fts.deferred_insert_index(conn):
+                first_id = conn.execute(insert(Task.__table__), rows[0]).inserted_primary_key[0]
+                ids = list(range(first_id, first_id + len(rows)))
+                if len(rows) > 1:
+                    for task_id, row in zip(ids[1:], rows[1:]):
+                        row["id"] = task_id
+                    conn.execute(insert(Task.__table__), rows[1:])
+                subtasks = []
+                for task_id, rec in zip(ids, records):
+                    for st in rec.get("subtasks") or ():
+                        title, done = (st, False) if isinstance(st, str) else st
+                        if title.strip():
+                            subtasks.append({"task_id": task_id, "title": title.strip(), "is_done": bool(done)})
+                if subtasks:
+                    conn.execute(insert(SubTask.__table__), subtasks)
+                    changelog.log_subtasks(conn, list(dict.fromkeys(st["task_id"] for st in subtasks)), created=True)
+            self._set_tags({task_id: row["tags"] for task_id, row in zip(ids, rows) if row["tags"]})
+        return ids
+
+    def export_chunks(self, chunk_size: int = 2000) -> Iterator[list[dict]]:
+        """Tüm görevleri id sırasıyla parça parça okur (cli.py export).
+
+        Görevler sunucu tarafı imleçle akar (yield_per); her parçanın alt görevleri
+        id aralığıyla tek sorguda gelir. Bellekte en fazla bir parça tutulur.
+        """
+        stmt = select(
+            Task.id, Task.title, Task.description, Task.status, Task.priority, Task.tags, Task.project,
+            Task.due_at, Task.reminders, Task.is_done, Task.created_at, Task.updated_at,
+        ).order_by(Task.id)
+        result = self.session.execute(stmt, execution_options={"yield_per": chunk_size})
+        for part in result.partitions():
+            records = [dict(r._mapping, subtasks=[]) for r in part]
+            by_id = {rec["id"]: rec for rec in records}
+            subs = (
+                select(SubTask.task_id, SubTask.title, SubTask.is_done)
+                .where(SubTask.task_id.between(records[0]["id"], records[-1]["id"]))
+                .order_by(SubTask.task_id, SubTask.id)
+            )
+            for task_id, title, is_done in self.session.execute(subs):
+                if task_id in by_id:
+                    by_id[task_id]["subtasks"].append((title, is_done))
+            yield records
+
+    # --- ARŞİV: eski bitmiş görevler sıcak tablonun dışında; liste, bildirim ve istatistikler görmez ---
+    def archive_done(self, before: datetime) -> int:
+        """updated_at'i (UTC) before'dan eski bitmiş görevleri alt görevleriyle arşive taşır.
+
+        Tek transaction; satırlar INSERT ... SELECT ile SQL içinde kopyalanır, arşivin arama
+        indeksi en sonda tek seferde eklenir. Taşınan görev sayısını döner (0 ise bildirim yok).
+        """
+        ids = self.session.execute(
+            # Serinin ilk görevi kuralı taşıdığı için bitmiş olsa da yerinde kalır
+            select(Task.id).where(Task.is_done == True, Task.updated_at < before, Task.recurrence.is_(None))
+        ).scalars().all()
+        if not ids:
+            return 0
+        now = datetime.utcnow()
+        task_cols = [Task.__table__.c[name] for name in _ARCHIVED_COLUMNS]
+        conn = self.session.connection()
+        # Arşiv yerel bir depolama katmanı; silme olarak eşitlenmez (diğer cihaz kendi süresiyle arşivler)
+        with self._batch("deleted", ids), changelog.muted(conn):
+            # Eklenen arşiv satırları: yazma kilidi alındıktan sonraki en büyük id'nin üstü
+            last_max = select(func.coalesce(func.max(ArchivedTask.id), 0))
+            first = last = conn.execute(last_max).scalar_one()
+            for chunk in _chunks(ids):
+                conn.execute(insert(ArchivedTask).from_select(
+                    ["task_id", *_ARCHIVED_COLUMNS, "archived_at"],
+                    select(Task.id, *task_cols, literal(now, DateTime)).where(Task.id.in_(chunk)).order_by(Task.id),
+                ))
+                conn.execute(insert(ArchivedSubTask).from_select(
+                    ["archive_id", "title", "is_done"],
+                    select(ArchivedTask.id, SubTask.title, SubTask.is_done)
+                    .join(SubTask, SubTask.task_id == ArchivedTask.task_id)
+                    .where(ArchivedTask.id > last, SubTask.task_id.in_(chunk))
+                    .order_by(SubTask.id),
+                ))
+                last = conn.execute(last_max).scalar_one()
+                # Silmeler oturum üzerinden: kimlik haritasındaki nesneler de düşsün (bulk_delete gibi)
+                self.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(chunk)))
+                # Önce görev: alt görev silme tetikleyicisi artık olmayan FTS satırına dokunmaz
+                self.session.execute(delete(Task).where(Task.id.in_(chunk)))
+                self.session.execute(delete(SubTask).where(SubTask.task_id.in_(chunk)))
+            fts.index_archive(conn, first)
+        return len(ids)
+
+    def restore_tasks(self, archive_ids: Sequence[int]) -> list[int]:
+        """Arşivdeki görevleri alt görev ve etiketleriyle geri taşır; görev id'lerini döner.
+
+        Eski id boştaysa korunur, doluysa yeni id verilir. Görevler kolonlarının sonuna eklenir;
+        updated_at şimdi olur ki bir sonraki otomatik arşivleme onları hemen geri taşımasın.
+        """
+        restored: list[int] = []
+        if not archive_ids:
+            return restored
+        now = datetime.utcnow()
+        conn = self.session.connection()
+        # uid korunur; arşivleme gibi geri yükleme de eşitlenmez
+        with self._batch("created", restored), changelog.muted(conn):
+            ranks: dict[str, float] = {}
+            for chunk in _chunks(archive_ids):
+                rows = conn.execute(
+                    select(ArchivedTask).where(ArchivedTask.id.in_(chunk)).order_by(ArchivedTask.id)
+                ).mappings().all()
+                if not rows:
+                    continue
+                taken = set(conn.execute(
+                    select(Task.id).where(Task.id.in_([r["task_id"] for r in rows]))
+                ).scalars())
+                subtasks: dict[int, list[tuple[str, bool]]] = {}
+                for archive_id, title, is_done in conn.execute(
+                    select(ArchivedSubTask.archive_id, ArchivedSubTask.title, ArchivedSubTask.is_done)
+                    .where(ArchivedSubTask.archive_id.in_(chunk))
+                    .order_by(ArchivedSubTask.archive_id, ArchivedSubTask.id)
+                ):
+                    subtasks.setdefault(archive_id, []).append((title, is_done))
+                # Geri yükleme elle ve azar azar yapılır; satır tetikleyicileri indeksi günceller
+                sub_rows, tags = [], {}
+                for r in rows:
+                    values = {name: r[name] for name in _ARCHIVED_COLUMNS}
+                    values.update(sort_rank=_next_rank(conn, ranks, r["status"]), updated_at=now, uid=r["uid"] or new_uid())
+                    if r["task_id"] not in taken:
+                        values["id"] = r["task_id"]
+                    task_id = conn.execute(insert(Task.__table__), values).inserted_primary_key[0]
+                    taken.add(task_id)
+                    restored.append(task_id)
+                    tags[task_id] = r["tags"]
+                    sub_rows += [{"task_id": task_id, "title": title, "is_done": is_done}
+                                 for title, is_done in subtasks.get(r["id"], ())]
+                if sub_rows:
+                    conn.execute(insert(SubTask.__table__), sub_rows)
+                self._set_tags({task_id: t for task_id, t in tags.items() if t})
+                found = [r["id"] for r in rows]
+                fts.unindex_archive(conn, found)
+                conn.execute(delete(ArchivedSubTask).where(ArchivedSubTask.archive_id.in_(found)))
+                conn.execute(delete(ArchivedTask).where(ArchivedTask.id.in_(found)))
+        return restored
+
+    def list_archived(self, search_text: str = "", limit: int = ARCHIVE_PAGE, offset: int = 0) -> list[ArchivedRow]:
+        """Arşivlenmiş görevler, en son arşivlenen önce; arama arşivin kendi FTS indeksinde"""
+        total = (
+            select(func.count()).select_from(ArchivedSubTask)
+            .where(ArchivedSubTask.archive_id == ArchivedTask.id).correlate(ArchivedTask).scalar_subquery()
+        )
+        stmt = self._archive_filter(select(
+            ArchivedTask.id, ArchivedTask.task_id, ArchivedTask.title, ArchivedTask.tags, ArchivedTask.project,
+            ArchivedTask.created_at, ArchivedTask.updated_at, ArchivedTask.archived_at, total,
+        ), search_text)
+        if stmt is None:
+            return []
+        stmt = stmt.order_by(ArchivedTask.archived_at.desc(), ArchivedTask.id.desc()).offset(offset).limit(limit)
+        return [ArchivedRow(*r) for r in self.session.execute(stmt)]
+
+    def count_archived(self, search_text: str = "") -> int:
+        stmt = self._archive_filter(select(func.count()).select_from(ArchivedTask), search_text)
+        return 0 if stmt is None else self.session.execute(stmt).scalar_one()
+
+    def _archive_filter(self, stmt, search_text: str):
+        s = search_text.strip()
+        if not s:
+            return stmt
+        if fts.fts_available(self.session.get_bind()):
+            query = fts.build_match_query(s)
+            if not query:
+                return None
+            return stmt.where(ArchivedTask.id.in_(
+                select(fts.archive_fts_table.c.rowid).where(fts.match_clause(query, fts.ARCHIVE_FTS_TABLE))
+            ))
+        like = f"%{s}%"
+        return stmt.where(or_(
+            ArchivedTask.title.like(like), ArchivedTask.description.like(like), ArchivedTask.tags.like(like)
+        ))
+
+    def bulk_set_status(self, task_ids: list[int], new_status: str) -> None:
+        values = dict(status=new_status, is_done=(new_status == "done"), updated_at=datetime.utcnow())
+        # Hepsi hedef kolonun en üstüne; eşit sort_rank'ler id ile sıralanır
+        values["sort_rank"] = self._top_rank(new_status)
+        with self._batch("updated", task_ids):
+            for chunk in _chunks(task_ids):
+                self.session.execute(update(Task).where(Task.id.in_(chunk)).values(**values))
+
+    def bulk_set_due(self, task_ids: list[int], due_at: datetime | None) -> None:
+        with self._batch("updated", task_ids):
+            for chunk in _chunks(task_ids):
+                self.session.execute(
+                    update(Task).where(Task.id.in_(chunk)).values(due_at=due_at, updated_at=datetime.utcnow())
+                )
+
+    def bulk_retag(self, task_ids: list[int], add: list[str] = (), remove: list[str] = ()) -> None:
+        """Etiket ekler/çıkarır; her görevin kendi etiket listesi korunur (executemany)"""
+        drop = {tag_key(t) for t in remove}
+        now = datetime.utcnow()
+        changed: list[int] = []
+        with self._batch("updated", changed):
+            for chunk in _chunks(task_ids):
+                params = []
+                for task_id, tags in self.session.execute(select(Task.id, Task.tags).where(Task.id.in_(chunk))):
+                    current = split_tags(tags)
+                    new = [t for t in current if tag_key(t) not in drop]
+                    new += [t for t in add if tag_key(t) not in {tag_key(x) for x in new}]
+                    if new != current:
+                        params.append({"id": task_id, "tags": ", ".join(new), "updated_at": now})
+                if params:
+                    self.session.execute(update(Task), params)
+                    self._set_tags({p["id"]: p["tags"] for p in params})
+                    changed += [p["id"] for p in params]
+
+    def bulk_delete(self, task_ids: list[int]) -> None:
+        ids = [*task_ids, *self._future_occurrences(task_ids, datetime.now())]
+        with self._batch("deleted", ids):
+            self._delete_rows(ids)
+
+    def _delete_rows(self, task_ids: list[int]) -> None:
+        for chunk in _chunks(task_ids):
+            self.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(chunk)))
+            # Önce görev: alt görev tetikleyicileri (FTS, günlük) artık olmayan göreve yazmaz
+            self.session.execute(delete(Task).where(Task.id.in_(chunk)))
+            self.session.execute(delete(SubTask).where(SubTask.task_id.in_(chunk)))
+
+    # --- TEKRARLAYAN GÖREVLER: örnekler sadece horizon()'a kadar satır olarak oluşturulur ---
+    def materialize_occurrences(self, until: datetime | None = None) -> int:
+        """Serilerin until'e (varsayılan recurrence.horizon()) kadarki örneklerini ekler.
+
+        Sadece materialized_until'i geride kalan seriler okunur (ix_tasks_recurring); horizon gün
+        başına hizalı olduğundan gün içindeki tekrar çağrılar hiçbir şey yazmaz. Eklenen örnek
+        sayısını döner; dinleyiciler her örnek için uyarılır.
+        """
+        until = until or horizon()
+        series = self.session.execute(
+            select(Task).where(Task.recurrence.is_not(None), Task.materialized_until < until)
+            .options(selectinload(Task.subtasks))
+        ).scalars().all()
+        if not series:
+            return 0
+        try:
+            created = self._expand_series(series, until)
+            self._commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        self._notify_each("created", created)
+        return len(created)
+
+    def _expand_series(self, series: list[Task], until: datetime) -> list[int]:
+        """Serilerin (materialized_until, until) aralığındaki örneklerini ekler (çağıranın transaction'ında).
+
+        Örnek, serinin başlık/etiket/proje/hatırlatma ve alt görevlerinin açık bir kopyasıdır.
+        Bugünden önceki örnekler oluşturulmaz (ör. geçmiş tarihli yeni seri). uid seriden ve
+        tarihten türer; eşitlemeyle zaten gelmiş örnekler atlanır.
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        rank = self.session.execute(
+            select(func.coalesce(func.max(Task.sort_rank), 0.0)).where(Task.status == "todo")
+        ).scalar_one()
+        planned = []
+        for s in series:
+            try:
+                rule = parse_rule(s.recurrence)
+            except RuleError:
+                s.materialized_until = ENDED  # bozuk kural bir daha denenmesin
+                continue
+            after = max(s.materialized_until or s.due_at, today - timedelta(microseconds=1))
+            times, ended = expand(rule, s.due_at, after, until)
+            planned += [(s, due, occurrence_uid(s.uid, due)) for due in times]
+            s.materialized_until = ENDED if ended else until
+        skip = self._skipped_occurrences(series, [uid for _, _, uid in planned]) if planned else set()
+        rows = []
+        for s, due, uid in planned:
+            if uid in skip:
+                continue
+            rank += RANK_STEP
+            rows.append(Task(
+                title=s.title, description=s.description, priority=s.priority, tags=s.tags, project=s.project,
+                reminders=s.reminders, due_at=due, status="todo", is_done=False, sort_rank=rank,
+                series_id=s.id, uid=uid, subtasks=[SubTask(title=st.title, is_done=False) for st in s.subtasks],
+            ))
+        if rows:
+            self.session.add_all(rows)
+            self.session.flush()
+            changelog.log_subtasks(self.session.connection(), [t.id for t in rows if t.subtasks], created=True)
+            self._set_tags({t.id: t.tags for t in rows if t.tags})
+        return [t.id for t in rows]
+
+    def _skipped_occurrences(self, series: list[Task], uids: list[str]) -> set[str]:
+        """Oluşturulmayacak örnekler: zaten var olanlar ve serinin kuralı son değiştikten sonra silinenler
+        (başka cihazda tek tek silinen örnek, bu cihaz o güne gelince geri oluşmasın)"""
+        skip, deleted = set(), {}
+        for chunk in _chunks(uids):
+            skip.update(self.session.execute(select(Task.uid).where(Task.uid.in_(chunk))).scalars())
+            deleted.update(self.session.execute(
+                select(Change.uid, func.max(Change.changed_at))
+                .where(Change.uid.in_(chunk), Change.field == DELETED).group_by(Change.uid)
+            ).all())
+        if deleted:
+            reset: dict[str, str] = {}
+            for chunk in _chunks([s.uid for s in series]):
+                reset.update(self.session.execute(
+                    select(Change.uid, func.max(Change.changed_at))
+                    .where(Change.uid.in_(chunk), Change.field.in_((NEW, "recurrence", "due_at")))
+                    .group_by(Change.uid)
+                ).all())
+            skip.update(uid for uid, at in deleted.items() if at > reset.get(uid.rpartition("@")[0], ""))
+        return skip
+
+    def _future_occurrences(self, series_ids: list[int], now: datetime) -> list[int]:
+        """Serilerin henüz bitmemiş ve zamanı gelmemiş örnekleri (ix_tasks_series)"""
+        ids = []
+        for chunk in _chunks(series_ids):
+            ids += self.session.execute(
+                select(Task.id).where(Task.series_id.in_(chunk), Task.due_at >= now, Task.is_done == False)
+            ).scalars()
+        return ids
+
+    # --- EŞİTLEME: değişiklik günlüğü (db/changelog.py), alan bazında son yazan kazanır ---
+    def sync_device(self) -> str:
+        return self.session.execute(select(SyncState.device).where(SyncState.id == 1)).scalar_one()
+
+    def sync_cursors(self, url: str) -> tuple[int, int]:
+        """(pull_cursor, push_cursor); sunucuyla hiç eşitlenmediyse (0, 0)"""
+        row = self.session.execute(
+            select(SyncPeer.pull_cursor, SyncPeer.push_cursor).where(SyncPeer.url == url)
+        ).first()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def set_sync_cursors(self, url: str, pull: int | None = None, push: int | None = None) -> None:
+        values = {"synced_at": datetime.utcnow()}
+        if pull is not None:
+            values["pull_cursor"] = pull
+        if push is not None:
+            values["push_cursor"] = push
+        stmt = sqlite_insert(SyncPeer).values(url=url, **values)
+        self.session.execute(stmt.on_conflict_do_update(index_elements=["url"], set_=values))
+        self._commit()
+
+    def changes_since(self, cursor: int, limit: int = SYNC_BATCH, origin: str | None = None,
+                      exclude_origin: str | None = None) -> ChangeBatch:
+        """Günlükte cursor'dan sonraki en fazla limit satır, seq sırasıyla.
+
+        origin verilirse sadece o cihazın, exclude_origin verilirse diğer cihazların değişiklikleri
+        döner; imleç her durumda okunan son satıra ilerler. Parça içinde ezilen alan değişiklikleri
+        (aynı alana daha yeni yazma ya da görevin sonradan silinmesi) gönderilmez; aynı saatli
+        yazmalardan (tek ifade, tek transaction) sadece son seq kalır.
+        """
+        rows = self.session.execute(
+            select(Change.uid, Change.field, Change.value, Change.changed_at, Change.origin, Change.seq)
+            .where(Change.seq > cursor).order_by(Change.seq).limit(limit)
+        ).all()
+        if not rows:
+            return ChangeBatch([], cursor, False)
+        picked = [r for r in rows
+                  if (origin is None or r.origin == origin) and (exclude_origin is None or r.origin != exclude_origin)]
+        latest: dict[tuple[str, str], tuple[str, str, int]] = {}
+        for r in picked:
+            if r.field != NEW:
+                latest[(r.uid, r.field)] = max(latest.get((r.uid, r.field), (*_NEVER, 0)),
+                                               (r.changed_at, r.origin, r.seq))
+        changes = []
+        for r in picked:
+            at = (r.changed_at, r.origin)
+            if r.field not in (NEW, DELETED) and (
+                (*at, r.seq) != latest[(r.uid, r.field)] or at <= latest.get((r.uid, DELETED), _NEVER)[:2]
+            ):
+                continue
+            changes.append([r.uid, r.field, None if r.value is None else json.loads(r.value), r.changed_at, r.origin])
+        return ChangeBatch(changes, rows[-1].seq, len(rows) == limit)
+
+    def apply_changes(self, changes: Sequence[Sequence]) -> int:
+        """Uzak değişiklikleri [uid, field, value, changed_at, origin] gönderenin sırasıyla uygular.
+
+        Her alan için (changed_at, origin) daha büyük olan kazanır; eşit saat aynı cihazın sıradaki
+        yazmasıdır. Silme, görevin oluşturulmasından yeniyse uygulanır. Burada olmayan görevin alan
+        değişikliği (ör. bu cihazda arşivde) atlanır. Uygulananlar kendi saat ve kaynaklarıyla
+        günlüğe eklenir ki başka cihazlara aktarılsın; tetikleyiciler bu sırada susturulur.
+        Günlüğe eklenen satır sayısını döner.
+        """
+        if not changes:
+            return 0
+        uids = list(dict.fromkeys(c[0] for c in changes))
+        log: list[dict] = []
+        conn = self.session.connection()
+        with self._batch("updated"), changelog.muted(conn):
+            clocks = self._field_clocks(uids)
+            rows = self._sync_rows(uids)
+            reseed: set[int] = set()
+            for uid, field, value, at, origin in changes:
+                key = (at, origin)
+                if field == DELETED:
+                    if key < clocks.get((uid, NEW), _NEVER) or key == clocks.get((uid, DELETED)):
+                        continue
+                    if uid in rows:
+                        self._delete_rows([rows.pop(uid)["id"]])
+                    clocks[(uid, DELETED)] = key
+                    log.append(_log_row(uid, field, value, at, origin))
+                    continue
+                if uid not in rows:
+                    if field != NEW or key < clocks.get((uid, DELETED), _NEVER):
+                        continue
+                    rows[uid] = self._insert_synced(uid, value)
+                    clocks[(uid, NEW)] = key
+                    log.append(_log_row(uid, field, value, at, origin))
+                    if rows[uid]["recurrence"]:
+                        reseed.add(rows[uid]["id"])
+                    continue
+                row = rows[uid]
+                changed = {}
+                for name, wire in (value.items() if field == NEW else ((field, value),)):
+                    if name not in SYNC_FIELDS:
+                        continue
+                    local = max(clocks.get((uid, name), _NEVER), clocks.get((uid, NEW), _NEVER))
+                    new = _from_wire(name, wire)
+                    if key < local or (new is None and name not in _NULLABLE_FIELDS):
+                        continue
+                    if new != row[name]:
+                        changed[name] = new
+                    elif key == local:
+                        continue  # aynı değişiklik ikinci kez geldi
+                    clocks[(uid, name)] = key
+                    log.append(_log_row(uid, name, wire, at, origin))
+                if changed:
+                    self._write_synced(row, changed, reseed)
+            if log:
+                conn.execute(insert(Change), log)
+                newest = max(entry["changed_at"] for entry in log)
+                conn.execute(update(SyncState).where(SyncState.id == 1)
+                             .values(clock=func.max(SyncState.clock, newest)))
+            # Günlükten sonra: örnek atlama kararı serinin yeni kural saatine bakar
+            if reseed:
+                self._reseed_series(reseed)
+        return len(log)
+
+    def _field_clocks(self, uids: list[str]) -> dict[tuple[str, str], tuple[str, str]]:
+        """(uid, alan) -> günlükteki en yeni (changed_at, origin)"""
+        clocks = {}
+        for chunk in _chunks(uids):
+            stmt = (
+                select(Change.uid, Change.field, func.max(Change.changed_at + " " + Change.origin))
+                .where(Change.uid.in_(chunk)).group_by(Change.uid, Change.field)
+            )
+            for uid, field, key in self.session.execute(stmt):
+                at, _, origin = key.rpartition(" ")
+                clocks[(uid, field)] = (at, origin)
+        return clocks
+
+    def _sync_rows(self, uids: list[str]) -> dict[str, dict]:
+        """uid -> görevin eşitlenen alanlarının şimdiki değerleri (id, series uid'si ve alt görevlerle)"""
+        series = aliased(Task)
+        cols = [Task.__table__.c[name] for name in changelog.FIELDS]
+        rows: dict[str, dict] = {}
+        for chunk in _chunks(uids):
+            stmt = (
+                select(Task.id, Task.uid, *cols, series.uid.label("series"))
+                .outerjoin(series, series.id == Task.series_id).where(Task.uid.in_(chunk))
+            )
+            for r in self.session.execute(stmt).mappings():
+                rows[r["uid"]] = dict(r, subtasks=[])
+        by_id = {r["id"]: r for r in rows.values()}
+        for chunk in _chunks(list(by_id)):
+            for task_id, title, is_done in self.session.execute(
+                select(SubTask.task_id, SubTask.title, SubTask.is_done)
+                .where(SubTask.task_id.in_(chunk)).order_by(SubTask.task_id, SubTask.id)
+            ):
+                by_id[task_id]["subtasks"].append((title, bool(is_done)))
+        return rows
+
+    def _insert_synced(self, uid: str, value: dict) -> dict:
+        """Uzakta oluşturulan görevi ekler (kolonunun en üstüne); _sync_rows biçiminde satırını döner"""
+        row = {name: _from_wire(name, value.get(name)) for name in SYNC_FIELDS}
+        values = {name: row[name] for name in changelog.FIELDS if row[name] is not None}
+        values["project"] = _clean_project(row["project"])
+        status = values.setdefault("status", "todo")
+        task_id = self.session.execute(insert(Task.__table__).values(
+            uid=uid, sort_rank=self._top_rank(status), series_id=self._task_id(row["series"]),
+            materialized_until=row["due_at"] if row["recurrence"] else None, **values,
+        )).inserted_primary_key[0]
+        if row["subtasks"]:
+            self.session.execute(insert(SubTask), [
+                {"task_id": task_id, "title": title, "is_done": done} for title, done in row["subtasks"]
+            ])
+        if row["tags"]:
+            self._set_tags({task_id: row["tags"]})
+        return dict(row, id=task_id, uid=uid, subtasks=row["subtasks"] or [])
+
+    def _write_synced(self, row: dict, changed: dict, reseed: set[int]) -> None:
+        values = {name: v for name, v in changed.items() if name in changelog.FIELDS}
+        if "project" in values:
+            values["project"] = _clean_project(values["project"])
+        if "status" in values:
+            values["sort_rank"] = _top_rank_expr(values["status"])
+        if "series" in changed:
+            values["series_id"] = self._task_id(changed["series"])
+        self.session.execute(
+            update(Task).where(Task.id == row["id"]).values(updated_at=datetime.utcnow(), **values)
+        )
+        if "tags" in changed:
+            self._set_tags({row["id"]: changed["tags"]})
+        if "subtasks" in changed:
+            self.session.execute(delete(SubTask).where(SubTask.task_id == row["id"]))
+            if changed["subtasks"]:
+                self.session.execute(insert(SubTask), [
+                    {"task_id": row["id"], "title": title, "is_done": done} for title, done in changed["subtasks"]
+                ])
+        row.update(changed)
+        if ("recurrence" in changed or "due_at" in changed) and (row["recurrence"] or "recurrence" in changed):
+            reseed.add(row["id"])
+
+    def _reseed_series(self, task_ids: set[int]) -> None:
+        """Kuralı ya da başlangıcı uzaktan değişen serilerin gelecekteki örneklerini yeniden kurar.
+
+        Yerel örnekler sessizce silinir; gönderen cihazın kendi silme ve ekleme kayıtları da gelir.
+        """
+        ids = list(task_ids)
+        self._delete_rows(self._future_occurrences(ids, datetime.now()))
+        series = []
+        for chunk in _chunks(ids):
+            series += self.session.execute(
+                select(Task).where(Task.id.in_(chunk)).options(selectinload(Task.subtasks))
+            ).scalars().all()
+        for s in series:
+            s.materialized_until = s.due_at if s.recurrence and s.due_at else None
+        self._expand_series([s for s in series if s.materialized_until is not None], horizon())
+
+    def _task_id(self, uid: str | None) -> int | None:
+        if uid is None:
+            return None
+        return self.session.execute(select(Task.id).where(Task.uid == uid)).scalar_one_or_none()
+
+    # --- ETİKETLER: Task.tags metni görüntü içindir, filtreler task_tags üzerinden ---
+    def _set_tags(self, tags_by_task: dict[int, str]) -> None:
+        """task_tags ilişkisini görevlerin etiket metniyle eşitler (çağıranın transaction'ında)"""
+        names: dict[str, str] = {}
+        for tags in tags_by_task.values():
+            for name in split_tags(tags):
+                names.setdefault(tag_key(name), name)
+        ids = self._tag_ids(names)
+        for chunk in _chunks(list(tags_by_task)):
+            self.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(chunk)))
+        links = [{"task_id": task_id, "tag_id": ids[tag_key(name)]}
+                 for task_id, tags in tags_by_task.items() for name in split_tags(tags)]
+        if links:
+            self.session.execute(insert(TaskTag), links)
+
+    def _tag_ids(self, names: dict[str, str]) -> dict[str, int]:
+        """{key: ad} -> {key: id}; olmayan etiketler ilk görülen yazılışla eklenir"""
+        if not names:
+            return {}
+        self.session.execute(
+            sqlite_insert(Tag).on_conflict_do_nothing(index_elements=["key"]),
+            [{"key": k, "name": n} for k, n in names.items()],
+        )
+        ids: dict[str, int] = {}
+        for chunk in _chunks(list(names)):
+            ids.update(self.session.execute(select(Tag.key, Tag.id).where(Tag.key.in_(chunk))).all())
+        return ids
+
+    def tag_counts(self, search_text: str = "", filter_mode: str = "all",
+                   tags: Sequence[str] = (), match_all: bool = True, project: str | None = None) -> dict[str, int]:
+        """Etiket facet'leri: filtreye uyan görevlerde her etiketin görev sayısı (tek GROUP BY).
+
+        Filtre yoksa sadece ix_task_tags_tag_task taranır; en kalabalık etiket önce.
+        """
+        # Ad, tag_id'ye bağlı olduğu için gruplamaya girmez; etiket başına tek PK araması
+        stmt = (
+            select(Tag.name, func.count()).select_from(TaskTag).join(Tag, Tag.id == TaskTag.tag_id)
+            .group_by(TaskTag.tag_id)
+        )
+        if search_text.strip() or filter_mode != "all" or tags or project is not None:
+            filtered = self._apply_filters(select(Task.id), search_text, filter_mode, "default", tags, match_all,
+                                           project)
+            if filtered is None:
+                return {}
+            stmt = stmt.where(TaskTag.task_id.in_(filtered[0]))
+        rows = self.session.execute(stmt).all()
+        return dict(sorted(rows, key=lambda r: (-r[1], tag_key(r[0]))))
+
+    def _commit(self) -> None:
+        if self._pending_events is None:
+            self.session.commit()
+        else:
+            self.session.flush()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """İçindeki tüm yazmalar tek commit'le uygulanır; hata olursa hiçbiri.
+
+        Dinleyiciler commit'ten sonra, her (kind, task_id) için bir kez uyarılır.
+        """
+        if self._pending_events is not None:
+            yield  # iç içe: dıştaki commit eder
+            return
+        self._pending_events = []
+        try:
+            yield
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            events, self._pending_events = self._pending_events, None
+        for kind, task_id in dict.fromkeys(events):
+            self._notify(kind, task_id)
+
+    @contextmanager
+    def _batch(self, kind: str, task_ids: list[int] | None = None):
+        """Hata olursa hiçbir değişiklik kalmaz; başarılıysa dinleyiciler task_ids'deki her görev için
+        (liste blok içinde de doldurulabilir), task_ids None ise bir kez None ile uyarılır"""
+        try:
+            yield
+            self._commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        if task_ids is None:
+            self._notify(kind, None)
+        else:
+            self._notify_each(kind, task_ids)
 
     def get_task(self, task_id: int) -> Task | None:
-        return self.session.execute(select(Task).where(Task.id == task_id)).scalars().first()
+        """Tam görev nesnesi (düzenleyici için).
+
+        Yazmaları BackgroundWriter başka bir oturumda commit eder; bu oturumun kimlik
+        haritasında kalmış eski nesne (ve alt görevleri) veritabanından tazelenir.
+        """
+        stmt = (select(Task).where(Task.id == task_id).options(selectinload(Task.subtasks))
+                .execution_options(populate_existing=True))
+        return self.session.execute(stmt).scalars().first()
+
+    def get_task_row(self, task_id: int) -> TaskRow | None:
+        """Tek görevin hafif satırı (TaskStore değişiklikleri buradan okur)"""
+        r = self.session.execute(_row_select().where(Task.id == task_id)).first()
+        return TaskRow(*r) if r else None
+
+    def get_task_rows(self, task_ids: Sequence[int]) -> list[TaskRow]:
+        """Birden çok görevin hafif satırları (toplu değişiklikler için); olmayanlar atlanır"""
+        rows = []
+        for chunk in _chunks(task_ids):
+            rows += [TaskRow(*r) for r in self.session.execute(_row_select().where(Task.id.in_(chunk)))]
+        return rows
 
     def get_projects(self) -> list[str]:
-        return []
+        """Görevi olan projeler, ada göre (ix_tasks_project_order üzerinde DISTINCT)"""
+        stmt = select(Task.project).distinct().where(Task.project.is_not(None), Task.project != "")
+        return sorted(self.session.execute(stmt).scalars(), key=str.lower)
+
+    def project_counts(self) -> dict[str, tuple[int, int]]:
+        """Proje başına (açık, biten) görev sayısı; tek GROUP BY, ada göre sıralı"""
+        stmt = (
+            select(Task.project, Task.is_done, func.count())
+            .where(Task.project.is_not(None), Task.project != "")
+            .group_by(Task.project, Task.is_done)
+        )
+        counts: dict[str, list[int]] = {}
+        for project, is_done, n in self.session.execute(stmt):
+            counts.setdefault(project, [0, 0])[1 if is_done else 0] = n
+        return {p: (c[0], c[1]) for p, c in sorted(counts.items(), key=lambda r: r[0].lower())}
+
+    def list_subtasks(self, task_id: int) -> list[SubTaskRow]:
+        """Kart açıldığında: sadece o görevin alt görevleri"""
+        stmt = (
+            select(SubTask.id, SubTask.task_id, SubTask.title, SubTask.is_done)
+            .where(SubTask.task_id == task_id).order_by(SubTask.id)
+        )
+        return [SubTaskRow(*r) for r in self.session.execute(stmt)]
+
+    def list_reminder_window(self, start: datetime, end: datetime) -> list[tuple]:
+        """Bildirim servisi için: bitiş zamanı [start, end) aralığındaki bitmemiş görevler.
+
+        (id, title, due_at, reminders) satırları; ix_tasks_open_due üzerinde aralık araması.
+        """
+        stmt = (
+            select(Task.id, Task.title, Task.due_at, Task.reminders)
+            .where(Task.is_done == False, Task.due_at >= start, Task.due_at < end)
+        )
+        return [tuple(r) for r in self.session.execute(stmt)]
+
+    def list_tasks(self, search_text: str = "", filter_mode: str = "all", order: str = "default",
+                   tags: Sequence[str] = (), match_all: bool = True, project: str | None = None) -> list[Task]:
+        """ORM nesneleri (alt görevler selectinload ile); görünümler list_task_page kullanır.
+
+        tags verilirse tam etiket eşleşmesi: match_all=True hepsi (VE), False herhangi biri (VEYA).
+        project verilirse sadece o projenin görevleri (None = hepsi).
+        """
+        stmt = self._filtered(select(Task).options(selectinload(Task.subtasks)), search_text, filter_mode, order,
+                              tags, match_all, project)
+        if stmt is None:
+            return []
+        return list(self.session.execute(stmt).scalars().all())
+
+    def list_task_rows(self, search_text: str = "", filter_mode: str = "all", order: str = "default",
+                       tags: Sequence[str] = (), match_all: bool = True, project: str | None = None) -> list[TaskRow]:
+        """Hafif satırlar: JOIN yok, alt görevler sadece sayı olarak"""
+        stmt = self._filtered(_row_select(), search_text, filter_mode, order, tags, match_all, project)
+        if stmt is None:
+            return []
+        return [TaskRow(*r) for r in self.session.execute(stmt)]
+
+    def list_task_page(self, search_text: str = "", filter_mode: str = "all", order: str = "default",
+                       cursor: PageCursor | None = None, limit: int = PAGE_SIZE, status: str | None = None,
+                       tags: Sequence[str] = (), match_all: bool = True,
+                       project: str | None = None) -> tuple[list[TaskRow], PageCursor | None]:
+        """Keyset sayfalama: (is_done, due_at IS NULL, created_at DESC, id DESC) sırasıyla bir sayfa.
+
+        Sıralamanın ilk iki sütunu birkaç değer alabildiği için her (is_done, due_at IS NULL)
+        grubu ayrı taranır; grup içinde (created_at, id) < imleç koşuluyla indeksten devam edilir.
+        Dönen imleç None ise başka satır yoktur.
+        """
+        filtered = self._apply_filters(_row_select(), search_text, filter_mode, order, tags, match_all, project)
+        if filtered is None:
+            return [], None
+        stmt, ranked = filtered
+        if status is not None:
+            stmt = stmt.where(Task.status == status)
+        cursor = cursor or PageCursor()
 
-    def list_tasks(self, search_text: str = "", filter_mode: str = "all") -> list[Task]:
-        stmt = select(Task)
+        if ranked:
+            # bm25 puanı indekslenemez; arama sonuçları sınırlı olduğundan offset yeterli
+            q = stmt.order_by(fts.bm25_rank(), Task.created_at.desc(), Task.id.desc())
+            page = [TaskRow(*r) for r in self.session.execute(q.offset(cursor.offset).limit(limit + 1))]
+            more = len(page) > limit
+            return page[:limit], PageCursor(offset=cursor.offset + limit) if more else None
+
+        if order == "board":
+            # Pano sırası: kolon içinde (sort_rank, id) artan; ix_tasks_status_rank üzerinden
+            q = stmt
+            if cursor.after is not None:
+                q = q.where(tuple_(Task.sort_rank, Task.id) > tuple_(*cursor.after))
+            page = [TaskRow(*r) for r in self.session.execute(q.order_by(Task.sort_rank, Task.id).limit(limit + 1))]
+            if len(page) > limit:
+                page = page[:limit]
+                return page, PageCursor(after=(page[-1].sort_rank, page[-1].id))
+            return page, None
+
+        groups = _order_groups(filter_mode)
+        rows: list[TaskRow] = []
+        group, after = cursor.group, cursor.after
+        while group < len(groups):
+            need = limit - len(rows)
+            if need <= 0:
+                return rows, PageCursor(group, after)
+            is_done, no_due = groups[group]
+            q = stmt.where(Task.is_done == is_done)
+            if filter_mode not in ("today", "week"):
+                # Tarih aralığında due_at zaten dolu; bu terim orada planı ix_tasks_list_order'a kaydırır
+                q = q.where(Task.due_at.is_(None) == no_due)
+            if after is not None:
+                q = q.where(tuple_(Task.created_at, Task.id) < tuple_(*after))
+            q = q.order_by(Task.created_at.desc(), Task.id.desc()).limit(need + 1)
+            page = [TaskRow(*r) for r in self.session.execute(q)]
+            if len(page) > need:
+                rows += page[:need]
+                return rows, PageCursor(group, (rows[-1].created_at, rows[-1].id))
+            rows += page
+            group, after = group + 1, None
+        return rows, None
+
+    def iter_task_pages(self, search_text: str = "", filter_mode: str = "all", order: str = "default",
+                        page_size: int = PAGE_SIZE, status: str | None = None,
+                        tags: Sequence[str] = (), match_all: bool = True,
+                        project: str | None = None) -> Iterator[list[TaskRow]]:
+        """Sonuçları sayfa sayfa üretir; her sayfa ayrı ve kısa bir sorgudur"""
+        cursor = None
+        while True:
+            rows, cursor = self.list_task_page(search_text, filter_mode, order, cursor, page_size, status,
+                                               tags, match_all, project)
+            if rows:
+                yield rows
+            if cursor is None:
+                return
+
+    def count_tasks(self, search_text: str = "", filter_mode: str = "all", status: str | None = None,
+                    tags: Sequence[str] = (), match_all: bool = True, project: str | None = None) -> int:
+        filtered = self._apply_filters(select(func.count()).select_from(Task), search_text, filter_mode, "default",
+                                       tags, match_all, project)
+        if filtered is None:
+            return 0
+        stmt, _ = filtered
+        if status is not None:
+            stmt = stmt.where(Task.status == status)
+        return self.session.execute(stmt).scalar_one()
+
+    def count_by_status(self) -> dict[str, int]:
+        stmt = select(Task.status, func.count()).group_by(Task.status)
+        return {status: n for status, n in self.session.execute(stmt)}
+
+    def count_by_project(self) -> dict[str, int]:
+        """Projesi olan görevler, en kalabalık proje önce"""
+        stmt = (
+            select(Task.project, func.count()).where(Task.project.is_not(None), Task.project != "")
+            .group_by(Task.project)
+        )
+        counts = self.session.execute(stmt).all()
+        return dict(sorted(counts, key=lambda r: (-r[1], r[0])))
+
+    def count_overdue(self, now: datetime | None = None) -> int:
+        """Bitmemiş ve süresi geçmiş görevler (ix_tasks_open_due aralığı)"""
+        stmt = (
+            select(func.count()).select_from(Task)
+            .where(Task.is_done == False, Task.due_at.is_not(None), Task.due_at < (now or datetime.now()))
+        )
+        return self.session.execute(stmt).scalar_one()
+
+    def task_stats(self, now: datetime | None = None) -> TaskStats:
+        by_status = self.count_by_status()
+        return TaskStats(
+            total=sum(by_status.values()),
+            done=by_status.get("done", 0),
+            overdue=self.count_overdue(now),
+            by_status=by_status,
+            by_project=self.count_by_project(),
+        )
+
+    def _filtered(self, stmt, search_text: str, filter_mode: str, order: str,
+                  tags: Sequence[str] = (), match_all: bool = True, project: str | None = None):
+        """Filtre ve sıralamayı uygular; arama metni kelime içermiyorsa None"""
+        filtered = self._apply_filters(stmt, search_text, filter_mode, order, tags, match_all, project)
+        if filtered is None:
+            return None
+        stmt, ranked = filtered
+        if ranked:
+            return stmt.order_by(fts.bm25_rank(), Task.created_at.desc())
+        if filter_mode in ("today", "week"):
+            # due_at burada hiç NULL değil; "due_at IS NULL" terimi düşünce planlayıcı
+            # tüm sıralama indeksini taramak yerine tarih aralığını kullanır
+            return stmt.order_by(Task.is_done.asc(), Task.created_at.desc())
+        return stmt.order_by(Task.is_done.asc(), Task.due_at.is_(None).asc(), Task.created_at.desc())
+
+    def _apply_filters(self, stmt, search_text: str, filter_mode: str, order: str,
+                       tags: Sequence[str] = (), match_all: bool = True, project: str | None = None):
+        """Arama ve filtre koşulları. (stmt, bm25_sıralı_mı) ya da boş sonuç için None döner."""
         s = search_text.strip()
+        ranked = False
+        if project is not None:
+            stmt = stmt.where(Task.project == project)
+        keys = list(dict.fromkeys(tag_key(t) for t in tags if t.strip()))
+        if keys:
+            stmt = stmt.where(Task.id.in_(_tagged_ids(keys, match_all)))
         if s:
-            like = f"%{s}%"
-            stmt = stmt.where(or_(
-                Task.title.like(like), 
-                Task.description.like(like), 
-                Task.tags.like(like)
-            ))
+            if fts.fts_available(self.session.get_bind()):
+                query = fts.build_match_query(s)
+                if not query:
+                    return None
+                if order == "rank":
+                    stmt = stmt.join(fts.fts_table, fts.fts_table.c.rowid == Task.id).where(fts.match_clause(query))
+                    ranked = True
+                else:
+                    stmt = stmt.where(Task.id.in_(
+                        select(fts.fts_table.c.rowid).where(fts.match_clause(query))
+                    ))
+            else:
+                like = f"%{s}%"
+                stmt = stmt.where(or_(
+                    Task.title.like(like), 
+                    Task.description.like(like), 
+                    Task.tags.like(like)
+                ))
 
         now = datetime.now()
-        if filter_mode == "today":
-            start = datetime(now.year, now.month, now.day)
-            end = start + timedelta(days=1)
-            stmt = stmt.where(Task.due_at.is_not(None), Task.due_at >= start, Task.due_at < end)
-        elif filter_mode == "week":
+        if filter_mode in ("today", "week"):
             start = datetime(now.year, now.month, now.day)
-            end = start + timedelta(days=7)
-            stmt = stmt.where(Task.due_at.is_not(None), Task.due_at >= start, Task.due_at < end)
+            end = start + timedelta(days=1 if filter_mode == "today" else 7)
+            # is_done IN (0, 1) her satırı kapsar ama planlayıcının ix_tasks_open_due
+            # üzerinde iki dar aralık araması yapmasını sağlar
+            stmt = stmt.where(Task.is_done.in_([False, True]), Task.due_at.is_not(None),
+                              Task.due_at >= start, Task.due_at < end)
         elif filter_mode == "done":
             stmt = stmt.where(Task.is_done == True)
         elif filter_mode == "undone":
             stmt = stmt.where(Task.is_done == False)
+        return stmt, ranked
+
+
+def _from_wire(name: str, value):
+    """Eşitleme yükündeki JSON değerini sütun değerine çevirir"""
+    if value is None:
+        return None
+    if name in ("due_at", "created_at"):
+        return datetime.fromisoformat(value)
+    if name == "is_done":
+        return bool(value)
+    if name == "subtasks":
+        return [(str(title), bool(done)) for title, done in value]
+    return value
+
+
+def _log_row(uid: str, field: str, value, at: str, origin: str) -> dict:
+    return {"uid": uid, "field": field, "changed_at": at, "origin": origin,
+            "value": None if field == DELETED else json.dumps(value, ensure_ascii=False, separators=(",", ":"))}
+
+
+def _chunks(ids: list[int], size: int = BULK_CHUNK):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def _next_rank(conn, ranks: dict[str, float], status: str) -> float:
+    """Kolonun sonuna eklenen görevin sırası; son sıra durum başına bir kez indeksten (MAX) okunur"""
+    if status not in ranks:
+        ranks[status] = conn.execute(
+            select(func.max(Task.sort_rank)).where(Task.status == status)
+        ).scalar() or 0.0
+    ranks[status] += RANK_STEP
+    return ranks[status]
+
+
+def _clean_project(project: str | None) -> str:
+    return (project or "").strip() or DEFAULT_PROJECT
+
+
+def _tagged_ids(keys: list[str], match_all: bool):
+    """Etiketlerin hepsini (VE) ya da herhangi birini (VEYA) taşıyan görev id'leri"""
+    q = (
+        select(TaskTag.task_id).join(Tag, Tag.id == TaskTag.tag_id)
+        .where(Tag.key.in_(keys))
+    )
+    if match_all and len(keys) > 1:
+        q = q.group_by(TaskTag.task_id).having(func.count() == len(keys))
+    return q
+
+
+def _top_rank_expr(status: str):
+    """Kolonun en üstüne yerleşecek sort_rank (alt sorgu; ix_tasks_status_rank ile tek adım)"""
+    return (
+        select(func.coalesce(func.min(Task.sort_rank), RANK_STEP) - RANK_STEP)
+        .where(Task.status == status).scalar_subquery()
+    )
+
+
+def _order_groups(filter_mode: str) -> list[tuple[bool, bool]]:
+    """Varsayılan sıranın (is_done, due_at IS NULL) önekinin alabileceği değerler, sırasıyla"""
+    if filter_mode in ("today", "week"):
+        groups = [(False, False), (True, False)]
+    else:
+        groups = [(False, False), (False, True), (True, False), (True, True)]
+    if filter_mode == "done":
+        groups = [g for g in groups if g[0]]
+    elif filter_mode == "undone":
+        groups = [g for g in groups if not g[0]]
+    return groups
+
 
-        stmt = stmt.order_by(Task.is_done.asc(), Task.due_at.is_(None).asc(), Task.created_at.desc())
-        return list(self.session.execute(stmt).unique().scalars().all())
+def _row_select():
+    """TaskRow sütun sırasıyla Core select; alt görev sayıları ilişkili alt sorgudan"""
+    total = (
+        select(func.count()).select_from(SubTask)
+        .where(SubTask.task_id == Task.id).correlate(Task).scalar_subquery()
+    )
+    done = (
+        select(func.count()).select_from(SubTask)
+        .where(SubTask.task_id == Task.id, SubTask.is_done == True).correlate(Task).scalar_subquery()
+    )
+    return select(
+        Task.id, Task.title, Task.description, Task.status, Task.priority, Task.tags, Task.project,
+        Task.due_at, Task.is_done, Task.created_at, Task.updated_at, total, done, Task.sort_rank,
+        Task.recurrence.is_not(None) | Task.series_id.is_not(None),
+    )
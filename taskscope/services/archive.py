@@ -0,0 +1,30 @@
+from __future__ import annotations
+import os
+from datetime import datetime, timedelta
+
+# Bu kadar gün önce biten görevler arşive taşınır; 0 = otomatik arşivleme kapalı
+ARCHIVE_ENV = "TASKSCOPE_ARCHIVE_DAYS"
+DEFAULT_ARCHIVE_DAYS = 90
+# Açık kalan uygulamada kontrol aralığı
+ARCHIVE_INTERVAL_MS = 6 * 60 * 60 * 1000
+# Açılıştaki ilk kontrol: ilk çizim ve veri yüklemesiyle yarışmasın
+FIRST_RUN_DELAY_MS = 30 * 1000
+
+
+def archive_days(value: str | None = None) -> int:
+    """Gün sayısı (verilmezse TASKSCOPE_ARCHIVE_DAYS); geçersizse varsayılana düşer"""
+    raw = (value if value is not None else os.environ.get(ARCHIVE_ENV, "")).strip()
+    if not raw:
+        return DEFAULT_ARCHIVE_DAYS
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        print(f"⚠️ Geçersiz arşiv süresi '{raw}', {DEFAULT_ARCHIVE_DAYS} gün kullanılıyor.")
+        return DEFAULT_ARCHIVE_DAYS
+
+
+def archive_cutoff(days: int, now: datetime | None = None) -> datetime | None:
+    """updated_at'i (UTC) bu andan eski bitmiş görevler arşivlenir; days 0 ise None"""
+    if days <= 0:
+        return None
+    return (now or datetime.utcnow()) - timedelta(days=days)
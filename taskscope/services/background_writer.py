@@ -0,0 +1,127 @@
+from __future__ import annotations
+import itertools
+from collections import OrderedDict
+from PySide6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition, Signal
+
+from taskscope.db.database import SessionLocal
+from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.tracing import span
+
+# İlk komuttan sonra bu kadar beklenir ki hızlı art arda gelenler aynı commit'e girsin
+BATCH_WINDOW_MS = 30
+
+
+class BackgroundWriter(QThread):
+    """Write-behind kuyruğu: GUI iş parçacığı SQLite commit'ini hiç beklemez.
+
+    submit() ile gelen repo çağrıları kendi iş parçacığında, birikenler tek
+    transaction'da (TaskRepo.transaction) uygulanır. Aynı anahtarla gelen komut
+    bekleyen eskisinin yerine geçer (ör. aynı alt görevin art arda işaretlenmesi)
+    ve kuyruğun sonuna taşınır; sıra önemli olduğundan anahtarsız komutlar hiç
+    birleştirilmez. Toplu commit başarısız olursa komutlar tek tek denenir ve
+    sadece kaydedilemeyenler failed ile bildirilir.
+    """
+    done = Signal(int)            # commit edilen komut sayısı
+    failed = Signal(list, str)    # [(metot, argümanlar)], hata mesajı
+
+    def __init__(self, session_factory=SessionLocal, parent=None):
+        super().__init__(parent)
+        self.session_factory = session_factory
+        self.mutex = QMutex()
+        self.wake = QWaitCondition()
+        self.kick = QWaitCondition()   # sadece flush/stop toplama penceresini kısaltır
+        self.idle = QWaitCondition()
+        self._pending: OrderedDict[object, tuple[str, tuple]] = OrderedDict()
+        self._busy = False
+        self._stopping = False
+        self._seq = itertools.count()
+
+    def submit(self, method: str, *args, key=None) -> None:
+        """repo.method(*args) çağrısını kuyruğa ekler; key aynı olan bekleyen komut düşer"""
+        with QMutexLocker(self.mutex):
+            key = ("key", key) if key is not None else ("seq", next(self._seq))
+            self._pending.pop(key, None)
+            self._pending[key] = (method, args)
+            self.wake.wakeAll()
+        if not self.isRunning():
+            self.start()
+
+    def pending_count(self) -> int:
+        with QMutexLocker(self.mutex):
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def flush(self, msecs: int = -1) -> bool:
+        """Kuyruktaki her şey commit edilene (ya da başarısız olana) kadar bekler"""
+        with QMutexLocker(self.mutex):
+            while self._pending or self._busy:
+                self.kick.wakeAll()  # toplama penceresini beklemesin
+                if msecs >= 0:
+                    if not self.idle.wait(self.mutex, msecs):
+                        return False
+                else:
+                    self.idle.wait(self.mutex)
+        return True
+
+    def stop(self) -> None:
+        """Kapanışta: önce kuyruğu boşaltır, sonra iş parçacığını bitirir"""
+        self.flush()
+        with QMutexLocker(self.mutex):
+            self._stopping = True
+            self.wake.wakeAll()
+            self.kick.wakeAll()
+        self.wait()
+
+    def run(self):
+        session = self.session_factory()
+        repo = TaskRepo(session)
+        try:
+            while True:
+                with QMutexLocker(self.mutex):
+                    while not self._pending and not self._stopping:
+                        self.wake.wait(self.mutex)
+                    if self._stopping and not self._pending:
+                        return
+                    # Art arda gelenleri topla (flush çağrılırsa erken uyanır)
+                    if not self._stopping:
+                        self.kick.wait(self.mutex, BATCH_WINDOW_MS)
+                    commands = list(self._pending.values())
+                    self._pending.clear()
+                    self._busy = True
+                try:
+                    with span("BackgroundWriter.batch", "writer", commands=len(commands)):
+                        self._apply(repo, commands)
+                finally:
+                    with QMutexLocker(self.mutex):
+                        self._busy = False
+                        if not self._pending:
+                            self.idle.wakeAll()
+        finally:
+            session.close()
+
+    def _apply(self, repo: TaskRepo, commands: list[tuple[str, tuple]]) -> None:
+        try:
+            with repo.transaction():
+                for method, args in commands:
+                    getattr(repo, method)(*args)
+            self.done.emit(len(commands))
+            return
+        except Exception as e:
+            if len(commands) == 1:
+                print(f"Arka plan yazma hatası ({commands[0][0]}): {e}")
+                self.failed.emit(commands, str(e))
+                return
+        # Toplu commit geri alındı: hatalı komutu ayırmak için tek tek dene
+        failed, message, ok = [], "", 0
+        for method, args in commands:
+            try:
+                with repo.transaction():
+                    getattr(repo, method)(*args)
+                ok += 1
+            except Exception as e:
+                print(f"Arka plan yazma hatası ({method}): {e}")
+                failed.append((method, args))
+                message = str(e)
+        if ok:
+            self.done.emit(ok)
+        if failed:
+            self.failed.emit(failed, message)
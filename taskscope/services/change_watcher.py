@@ -0,0 +1,83 @@
+from __future__ import annotations
+import sqlite3
+from uuid import uuid4
+from PySide6.QtCore import QThread, QMutex, QWaitCondition, Signal
+from sqlalchemy.engine import Engine
+
+from taskscope.db.database import ENGINE
+from taskscope.db.watch import ChangeProbe, track_local_writes
+
+# Değişiklik görülünce sık yoklanır, sessizlik sürdükçe aralık ikiye katlanarak uzar
+MIN_POLL_MS = 250
+ACTIVE_MAX_POLL_MS = 2_000
+# Pencere arka plandayken (bildirimler yine de yeni görevleri görsün)
+IDLE_POLL_MS = 30_000
+
+
+class ChangeWatcher(QThread):
+    """Başka süreçlerin (ikinci pencere, cli import, eşitleme) commit'lerini bildirir.
+
+    Her turda sadece PRAGMA data_version okunur; değişmediyse başka sorgu yok. Sinyal,
+    değişen izlenen tabloları taşır ki etkilenmeyen görünümler yeniden yüklenmesin.
+    """
+    tables_changed = Signal(object)   # frozenset[str]
+
+    def __init__(self, engine: Engine = ENGINE, parent=None):
+        super().__init__(parent)
+        self.running = True
+        self.token = uuid4().hex
+        self._path = engine.url.database
+        self._active = True
+        self._interval = MIN_POLL_MS
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        # Kendi yazmalarımız sayılsın ki değişiklik sanılmasın
+        track_local_writes(engine, self.token)
+
+    def set_active(self, active: bool) -> None:
+        # Öne gelince beklemeden bakılır
+        self._mutex.lock()
+        self._active = active
+        if active:
+            self._interval = MIN_POLL_MS
+            self._wake.wakeAll()
+        self._mutex.unlock()
+
+    def run(self):
+        try:
+            probe = ChangeProbe(self._path, self.token)
+        except sqlite3.Error as e:
+            print(f"Değişiklik izleyici başlatılamadı: {e}")
+            return
+        try:
+            while self.running:
+                self._mutex.lock()
+                try:
+                    if self.running:
+                        self._wake.wait(self._mutex, self._interval)
+                finally:
+                    self._mutex.unlock()
+                if not self.running:
+                    break
+                try:
+                    changed = probe.poll()
+                except sqlite3.Error:
+                    changed = frozenset()  # yazma kilidi: sonraki turda
+                self._mutex.lock()
+                if changed:
+                    self._interval = MIN_POLL_MS
+                else:
+                    limit = ACTIVE_MAX_POLL_MS if self._active else IDLE_POLL_MS
+                    self._interval = min(self._interval * 2, limit)
+                self._mutex.unlock()
+                if changed:
+                    self.tables_changed.emit(changed)
+        finally:
+            probe.close()
+
+    def stop(self):
+        self._mutex.lock()
+        self.running = False
+        self._wake.wakeAll()
+        self._mutex.unlock()
+        self.wait()
@@ -1,60 +1,136 @@
-import time
+import heapq
+import threading
 from datetime import datetime, timedelta
-from PySide6.QtCore import QThread
-from plyer import notification
+from PySide6.QtCore import QThread, QMutex, QWaitCondition
 from taskscope.db.database import SessionLocal
-from taskscope.models.task import Task
+from taskscope.models.task import parse_reminders, MAX_REMINDER_MINUTES
+from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.tracing import span
+
+# Kaçırılan hatırlatmalar (uygulama kapalıyken vs.) bu kadar geç de olsa gösterilir
+GRACE = timedelta(minutes=60)
+# Her sorguda ileriye bakılan pencere; pencere bitince yeniden sorgulanır
+WINDOW = timedelta(hours=6)
+
 
 class NotificationWorker(QThread):
-    def __init__(self):
+    """Yaklaşan hatırlatmaları bir min-heap'te tutar ve tam zamanında uyanır.
+
+    Veritabanı sadece pencere dolduğunda ya da depo bir değişiklik bildirdiğinde
+    (ekleme/güncelleme/silme) sorgulanır; arada iş parçacığı QWaitCondition üzerinde uyur.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
         super().__init__()
         self.running = True
-        self.notified_tasks = set()
+        self.notified_tasks = set()   # (task_id, due_at, dakika) - aynı hatırlatma iki kez gösterilmez
+        self._session_factory = session_factory
+        self._heap: list[tuple[datetime, int, int, str, datetime]] = []
+        self._window_end: datetime | None = None
+        self._dirty = True
+        # materialize_occurrences'ı çalıştıran iş parçacığı: kendi yazmamızın bildirimi yok sayılır
+        self._materializing: int | None = None
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        TaskRepo.subscribe(self.on_tasks_changed)
+
+    def on_tasks_changed(self, kind: str, task_id: int | None) -> None:
+        # Arayüz iş parçacığından çağrılır: sadece işaretle ve uyandır
+        if threading.get_ident() == self._materializing:
+            return  # örnekleri _reload yazdı; aynı taramada zaten sorgulanıyorlar
+        self._mutex.lock()
+        self._dirty = True
+        self._wake.wakeAll()
+        self._mutex.unlock()
 
     def run(self):
         print("🔔 Bildirim servisi aktif.")
         while self.running:
             try:
-                self.check_deadlines()
+                with span("NotificationWorker.check_deadlines", "notify"):
+                    next_wake = self.check_deadlines()
             except Exception as e:
                 print(f"Bildirim hatası: {e}")
-            
-            # 60 saniye bekle ama her saniye 'kapanma emri geldi mi?' diye kontrol et
-            for _ in range(60):
-                if not self.running:
-                    return
-                time.sleep(1)
+                next_wake = datetime.now() + timedelta(seconds=60)
 
-    def check_deadlines(self):
-        session = SessionLocal()
-        try:
-            now = datetime.now()
-            tasks = session.query(Task).filter(
-                Task.is_done == False,
-                Task.due_at != None
-            ).all()
+            self._mutex.lock()
+            try:
+                if self.running and not self._dirty:
+                    ms = (next_wake - datetime.now()).total_seconds() * 1000
+                    self._wake.wait(self._mutex, max(0, int(ms)) + 1)
+            finally:
+                self._mutex.unlock()
+
+    def check_deadlines(self) -> datetime:
+        """Zamanı gelen hatırlatmaları gönderir, bir sonraki uyanma zamanını döner"""
+        now = datetime.now()
+        self._mutex.lock()
+        dirty, self._dirty = self._dirty, False
+        self._mutex.unlock()
+        if dirty or self._window_end is None or now >= self._window_end:
+            self._reload(now)
 
-            for task in tasks:
-                if not task.due_at: continue
-                
-                time_left = task.due_at - now
-                
-                # 15 dakika kala bildirim
-                if timedelta(minutes=0) < time_left <= timedelta(minutes=15):
-                    if task.id not in self.notified_tasks:
-                        self.send_notification(task.title, f"{int(time_left.seconds/60)} dakika kaldı!")
-                        self.notified_tasks.add(task.id)
-                
-                # Süresi dolunca bildirim
-                elif timedelta(minutes=-60) < time_left <= timedelta(minutes=0):
-                     if task.id not in self.notified_tasks:
-                        self.send_notification("Süresi Doldu!", f"'{task.title}' görevinin süresi doldu.")
-                        self.notified_tasks.add(task.id)
+        # Aynı görevin birden çok hatırlatması birlikte geldiyse (açılış, yeniden yükleme, uyku)
+        # sadece en sonuncusu gösterilir; öncekiler gösterilmiş sayılır
+        ready: dict[tuple[int, datetime], tuple] = {}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            fire_at, task_id, minutes, title, due_at = entry
+            key = (task_id, due_at, minutes)
+            if key in self.notified_tasks:
+                continue
+            self.notified_tasks.add(key)
+            ready[(task_id, due_at)] = entry  # heap sırası: sonraki atama daha geç hatırlatma
+        for fire_at, task_id, minutes, title, due_at in ready.values():
+            if minutes == 0 or due_at <= now:
+                self.send_notification("Süresi Doldu!", f"'{title}' görevinin süresi doldu.")
+            else:
+                left = max(1, round((due_at - now).total_seconds() / 60))
+                self.send_notification(title, f"{left} dakika kaldı!")
+
+        if self._heap:
+            return min(self._heap[0][0], self._window_end)
+        return self._window_end
+
+    def _reload(self, now: datetime) -> None:
+        # due_at - dakika pencereye düşüyorsa görev adaydır; en büyük ofset kadar ileri bak
+        self._window_end = now + WINDOW
+        session = self._session_factory()
+        try:
+            repo = TaskRepo(session)
+            # Tekrarlayan görevlerin yaklaşan örnekleri satır olsun ki pencereye girsinler
+            # (horizon gün başına hizalı: gün içinde çoğu çağrı hiçbir şey yazmaz)
+            self._materializing = threading.get_ident()
+            try:
+                repo.materialize_occurrences()
+            except Exception as e:
+                print(f"Tekrar örnekleri oluşturulamadı: {e}")
+            finally:
+                self._materializing = None
+            rows = repo.list_reminder_window(
+                now - GRACE, self._window_end + timedelta(minutes=MAX_REMINDER_MINUTES)
+            )
         finally:
             session.close()
 
+        # Penceresi geçmiş hatırlatmaların kaydını tutmaya gerek yok
+        self.notified_tasks = {k for k in self.notified_tasks
+                               if k[1] - timedelta(minutes=k[2]) >= now - GRACE}
+        heap = []
+        for task_id, title, due_at, reminders in rows:
+            for minutes in parse_reminders(reminders):
+                fire_at = due_at - timedelta(minutes=minutes)
+                if not (now - GRACE <= fire_at < self._window_end):
+                    continue
+                if (task_id, due_at, minutes) not in self.notified_tasks:
+                    heap.append((fire_at, task_id, minutes, title, due_at))
+        heapq.heapify(heap)
+        self._heap = heap
+
     def send_notification(self, title, message):
         try:
+            # plyer ilk bildirimde yüklenir; açılışı yavaşlatmasın
+            from plyer import notification
             notification.notify(
                 title=f"TaskScope: {title}",
                 message=message,
@@ -65,5 +141,9 @@ class NotificationWorker(QThread):
             pass # Bildirim gönderilemezse çökmesin
 
     def stop(self):
+        TaskRepo.unsubscribe(self.on_tasks_changed)
+        self._mutex.lock()
         self.running = False
-        self.wait() # Thread'in güvenli kapanmasını bekle
\ No newline at end of file
+        self._wake.wakeAll()
+        self._mutex.unlock()
+        self.wait() # Thread'in güvenli kapanmasını bekle
@@ -0,0 +1,43 @@
+from __future__ import annotations
+import sys
+import time
+
+# Açılışta yüklenmemesi gereken ağır modüller (rapor bunları kontrol eder)
+DEFERRED_MODULES = ("matplotlib", "plyer")
+
+
+class StartupProfile:
+    """--startup-profile: açılış aşamalarının ardışık süreleri.
+
+    Her mark() bir önceki işaretten bu yana geçen süreyi o aşamaya yazar.
+    Kapalıyken de işaretler tutulur (ucuz), sadece rapor basılmaz.
+    """
+
+    def __init__(self, enabled: bool = False, t0: float | None = None):
+        self.enabled = enabled
+        self._t0 = t0 if t0 is not None else time.perf_counter()
+        self._last = self._t0
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        return self._last - self._t0
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        lines = ["⏱️ Açılış profili:"]
+        for name, seconds in self.phases:
+            lines.append(f"   {name:<20} {seconds * 1000:8.1f} ms")
+        lines.append(f"   {'toplam':<20} {self.total() * 1000:8.1f} ms")
+        loaded = [m for m in DEFERRED_MODULES if m in sys.modules]
+        if loaded:
+            lines.append(f"   ⚠️ Açılışta yüklenen ertelenmiş modüller: {', '.join(loaded)}")
+        else:
+            lines.append(f"   Ertelenen modüller yüklenmedi: {', '.join(DEFERRED_MODULES)}")
+        # Tek print: başka iş parçacıklarının çıktısıyla karışmasın
+        print("\n".join(lines))
@@ -0,0 +1,95 @@
+"""Delta eşitleme: değişiklik günlüğü üzerinden gönder / çek.
+
+Protokol HTTP POST'tur; istek ve yanıt gövdeleri gzip'li JSON:
+
+    /push  {"device": d, "changes": [[uid, field, value, changed_at, origin], ...]}  -> {"applied": n}
+    /pull  {"device": d, "cursor": n, "limit": k}  -> {"changes": [...], "cursor": m, "more": bool}
+
+İstemci sunucu başına iki imleç tutar (sync_peers): kendi günlüğünde gönderdiği son seq ve
+sunucunun günlüğünde çektiği son seq. Bir eşitleme sadece bu imleçlerden sonrasını aktarır;
+gönderilen sadece bu cihazın değişiklikleridir, çekilenler de diğer cihazlarınkidir.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+
+from taskscope.repositories.task_repo import TaskRepo, SYNC_BATCH
+
+# Sunucu tek istekte bundan fazlasını göndermez
+MAX_BATCH = 5000
+TIMEOUT = 30
+
+
+class SyncError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    pushed: int
+    pulled: int
+    applied: int
+
+
+def encode(payload: dict) -> bytes:
+    return gzip.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decode(body: bytes, encoding: str | None = "gzip") -> dict:
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    payload = json.loads(body.decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("JSON nesnesi bekleniyordu")
+    return payload
+
+
+def _post(url: str, payload: dict) -> dict:
+    req = urllib.request.Request(url, data=encode(payload), method="POST", headers={
+        "Content-Type": "application/json", "Content-Encoding": "gzip", "Accept-Encoding": "gzip",
+    })
+    try:
+        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+            return decode(resp.read(), resp.headers.get("Content-Encoding"))
+    except urllib.error.HTTPError as e:
+        raise SyncError(f"{url}: HTTP {e.code} {e.read()[:200].decode('utf-8', 'replace')}") from e
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        raise SyncError(f"{url}: {e}") from e
+
+
+def sync(repo: TaskRepo, url: str, batch: int = SYNC_BATCH) -> SyncResult:
+    """Önce yerel değişiklikleri gönderir, sonra sunucudakileri çeker.
+
+    Her parçadan sonra imleç kaydedilir; bağlantı koparsa sonraki eşitleme kaldığı yerden
+    devam eder (tekrar gelen değişiklikler günlükte zaten olduğu için yok sayılır).
+    """
+    url = url.rstrip("/")
+    device = repo.sync_device()
+    pull_cursor, push_cursor = repo.sync_cursors(url)
+    pushed = pulled = applied = 0
+    while True:
+        out = repo.changes_since(push_cursor, batch, origin=device)
+        if out.changes:
+            _post(f"{url}/push", {"device": device, "changes": out.changes})
+            pushed += len(out.changes)
+        if out.cursor != push_cursor:
+            push_cursor = out.cursor
+            repo.set_sync_cursors(url, push=push_cursor)
+        if not out.more:
+            break
+    while True:
+        resp = _post(f"{url}/pull", {"device": device, "cursor": pull_cursor, "limit": batch})
+        changes = resp.get("changes") or []
+        # Uygulama ve imleç tek transaction: yarıda kalırsa parça baştan çekilir
+        with repo.transaction():
+            applied += repo.apply_changes(changes)
+            repo.set_sync_cursors(url, pull=int(resp["cursor"]))
+        pulled += len(changes)
+        pull_cursor = int(resp["cursor"])
+        if not resp.get("more"):
+            break
+    return SyncResult(pushed, pulled, applied)
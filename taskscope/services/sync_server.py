@@ -0,0 +1,96 @@
+"""Yerel deneme için küçük eşitleme sunucusu.
+
+Sunucu da sıradan bir TaskScope veritabanıdır (kendi dosyası, kendi günlüğü); istemcilerin
+gönderdiklerini apply_changes ile uygular ve çekenlere changes_since ile verir. İstekler tek
+iş parçacığında sırayla işlenir:
+
+    python -m taskscope.services.sync_server --db sunucu.db --port 8765
+    python cli.py sync http://127.0.0.1:8765
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from taskscope.db.database import init_db
+from taskscope.db.storage import choose_profile, install_storage_profile
+from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.sync import MAX_BATCH, decode, encode
+
+DEFAULT_PORT = 8765
+
+
+class SyncServer(HTTPServer):
+    def __init__(self, address: tuple[str, int], db: Path):
+        super().__init__(address, _Handler)
+        engine = create_engine(f"sqlite+pysqlite:///{db}", future=True)
+        install_storage_profile(engine, choose_profile())
+        init_db(engine)
+        self.session_factory = sessionmaker(bind=engine, autoflush=False, future=True)
+
+    def pull(self, req: dict) -> dict:
+        limit = max(1, min(int(req.get("limit", MAX_BATCH)), MAX_BATCH))
+        with self.session_factory() as session:
+            batch = TaskRepo(session).changes_since(int(req.get("cursor", 0)), limit,
+                                                    exclude_origin=req.get("device"))
+        return {"changes": batch.changes, "cursor": batch.cursor, "more": batch.more}
+
+    def push(self, req: dict) -> dict:
+        with self.session_factory() as session:
+            return {"applied": TaskRepo(session).apply_changes(req.get("changes") or [])}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "TaskScopeSync/1"
+    server: SyncServer
+
+    def do_POST(self):
+        routes = {"/pull": self.server.pull, "/push": self.server.push}
+        if self.path not in routes:
+            self._reply(404, {"error": "bilinmeyen yol"})
+            return
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            req = decode(body, self.headers.get("Content-Encoding"))
+        except (ValueError, OSError) as e:
+            self._reply(400, {"error": f"geçersiz istek: {e}"})
+            return
+        try:
+            self._reply(200, routes[self.path](req))
+        except Exception as e:
+            self._reply(500, {"error": str(e)})
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = encode(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="TaskScope eşitleme sunucusu (yerel deneme için)")
+    parser.add_argument("--db", type=Path, default=Path("taskscope-sync.db"), help="sunucunun veritabanı")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    server = SyncServer((args.host, args.port), args.db)
+    print(f"🔄 Eşitleme sunucusu: http://{args.host}:{args.port} ({args.db})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+from __future__ import annotations
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Sequence
+
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, Qt, Signal
+
+from taskscope.models.rows import TaskRow, TaskStats
+from taskscope.models.task import split_tags, tag_key
+from taskscope.repositories.task_repo import TaskRepo, PageCursor, PAGE_SIZE
+
+# Bu kadar göreve kadar tüm satırlar bellekte tutulur; üstünde görünümler SQL sayfalamaya döner
+RESIDENT_LIMIT = 20_000
+# Bir olay döngüsü turunda bundan fazla görev değiştiyse satır satır uygulamak yerine baştan yüklenir
+RELOAD_BATCH = 2_000
+
+
+def _default_key(t: TaskRow):
+    # list_task_page ile aynı sıra: is_done, due_at IS NULL, created_at DESC, id DESC
+    return (t.is_done, t.due_at is None, -t.created_at.timestamp(), -t.id)
+
+
+def _board_key(t: TaskRow):
+    return (t.sort_rank, t.id)
+
+
+class TaskStore(QObject):
+    """Süreç genelinde tek görev önbelleği; görünümler değişiklikleri sinyallerden öğrenir.
+
+    Görevler id, statü, proje, etiket ve bitiş günü indeksleriyle bellekte tutulur. Kim yazarsa
+    yazsın (GUI, arka plan yazıcısı) TaskRepo bildirimi buraya gelir; aynı turda biriken
+    bildirimlerin satırları tek sorguyla okunur ve görev başına task_added / task_changed /
+    task_removed yayınlanır. Hangi satırların değiştiği bilinmiyorsa (içe aktarma, eşitleme)
+    önbellek baştan yüklenir ve reset yayınlanır.
+
+    Görev sayısı RESIDENT_LIMIT'i aşarsa resident False olur: sinyaller yine gelir ama
+    satırlar tutulmaz, sorgular TaskRepo'ya (SQL) gider.
+    """
+    task_added = Signal(object)    # TaskRow
+    task_changed = Signal(object)  # TaskRow
+    task_removed = Signal(int)     # task_id
+    reset = Signal()
+    # Proje üyeliği ya da bir projenin açık/biten sayısı değişti (kenar çubuğu sadece buna bakar)
+    projects_changed = Signal()
+    # Depo bildirimleri herhangi bir iş parçacığından gelebilir; GUI iş parçacığına taşınır
+    _events_ready = Signal()
+
+    def __init__(self, repo: TaskRepo, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.resident = False
+        self._by_id: dict[int, TaskRow] = {}
+        self._by_status: dict[str, set[int]] = defaultdict(set)
+        self._by_project: dict[str, set[int]] = defaultdict(set)
+        self._by_due: dict[date | None, set[int]] = defaultdict(set)
+        self._by_tag: dict[str, set[int]] = defaultdict(set)
+        self._project_done: dict[str, int] = defaultdict(int)
+        self._tag_names: dict[str, str] = {}   # key -> ilk görülen yazılış
+        # Sıralı sonuçlar bir sonraki değişikliğe kadar tekrar kullanılır (sayfalar için)
+        self._sorted: dict[tuple, list[TaskRow]] = {}
+        self._events: list[tuple[str, int | None]] = []
+        self._events_mutex = QMutex()
+        self._events_ready.connect(self._apply_events, Qt.QueuedConnection)
+        TaskRepo.subscribe(self._on_repo_event)
+
+    def close(self) -> None:
+        TaskRepo.unsubscribe(self._on_repo_event)
+
+    # --- Yükleme ve indeksler ---
+    def load(self) -> None:
+        self._clear()
+        if self.repo.count_tasks() <= RESIDENT_LIMIT:
+            for t in self.repo.list_task_rows():
+                self._index(t)
+            self.resident = True
+        else:
+            self.resident = False
+        self.reset.emit()
+        self.projects_changed.emit()
+
+    def _clear(self) -> None:
+        for index in (self._by_id, self._by_status, self._by_project, self._by_due, self._by_tag,
+                      self._project_done):
+            index.clear()
+        self._tag_names.clear()
+        self._touch()
+
+    def _touch(self) -> None:
+        self._sorted.clear()
+
+    def _index(self, t: TaskRow) -> None:
+        self._by_id[t.id] = t
+        self._by_status[t.status].add(t.id)
+        self._by_project[t.project or ""].add(t.id)
+        if t.is_done:
+            self._project_done[t.project or ""] += 1
+        self._by_due[t.due_at.date() if t.due_at else None].add(t.id)
+        for name in split_tags(t.tags):
+            key = tag_key(name)
+            self._by_tag[key].add(t.id)
+            self._tag_names.setdefault(key, name)
+
+    def _unindex(self, task_id: int) -> TaskRow | None:
+        t = self._by_id.pop(task_id, None)
+        if t is not None:
+            if t.is_done:
+                self._project_done[t.project or ""] -= 1
+            keys = [(self._by_status, t.status), (self._by_project, t.project or ""),
+                    (self._by_due, t.due_at.date() if t.due_at else None)]
+            keys += [(self._by_tag, tag_key(name)) for name in split_tags(t.tags)]
+            for index, key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(task_id)
+                    if not ids:
+                        del index[key]
+        return t
+
+    # --- Değişiklikler ---
+    def _on_repo_event(self, kind: str, task_id: int | None) -> None:
+        # Aynı turda gelenler birikir, GUI iş parçacığında birlikte uygulanır
+        with QMutexLocker(self._events_mutex):
+            first = not self._events
+            self._events.append((kind, task_id))
+        if first:
+            self._events_ready.emit()
+
+    def _apply_events(self) -> None:
+        with QMutexLocker(self._events_mutex):
+            events, self._events = self._events, []
+        kinds: dict[int, str] = {}
+        for kind, task_id in events:
+            if task_id is None:
+                # Hangi satırların değiştiği bilinmiyor
+                self.load()
+                return
+            # Eklenip güncellenen görev eklenmiş sayılır; silme her şeyi ezer
+            if kind == "deleted" or kinds.get(task_id) != "created":
+                kinds[task_id] = kind
+        if len(kinds) > RELOAD_BATCH:
+            self.load()
+            return
+        rows = {t.id: t for t in self.repo.get_task_rows([i for i, k in kinds.items() if k != "deleted"])}
+        projects = False
+        for task_id, kind in kinds.items():
+            t = rows.get(task_id)
+            if t is None:
+                if self._unindex(task_id) is not None or not self.resident:
+                    self._touch()
+                    self.task_removed.emit(task_id)
+                    projects = True
+                continue
+            old = self._unindex(task_id)
+            if self.resident:
+                self._index(t)
+            self._touch()
+            if old is not None or (not self.resident and kind != "created"):
+                self.task_changed.emit(t)
+            else:
+                self.task_added.emit(t)
+            # Eski satırı bilinmiyorsa (yerleşik değil) her değişiklik sayılır
+            if old is None or old.project != t.project or old.is_done != t.is_done:
+                projects = True
+        if projects:
+            self.projects_changed.emit()
+
+    # --- Sorgular (bellekteyse indekslerden, değilse SQL) ---
+    def get(self, task_id: int) -> TaskRow | None:
+        if self.resident:
+            return self._by_id.get(task_id)
+        return self.repo.get_task_row(task_id)
+
+    def rows(self, filter_mode: str = "all", order: str = "default", status: str | None = None,
+             tags: Sequence[str] = (), match_all: bool = True, project: str | None = None) -> list[TaskRow]:
+        """Filtreli ve sıralı satırlar; arama metni yoksa list_task_rows ile aynı sonuç"""
+        if not self.resident:
+            rows = self.repo.list_task_rows("", filter_mode, order, tags, match_all, project)
+            return [t for t in rows if t.status == status] if status is not None else rows
+        keys = tuple(dict.fromkeys(tag_key(t) for t in tags if t.strip()))
+        key = (filter_mode, order, status, keys, match_all, project, date.today())
+        cached = self._sorted.get(key)
+        if cached is None:
+            ids = self._candidate_ids(filter_mode, status)
+            if keys:
+                ids = self._tagged_ids(keys, match_all).intersection(ids)
+            if project is not None:
+                ids = self._by_project.get(project, set()).intersection(ids)
+            rows = [self._by_id[i] for i in ids]
+            if filter_mode == "done":
+                rows = [t for t in rows if t.is_done]
+            elif filter_mode == "undone":
+                rows = [t for t in rows if not t.is_done]
+            rows.sort(key=_board_key if order == "board" else _default_key)
+            cached = self._sorted[key] = rows
+        return cached
+
+    def list_page(self, filter_mode: str = "all", order: str = "default", cursor: PageCursor | None = None,
+                  limit: int = PAGE_SIZE, status: str | None = None,
+                  tags: Sequence[str] = (), match_all: bool = True,
+                  project: str | None = None) -> tuple[list[TaskRow], PageCursor | None]:
+        """list_task_page karşılığı (arama metni olmadan); imleç bellek içi sıradaki konumdur"""
+        if not self.resident:
+            return self.repo.list_task_page("", filter_mode, order, cursor, limit, status, tags, match_all, project)
+        rows = self.rows(filter_mode, order, status, tags, match_all, project)
+        start = cursor.offset if cursor else 0
+        end = start + limit
+        return rows[start:end], PageCursor(offset=end) if end < len(rows) else None
+
+    def count(self, filter_mode: str = "all", tags: Sequence[str] = (), match_all: bool = True,
+              project: str | None = None) -> int:
+        if not self.resident:
+            return self.repo.count_tasks("", filter_mode, tags=tags, match_all=match_all, project=project)
+        if filter_mode == "all" and not tags:
+            if project is not None:
+                return len(self._by_project.get(project, ()))
+            return len(self._by_id)
+        return len(self.rows(filter_mode, tags=tags, match_all=match_all, project=project))
+
+    def tag_counts(self, filter_mode: str = "all", tags: Sequence[str] = (), match_all: bool = True,
+                   project: str | None = None) -> dict[str, int]:
+        """repo.tag_counts karşılığı; filtre yoksa doğrudan etiket kovalarının boyutu"""
+        if not self.resident:
+            return self.repo.tag_counts("", filter_mode, tags, match_all, project)
+        if filter_mode == "all" and not tags and project is None:
+            counts = [(self._tag_names[k], len(ids)) for k, ids in self._by_tag.items()]
+        else:
+            visible = {t.id for t in self.rows(filter_mode, tags=tags, match_all=match_all, project=project)}
+            counts = [(self._tag_names[k], n) for k, ids in self._by_tag.items() if (n := len(ids & visible))]
+        return dict(sorted(counts, key=lambda r: (-r[1], tag_key(r[0]))))
+
+    def project_counts(self) -> dict[str, tuple[int, int]]:
+        """repo.project_counts karşılığı: proje -> (açık, biten)"""
+        if not self.resident:
+            return self.repo.project_counts()
+        counts = {}
+        for project, ids in self._by_project.items():
+            if project:
+                done = self._project_done.get(project, 0)
+                counts[project] = (len(ids) - done, done)
+        return dict(sorted(counts.items(), key=lambda r: r[0].lower()))
+
+    def task_stats(self, now: datetime | None = None) -> TaskStats:
+        if not self.resident:
+            return self.repo.task_stats(now)
+        now = now or datetime.now()
+        by_status = {s: len(ids) for s, ids in self._by_status.items()}
+        projects = [(p, len(ids)) for p, ids in self._by_project.items() if p]
+        overdue = 0
+        for day, ids in self._by_due.items():
+            if day is None or day > now.date():
+                continue
+            overdue += sum(1 for i in ids if not self._by_id[i].is_done and self._by_id[i].due_at < now)
+        return TaskStats(
+            total=len(self._by_id),
+            done=by_status.get("done", 0),
+            overdue=overdue,
+            by_status=by_status,
+            by_project=dict(sorted(projects, key=lambda r: (-r[1], r[0]))),
+        )
+
+    def _tagged_ids(self, keys: tuple[str, ...], match_all: bool) -> set[int]:
+        buckets = [self._by_tag.get(k, set()) for k in keys]
+        if match_all:
+            # En küçük kovadan başla
+            buckets.sort(key=len)
+            return set(buckets[0]).intersection(*buckets[1:])
+        return set().union(*buckets)
+
+    def _candidate_ids(self, filter_mode: str, status: str | None):
+        by_status = self._by_status.get(status, set()) if status is not None else None
+        if filter_mode not in ("today", "week"):
+            return by_status if by_status is not None else self._by_id.keys()
+        # Tarih filtreleri sadece ilgili günlerin kovalarına bakar
+        today = date.today()
+        ids = set()
+        for i in range(1 if filter_mode == "today" else 7):
+            ids |= self._by_due.get(today + timedelta(days=i), set())
+        return ids & by_status if by_status is not None else ids
@@ -0,0 +1,165 @@
+from __future__ import annotations
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# TASKSCOPE_TRACE=1 -> çalışma dizinine taskscope-trace.json, başka değer -> o dosya yolu
+TRACE_ENV = "TASKSCOPE_TRACE"
+DEFAULT_TRACE_FILE = "taskscope-trace.json"
+# Çok uzun oturumlarda dosya şişmesin; eski olaylar düşer
+MAX_EVENTS = 200_000
+# Kaplamada gösterilen "son işlemler" penceresi
+RECENT = 300
+# Açıkken otomatik sarılan depo metotları dışında kalanlar
+_SKIP_METHODS = {"subscribe", "unsubscribe", "transaction"}
+
+_NULL_SPAN = nullcontext()
+_tracer: Tracer | None = None
+
+
+class Tracer:
+    """Chrome trace-event (chrome://tracing, Perfetto) biçiminde süre kaydı.
+
+    Her span tamamlandığında tek bir "X" olayı eklenir; iş parçacıkları kendi
+    tid'leriyle ayrı satırlarda görünür. Liste ekleme GIL altında atomik olduğu
+    için kilit yok.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._t0 = time.perf_counter()
+        self.events: deque[dict] = deque(maxlen=MAX_EVENTS)
+        self.recent: deque[tuple[float, str, str]] = deque(maxlen=RECENT)
+        self._threads: dict[int, str] = {}
+
+    def record(self, name: str, cat: str, start: float, end: float, args: dict | None = None) -> None:
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        dur_us = (end - start) * 1e6
+        ev = {"name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": tid,
+              "ts": (start - self._t0) * 1e6, "dur": dur_us}
+        if args:
+            ev["args"] = args
+        self.events.append(ev)
+        self.recent.append((dur_us / 1000, cat, name))
+
+    def slowest(self, n: int = 8) -> list[tuple[float, str, str]]:
+        """Son RECENT işlemin en yavaşları: (ms, kategori, ad)"""
+        return sorted(self.recent, reverse=True)[:n]
+
+    def write(self) -> None:
+        pid = os.getpid()
+        meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in list(self._threads.items())]
+        data = {"traceEvents": meta + list(self.events), "displayTimeUnit": "ms"}
+        try:
+            self.path.write_text(json.dumps(data), encoding="utf-8")
+            print(f"🧭 İz dosyası yazıldı: {self.path} ({len(self.events)} olay)")
+        except OSError as e:
+            print(f"İz dosyası yazılamadı: {e}")
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict | None):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.cat, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def tracer() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, cat: str = "app", **args):
+    """with span("refresh_data.query"): ... - kapalıyken paylaşılan boş bağlam döner"""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, cat, args or None)
+
+
+def traced(name: str | None = None, cat: str = "app"):
+    """Fonksiyonu span ile saran dekoratör; kapalıyken tek bir global kontrolü kalır"""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*a, **kw):
+            if _tracer is None:
+                return fn(*a, **kw)
+            with _Span(_tracer, label, cat, None):
+                return fn(*a, **kw)
+        return wrapper
+    return decorate
+
+
+def instrument_class(cls, cat: str) -> None:
+    """Sınıfın herkese açık metotlarını yerinde sarar (sadece iz açıkken çağrılır)"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or attr in _SKIP_METHODS or not inspect.isfunction(value):
+            continue
+        # Üreteçler çağrıldığında hemen döner; süreleri anlamsız olurdu
+        if inspect.isgeneratorfunction(value) or getattr(value, "__wrapped__", None):
+            continue
+        setattr(cls, attr, traced(f"{cls.__name__}.{attr}", cat)(value))
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Her SQL ifadesinin süresini imleç olaylarıyla ölçer"""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_trace_starts", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_trace_starts")
+        if not starts or _tracer is None:
+            return
+        start = starts.pop()
+        sql = " ".join(statement.split())
+        _tracer.record(sql[:60], "sql", start, time.perf_counter(),
+                       {"sql": sql[:1000], "executemany": executemany})
+
+
+def enable(path: Path | str, engine: Engine | None = None) -> Tracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(Path(path))
+        from taskscope.repositories.task_repo import TaskRepo
+        instrument_class(TaskRepo, "repo")
+        if engine is not None:
+            instrument_engine(engine)
+        atexit.register(_tracer.write)
+    return _tracer
+
+
+def enable_from_env(engine: Engine | None = None) -> Tracer | None:
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if not value or value == "0":
+        return None
+    return enable(DEFAULT_TRACE_FILE if value == "1" else value, engine)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QAbstractItemView, QMessageBox
+)
+
+from taskscope.repositories.task_repo import TaskRepo, ARCHIVE_PAGE
+
+# Yazarken her tuşta sorgu atılmasın
+SEARCH_DELAY_MS = 200
+
+
+class ArchiveDialog(QDialog):
+    """Arşivlenmiş görevlerde arama ve seçilenleri geri yükleme.
+
+    Arşiv sadece bu pencere açıkken sorgulanır; ana listeler hiç görmez.
+    """
+
+    def __init__(self, repo: TaskRepo, search_text: str = "", parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.setWindowTitle("Arşiv")
+        self.setMinimumSize(560, 480)
+
+        self.search_edit = QLineEdit(search_text)
+        self.search_edit.setPlaceholderText("Arşivde ara...")
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.refresh)
+        self.search_edit.textChanged.connect(lambda: self._search_timer.start(SEARCH_DELAY_MS))
+
+        self.list = QListWidget()
+        self.list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.list.itemSelectionChanged.connect(self._update_buttons)
+
+        self.count_lbl = QLabel()
+        self.count_lbl.setStyleSheet("opacity:0.7;")
+        self.restore_btn = QPushButton("Geri Yükle")
+        self.restore_btn.clicked.connect(self.restore_selected)
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.accept)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.count_lbl, 1)
+        buttons.addWidget(self.restore_btn)
+        buttons.addWidget(close_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search_edit)
+        layout.addWidget(self.list, 1)
+        layout.addLayout(buttons)
+        self.refresh()
+
+    def refresh(self):
+        search = self.search_edit.text()
+        rows = self.repo.list_archived(search, ARCHIVE_PAGE)
+        total = self.repo.count_archived(search) if len(rows) == ARCHIVE_PAGE else len(rows)
+        self.list.clear()
+        for r in rows:
+            meta = [f"bitti {r.updated_at:%d.%m.%Y}", r.project]
+            if r.tags:
+                meta.append(r.tags)
+            if r.subtask_total:
+                meta.append(f"{r.subtask_total} alt görev")
+            item = QListWidgetItem(f"{r.title}\n    {' · '.join(meta)}")
+            item.setData(Qt.UserRole, r.id)
+            item.setToolTip(f"Arşivlendi: {r.archived_at:%d.%m.%Y %H:%M}")
+            self.list.addItem(item)
+        if total > len(rows):
+            self.count_lbl.setText(f"{total} arşiv kaydının ilk {len(rows)} tanesi")
+        else:
+            self.count_lbl.setText(f"{total} arşiv kaydı")
+        self._update_buttons()
+
+    def _update_buttons(self):
+        self.restore_btn.setEnabled(bool(self.list.selectedItems()))
+
+    def restore_selected(self):
+        ids = [item.data(Qt.UserRole) for item in self.list.selectedItems()]
+        if not ids:
+            return
+        try:
+            self.repo.restore_tasks(ids)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
+            return
+        self.refresh()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from datetime import datetime
+from PySide6.QtCore import Signal, QDateTime
+from PySide6.QtWidgets import (
+    QFrame, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QDialog,
+    QDateTimeEdit, QCheckBox
+)
+
+
+class BatchActionBar(QFrame):
+    """Birden fazla görev seçiliyken görünen toplu işlem çubuğu"""
+    status_requested = Signal(str)   # todo / in_progress / done
+    retag_requested = Signal()
+    due_requested = Signal()
+    delete_requested = Signal()
+    clear_requested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("BatchActionBar")
+        self.setStyleSheet("""
+            QFrame#BatchActionBar { background: #EBF8FF; border: 1px solid #90CDF4; border-radius: 8px; }
+        """)
+
+        self.count_lbl = QLabel()
+        self.count_lbl.setStyleSheet("font-weight: bold;")
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(10, 6, 10, 6)
+        layout.addWidget(self.count_lbl)
+        layout.addStretch(1)
+
+        for text, status in (("Yapılacak", "todo"), ("Sürüyor", "in_progress"), ("Tamamla", "done")):
+            btn = QPushButton(text)
+            btn.clicked.connect(lambda _=False, s=status: self.status_requested.emit(s))
+            layout.addWidget(btn)
+
+        for text, signal in (("Etiket...", self.retag_requested), ("Tarih...", self.due_requested)):
+            btn = QPushButton(text)
+            btn.clicked.connect(signal.emit)
+            layout.addWidget(btn)
+
+        del_btn = QPushButton("Sil")
+        del_btn.setStyleSheet("color:#E53E3E;")
+        del_btn.clicked.connect(self.delete_requested.emit)
+        layout.addWidget(del_btn)
+
+        clear_btn = QPushButton("Seçimi Kaldır")
+        clear_btn.clicked.connect(self.clear_requested.emit)
+        layout.addWidget(clear_btn)
+
+        self.setVisible(False)
+
+    def set_count(self, n: int) -> None:
+        self.count_lbl.setText(f"{n} görev seçili")
+        self.setVisible(n > 0)
+
+
+class DueDateDialog(QDialog):
+    """Seçili görevlere tek bir bitiş tarihi atamak (veya tarihi kaldırmak) için"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Tarih Ata")
+        self.setModal(True)
+
+        self.due_edit = QDateTimeEdit()
+        self.due_edit.setCalendarPopup(True)
+        self.due_edit.setDisplayFormat("dd.MM.yyyy HH:mm")
+        self.due_edit.setDateTime(QDateTime.currentDateTime().addSecs(3600))
+
+        self.clear_cb = QCheckBox("Tarihi kaldır")
+        self.clear_cb.toggled.connect(lambda on: self.due_edit.setEnabled(not on))
+
+        ok_btn = QPushButton("Uygula")
+        cancel_btn = QPushButton("İptal")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+
+        btn_row = QHBoxLayout()
+        btn_row.addStretch(1)
+        btn_row.addWidget(cancel_btn)
+        btn_row.addWidget(ok_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.due_edit)
+        layout.addWidget(self.clear_cb)
+        layout.addLayout(btn_row)
+
+    def value(self) -> datetime | None:
+        if self.clear_cb.isChecked():
+            return None
+        return self.due_edit.dateTime().toPython()
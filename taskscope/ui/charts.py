@@ -0,0 +1,216 @@
+from __future__ import annotations
+import math
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, QSize
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QLabel, QSizePolicy
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+PIE_COLORS = ['#FFB7B2', '#B5EAD7', '#C7CEEA', '#E2F0CB', '#FFDAC1']
+STATUS_LABELS = {'todo': 'Yapılacak', 'in_progress': 'Sürüyor', 'done': 'Bitti'}
+STATUS_COLORS = {'todo': '#AECBFA', 'in_progress': '#FDE994', 'done': '#A7FFEB'}
+
+
+class ChartRenderer:
+    """Figure ve artist'leri bir kez kurulur, her çizimde yerinde güncellenir.
+
+    Qt'ye bağlı değildir (Agg); bu yüzden arka plan iş parçacığında çizilebilir.
+    Aynı anda tek bir iş parçacığı kullanmalıdır (ChartView bunu garanti eder).
+    """
+
+    def __init__(self):
+        self.figure = Figure(dpi=100)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+    def update(self, data: tuple, theme: tuple[str, str]) -> None:
+        raise NotImplementedError
+
+    def render(self, data: tuple, theme: tuple[str, str], size: QSize) -> QImage:
+        w, h = max(size.width(), 50), max(size.height(), 50)
+        dpi = self.figure.dpi
+        self.figure.set_size_inches(w / dpi, h / dpi)
+        self.figure.patch.set_facecolor(theme[0])
+        self.update(data, theme)
+        canvas = self.figure.canvas
+        canvas.draw()
+        w, h = canvas.get_width_height()
+        return QImage(bytes(canvas.buffer_rgba()), w, h, QImage.Format_RGBA8888).copy()
+
+
+class ProjectPieChart(ChartRenderer):
+    """Proje dağılımı; projeler aynı kaldıkça sadece dilim açıları ve yazı konumları değişir"""
+
+    def __init__(self):
+        super().__init__()
+        self._labels: tuple = ()
+        self._wedges, self._texts, self._autotexts = [], [], []
+        self.ax.set_axis_off()
+        self._empty = self.ax.text(0.5, 0.5, "Veri Yok", ha='center', transform=self.ax.transAxes)
+        self.ax.set_title("Proje Dağılımı", fontsize=10)
+
+    def update(self, data, theme):
+        text_color = theme[1]
+        labels = tuple(k for k, _ in data)
+        values = [v for _, v in data]
+        if labels != self._labels:
+            self._rebuild(labels, values)
+        elif values:
+            self._move_wedges(values)
+
+        self._empty.set_visible(not values)
+        self._empty.set_color(text_color)
+        self.ax.title.set_visible(bool(values))
+        self.ax.title.set_color(text_color)
+        for t in self._texts:
+            t.set_color(text_color)
+        for t in self._autotexts:
+            t.set_color('#333')  # İç yazılar her zaman koyu
+
+    def _rebuild(self, labels, values):
+        for artist in self._wedges + self._texts + self._autotexts:
+            artist.remove()
+        self._wedges, self._texts, self._autotexts = [], [], []
+        self._labels = labels
+        if values:
+            self._wedges, self._texts, self._autotexts = self.ax.pie(
+                values, labels=labels, autopct='%1.1f%%', startangle=90, colors=PIE_COLORS
+            )
+
+    def _move_wedges(self, values):
+        # ax.pie ile aynı geometri: 90°'den saat yönünün tersine, etiket 1.1, yüzde 0.6 yarıçapta
+        total = float(sum(values))
+        theta = 90.0
+        for wedge, txt, pct, v in zip(self._wedges, self._texts, self._autotexts, values):
+            frac = v / total
+            t1, t2 = theta, theta + 360.0 * frac
+            wedge.set_theta1(t1)
+            wedge.set_theta2(t2)
+            mid = math.radians((t1 + t2) / 2)
+            x, y = math.cos(mid), math.sin(mid)
+            txt.set_position((1.1 * x, 1.1 * y))
+            txt.set_horizontalalignment('left' if x > 0 else 'right')
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(f"{frac * 100:.1f}%")
+            theta = t2
+
+
+class StatusBarChart(ChartRenderer):
+    """Görev durumu; statüler aynı kaldıkça sadece sütun yükseklikleri değişir"""
+
+    def __init__(self):
+        super().__init__()
+        self._keys: tuple = ()
+        self._bars = None
+        self.ax.spines['top'].set_color('none')
+        self.ax.spines['right'].set_color('none')
+        self.ax.set_facecolor("none")  # Plot alanı şeffaf
+
+    def update(self, data, theme):
+        text_color = theme[1]
+        counts = dict(data)
+        # Sabit sıra: Yapılacak, Sürüyor, Bitti (sonra bilinmeyenler)
+        keys = tuple([k for k in STATUS_LABELS if k in counts] + [k for k in counts if k not in STATUS_LABELS])
+        values = [counts[k] for k in keys]
+        if keys != self._keys:
+            if self._bars is not None:
+                self._bars.remove()
+            self._bars = self.ax.bar([STATUS_LABELS.get(k, k) for k in keys], values,
+                                     color=[STATUS_COLORS.get(k, '#CBD5E0') for k in keys]) if keys else None
+            self._keys = keys
+        elif self._bars is not None:
+            for rect, v in zip(self._bars, values):
+                rect.set_height(v)
+        self.ax.set_ylim(0, max(values, default=0) * 1.05 or 1)
+
+        self.ax.spines['bottom'].set_color(text_color)
+        self.ax.spines['left'].set_color(text_color)
+        self.ax.tick_params(axis='x', colors=text_color)
+        self.ax.tick_params(axis='y', colors=text_color)
+        self.ax.set_title("Görev Durumu" if keys else "", fontsize=10, color=text_color)
+
+
+class _RenderSignals(QObject):
+    finished = Signal(object, object)  # QImage | None, istek anahtarı
+
+
+class _RenderJob(QRunnable):
+    def __init__(self, renderer: ChartRenderer, key: tuple, signals: _RenderSignals):
+        super().__init__()
+        self.renderer = renderer
+        self.key = key
+        self.signals = signals
+
+    def run(self):
+        data, theme, size = self.key
+        try:
+            image = self.renderer.render(data, theme, size)
+        except Exception as e:
+            print(f"Grafik çizim hatası: {e}")
+            image = None
+        self.signals.finished.emit(image, self.key)
+
+
+class ChartView(QLabel):
+    """Grafiği arka planda çizdirip hazır görüntüyü gösteren etiket.
+
+    Aynı anda tek çizim çalışır; o sırada gelen istekler birleştirilir ve sadece
+    en sonuncusu çizilir. Veri, tema ve boyut aynıysa hiç çizilmez.
+    """
+
+    def __init__(self, renderer: ChartRenderer, parent=None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.setAlignment(Qt.AlignCenter)
+        self.setMinimumSize(200, 150)
+        # Boyutu yerleşim belirler; görüntünün boyutu geri beslenip büyümeye yol açmasın
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self._data: tuple | None = None
+        self._theme = ('#F5F7FA', '#333333')
+        self._drawn_key = None
+        self._pending_key = None
+        self._busy = False
+        self._signals = _RenderSignals(self)
+        self._signals.finished.connect(self._on_rendered)
+        # Pencere boyutlanırken her piksel için çizim yapma
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._schedule)
+
+    def set_data(self, data: tuple, theme: tuple[str, str]) -> None:
+        self._data = data
+        self._theme = theme
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._data is None:
+            return
+        ratio = self.devicePixelRatioF()
+        size = QSize(int(self.width() * ratio), int(self.height() * ratio))
+        key = (self._data, self._theme, size)
+        if key == self._drawn_key and not self._busy:
+            return
+        self._pending_key = key
+        if not self._busy:
+            self._start_next()
+
+    def _start_next(self) -> None:
+        key, self._pending_key = self._pending_key, None
+        if key is None or key == self._drawn_key:
+            return
+        self._busy = True
+        QThreadPool.globalInstance().start(_RenderJob(self.renderer, key, self._signals))
+
+    def _on_rendered(self, image, key) -> None:
+        self._busy = False
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+            self.setPixmap(pixmap)
+            self._drawn_key = key
+        self._start_next()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
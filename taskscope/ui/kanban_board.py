@@ -1,23 +1,43 @@
 from __future__ import annotations
-from PySide6.QtCore import Qt, Signal, QMimeData, QByteArray, QDataStream, QIODevice
+from dataclasses import replace
+from PySide6.QtCore import Qt, Signal, QMimeData, QByteArray, QDataStream, QIODevice, QTimer
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, 
                                QListWidgetItem, QLabel, QAbstractItemView)
 from PySide6.QtGui import QDrag, QPixmap
 
+from taskscope.ui.reconcile import plan_reconcile
+
+# Her öğede kartın kurulduğu TaskRow tutulur (taşımada kart bundan yeniden kurulur)
+ROW_ROLE = Qt.UserRole
+
 class KanbanColumn(QListWidget):
     """Gelişmiş Sürükle-Bırak Destekli Kolon"""
-    task_dropped = Signal(int, str) # task_id, new_status_code
+    task_moved = Signal(int, str, object) # task_id, new_status_code, üstündeki task_id (None: en üst)
 
     def __init__(self, status_code: str):
         super().__init__()
         self.status_code = status_code
+        # Kolondaki kartların (task_id, updated_at) anahtarları, satır sırasıyla
+        self.task_keys: list[tuple] = []
+        self.expanded_ids: set[int] = set()
+        # Sonsuz kaydırma durumu
+        self._cursor = None
+        self._fetch_page = None
+        self._make_card = None
+        self.verticalScrollBar().valueChanged.connect(self._maybe_fetch_more)
         
         # Sürükle Bırak Ayarları
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
         self.setDragDropMode(QAbstractItemView.DragDrop)
         self.setDefaultDropAction(Qt.MoveAction)
+        # Ctrl/Shift ile çoklu seçim (toplu işlemler için)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.itemSelectionChanged.connect(self._mark_selected_cards)
         
+        # Sonsuz kaydırma piksel bazlı kaydırma aralığına göre hesaplanır
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
         # Stil
         self.setSpacing(10)
         self.setStyleSheet("""
@@ -30,6 +50,96 @@ class KanbanColumn(QListWidget):
             QListWidget::item { background: transparent; }
         """)
 
+    def sync_page(self, rows, cursor, fetch_page, make_card) -> None:
+        """Yüklü kartları yeni ilk sayfa(lar)la uzlaştırır; aşağı kaydırınca devamını çeker"""
+        self.sync_tasks(rows, make_card)
+        self._cursor = cursor
+        self._fetch_page = fetch_page
+        self._make_card = make_card
+        # Kolon henüz kaydırılabilir değilse boş alanı doldur
+        QTimer.singleShot(0, self._maybe_fetch_more)
+
+    def _maybe_fetch_more(self, *_) -> None:
+        # Gizli kolonun kaydırma aralığı hesaplanmaz; görünür olunca showEvent tekrar dener
+        if self._cursor is None or self._fetch_page is None or not self.isVisible():
+            return
+        bar = self.verticalScrollBar()
+        if bar.maximum() == 0 and self.count():
+            # Ertelenmiş yerleşimi şimdi yap ki kaydırma aralığı gerçek olsun
+            self.doItemsLayout()
+        if bar.maximum() > 0 and bar.value() < bar.maximum() - self.viewport().height():
+            return
+        rows, self._cursor = self._fetch_page(self._cursor)
+        known = {k[0] for k in self.task_keys}
+        for t in rows:
+            if t.id in known:
+                continue
+            item = QListWidgetItem()
+            self.addItem(item)
+            self._set_row(item, t, self._make_card)
+            self.task_keys.append((t.id, t.updated_at))
+        if self._cursor is not None:
+            QTimer.singleShot(0, self._maybe_fetch_more)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        QTimer.singleShot(0, self._maybe_fetch_more)
+
+    def sync_tasks(self, tasks, make_card) -> None:
+        """Sadece değişen kartları yeniden oluşturur, diğerlerine dokunmaz"""
+        new_keys = [(t.id, t.updated_at) for t in tasks]
+        plan = plan_reconcile(self.task_keys, new_keys)
+        for row in plan.remove:
+            self.takeItem(row)
+        for row in plan.insert:
+            item = QListWidgetItem()
+            self.insertItem(row, item)
+            self._set_row(item, tasks[row], make_card)
+        for row in plan.update:
+            self._set_row(self.item(row), tasks[row], make_card)
+        self.task_keys = new_keys
+        self.expanded_ids &= {k[0] for k in new_keys}
+
+    def invalidate(self) -> None:
+        """Sonraki uzlaştırmada tüm kartlar yeniden kurulsun (iyimser değişiklikleri geri almak için)"""
+        self.task_keys = [(k[0], None) for k in self.task_keys]
+
+    def selected_task_ids(self) -> list[int]:
+        items = sorted(self.selectedItems(), key=self.row)
+        return [self.itemWidget(it).task_id for it in items if self.itemWidget(it)]
+
+    def _mark_selected_cards(self) -> None:
+        # Kart, öğenin seçim arka planını örttüğü için seçim kartın kendisinde gösterilir
+        for row in range(self.count()):
+            item = self.item(row)
+            card = self.itemWidget(item)
+            if card is not None:
+                card.set_selected(item.isSelected())
+
+    def _set_row(self, item, t, make_card) -> None:
+        item.setData(ROW_ROLE, t)
+        self._set_card(item, make_card(t))
+
+    def _set_card(self, item, card) -> None:
+        if card.task_id in self.expanded_ids:
+            card.toggle_expand()
+        card.set_selected(item.isSelected())
+        card.size_changed.connect(lambda _id, c=card, it=item: self._on_card_resized(it, c))
+        item.setSizeHint(card.sizeHint())
+        self.setItemWidget(item, card)
+
+    def _on_card_resized(self, item, card) -> None:
+        if card._expanded:
+            self.expanded_ids.add(card.task_id)
+        else:
+            self.expanded_ids.discard(card.task_id)
+        item.setSizeHint(card.sizeHint())
+
+    def clear(self):
+        super().clear()
+        self.task_keys = []
+        self._cursor = None
+
     def startDrag(self, supportedActions):
         """Sürükleme başladığında kartın görsel kopyasını al"""
         item = self.currentItem()
@@ -54,33 +164,74 @@ class KanbanColumn(QListWidget):
         drag.exec(Qt.MoveAction)
 
     def dragEnterEvent(self, event):
-        if event.source() != self:
-            event.accept()
+        # İç taşımayı QListWidget'a bırakmıyoruz; her bırakma dropEvent'te tek kart taşır
+        if isinstance(event.source(), KanbanColumn) and event.mimeData().hasText():
+            event.acceptProposedAction()
         else:
-            super().dragEnterEvent(event)
+            event.ignore()
 
     def dragMoveEvent(self, event):
-        if event.source() != self:
-            event.accept()
-        else:
-            super().dragMoveEvent(event)
+        self.dragEnterEvent(event)
 
     def dropEvent(self, event):
-        """Bırakıldığında çalışır"""
-        if event.source() == self:
-            # Aynı kolon içindeki sıralama değişimi (İstersen buraya da kod yazılabilir)
-            super().dropEvent(event)
-        else:
-            # Başka kolondan geldi!
-            task_id_str = event.mimeData().text()
-            if task_id_str.isdigit():
-                task_id = int(task_id_str)
-                # Sinyal gönder: "Bu task ID, benim kolonuma (status_code) düştü"
-                self.task_dropped.emit(task_id, self.status_code)
-                event.accept()
+        """Bırakıldığında çalışır: sadece sürüklenen kart yerinde taşınır, yenileme yapılmaz"""
+        source = event.source()
+        task_id_str = event.mimeData().text()
+        if not isinstance(source, KanbanColumn) or not task_id_str.isdigit():
+            event.ignore()
+            return
+        task_id = int(task_id_str)
+        row = self._drop_row(event.position().toPoint())
+        src_row = source.row_of(task_id)
+        if src_row is None:
+            event.ignore()
+            return
+        if source is self:
+            if row > src_row:
+                row -= 1  # kart çıkarılınca alttaki satırlar bir yukarı kayar
+            if row == src_row:
+                event.ignore()  # yeri değişmedi
+                return
+        event.acceptProposedAction()
+        t, expanded = source.take_task(src_row)
+        after_id = self.put_task(t, row, expanded)
+        self.task_moved.emit(task_id, self.status_code, after_id)
+
+    def _drop_row(self, pos) -> int:
+        item = self.itemAt(pos)
+        if item is None:
+            return self.count()
+        row = self.row(item)
+        return row + 1 if pos.y() > self.visualItemRect(item).center().y() else row
+
+    def row_of(self, task_id: int) -> int | None:
+        for row, key in enumerate(self.task_keys):
+            if key[0] == task_id:
+                return row
+        return None
+
+    def take_task(self, row: int):
+        """Kartı kolondan çıkarır; (TaskRow, açık mıydı) döner"""
+        item = self.takeItem(row)
+        task_id = self.task_keys.pop(row)[0]
+        expanded = task_id in self.expanded_ids
+        self.expanded_ids.discard(task_id)
+        return item.data(ROW_ROLE), expanded
+
+    def put_task(self, t, row: int, expanded: bool = False):
+        """Kartı bu kolonun statüsüyle row satırına yerleştirir; üstündeki görevin id'sini döner"""
+        t = replace(t, status=self.status_code, is_done=(self.status_code == "done"))
+        if expanded:
+            self.expanded_ids.add(t.id)
+        item = QListWidgetItem()
+        self.insertItem(row, item)
+        self._set_row(item, t, self._make_card)
+        self.task_keys.insert(row, (t.id, t.updated_at))
+        return self.task_keys[row - 1][0] if row > 0 else None
 
 class KanbanBoard(QWidget):
-    status_changed = Signal(int, str) # Ana pencereye iletilecek sinyal
+    task_moved = Signal(int, str, object) # Ana pencereye iletilecek sinyal
+    selection_changed = Signal()
 
     def __init__(self):
         super().__init__()
@@ -116,33 +267,41 @@ class KanbanBoard(QWidget):
         
         # Liste (KanbanColumn)
         col_list = KanbanColumn(code)
-        col_list.task_dropped.connect(self.status_changed.emit) # Sinyali yukarı taşı
+        col_list.task_moved.connect(self.task_moved.emit) # Sinyali yukarı taşı
+        col_list.itemSelectionChanged.connect(self.selection_changed.emit)
         
         vbox.addWidget(header)
         vbox.addWidget(col_list)
         return container
 
     def get_column_by_status(self, status):
-        if status == "in_progress": return self.findChild(KanbanColumn, "kanban_col_in_progress") # ID ile bulmak zor olabilir, direkt referans:
-        # Daha basit yöntem:
-        return None # Aşağıdaki add_task fonksiyonunda yöneteceğiz
+        for col in self.columns():
+            if col.status_code == status:
+                return col
+        return None
+
+    def columns(self) -> list[KanbanColumn]:
+        return [c.findChild(KanbanColumn) for c in (self.todo_col, self.prog_col, self.done_col)]
+
+    def selected_task_ids(self) -> list[int]:
+        return [tid for col in self.columns() for tid in col.selected_task_ids()]
+
+    def clear_selection(self) -> None:
+        for col in self.columns():
+            col.clearSelection()
+
+    def invalidate(self) -> None:
+        for col in self.columns():
+            col.invalidate()
 
     def clear_all(self):
-        # Children içindeki listeleri bulup temizle
-        self.todo_col.findChild(QListWidget).clear()
-        self.prog_col.findChild(QListWidget).clear()
-        self.done_col.findChild(QListWidget).clear()
+        for col in self.columns():
+            col.clear()
 
-    def add_task(self, task, card_widget):
-        item = QListWidgetItem()
-        item.setSizeHint(card_widget.sizeHint())
-        
-        # Hangi kolona eklenecek?
-        target_list = self.todo_col.findChild(QListWidget)
-        if task.status == "in_progress": 
-            target_list = self.prog_col.findChild(QListWidget)
-        elif task.status == "done": 
-            target_list = self.done_col.findChild(QListWidget)
-        
-        target_list.addItem(item)
-        target_list.setItemWidget(item, card_widget)
\ No newline at end of file
+    def sync_pages(self, fetch_page, make_card, page_size: int) -> None:
+        """Her kolon kendi statüsü için pano sırasıyla ayrı sayfalanır: fetch_page(imleç, limit, statü)"""
+        for col in self.columns():
+            limit = max(page_size, col.count())
+            rows, cursor = fetch_page(None, limit, col.status_code)
+            col.sync_page(rows, cursor,
+                          lambda cur, st=col.status_code: fetch_page(cur, page_size, st), make_card)
@@ -1,39 +1,74 @@
 from __future__ import annotations
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QListWidget, QListWidgetItem,
-    QStackedWidget, QLabel, QStyle, QMessageBox, QComboBox, QDialog
+    QStackedWidget, QLabel, QStyle, QMessageBox, QComboBox, QDialog, QInputDialog, QCheckBox, QApplication
 )
 
 from taskscope.db.database import SessionLocal, DB_PATH
-from taskscope.repositories.task_repo import TaskRepo
+from taskscope.repositories.task_repo import TaskRepo, PAGE_SIZE
+from taskscope.models.task import tag_key, DEFAULT_PROJECT
 from taskscope.services.notification_service import NotificationWorker
+from taskscope.services.background_writer import BackgroundWriter
+from taskscope.services.change_watcher import ChangeWatcher
+from taskscope.services.task_store import TaskStore
+from taskscope.services.archive import archive_days, archive_cutoff, ARCHIVE_INTERVAL_MS, FIRST_RUN_DELAY_MS
+from taskscope.services.startup_profile import StartupProfile
+from taskscope.services import tracing
+from taskscope.services.tracing import span
 from taskscope.ui.task_editor_dialog import TaskEditorDialog
 from taskscope.ui.task_card import TaskCard
+from taskscope.ui.task_list_view import TaskListView
+from taskscope.ui.batch_action_bar import BatchActionBar, DueDateDialog
+from taskscope.ui.archive_dialog import ArchiveDialog
 # Senin dosyanda olan importları geri getirdim
 from taskscope.ui.kanban_board import KanbanBoard
 from taskscope.ui.pomodoro_widget import PomodoroWidget
-from taskscope.ui.stats_widget import StatsWidget
 # Theme dosyasındaki syntax hatasını da burada bypass ediyoruz, main.py hallediyor.
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, profile: StartupProfile | None = None):
         super().__init__()
         self.setWindowTitle("TaskScope - Proje Yönetimi")
         self.resize(1280, 850)
 
         self.session = SessionLocal()
         self.repo = TaskRepo(self.session)
-        self.current_project_filter = None
+        # Tüm görünümlerin ortak önbelleği; kim yazarsa yazsın değişiklik sinyali buradan gelir
+        self.store = TaskStore(self.repo, self)
+        # Sinyal seli tek yenilemeye indirgenir (olay döngüsünün bir sonraki turunda)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh_data)
+        for signal in (self.store.task_added, self.store.task_changed, self.store.task_removed, self.store.reset):
+            signal.connect(self._schedule_refresh)
+        # Proje kenar çubuğu arama/filtre yenilemelerinden bağımsız: sadece üyelik değişince
+        self.store.projects_changed.connect(self._sync_project_list)
+        self.current_project_filter: str | None = None
+        self.profile = profile or StartupProfile()
+        # İlk çizimden sonra yapılacak işler (veri, bildirim servisi) için
+        self._first_paint_done = False
+        self.notification_thread: NotificationWorker | None = None
+        # Tekil yazmalar (işaretleme, taşıma, düzenleme) arka planda, birleştirilip toplu commit edilir
+        self.writer = BackgroundWriter(parent=self)
+        self.writer.failed.connect(self.on_write_failed)
+        # Eski bitmiş görevler arka plan yazıcısıyla arşive taşınır (TASKSCOPE_ARCHIVE_DAYS, 0 = kapalı)
+        self.archive_days = archive_days()
+        self._archive_timer = QTimer(self)
+        self._archive_timer.setInterval(ARCHIVE_INTERVAL_MS)
+        self._archive_timer.timeout.connect(self.run_archive)
+        # Başka süreçlerin commit'leri (ikinci pencere, cli import, eşitleme); ilk çizimden sonra başlar
+        self.change_watcher = ChangeWatcher(parent=self)
+        self.change_watcher.tables_changed.connect(self._on_external_change)
+        QApplication.instance().applicationStateChanged.connect(
+            lambda state: self.change_watcher.set_active(state == Qt.ApplicationActive))
 
         self.init_ui()
-        
-        # Bildirim servisi
-        self.notification_thread = NotificationWorker()
-        self.notification_thread.start()
-
-        self.refresh_data()
+        # TASKSCOPE_TRACE açıksa en yavaş son işlemler sağ üstte gösterilir
+        if tracing.enabled():
+            from taskscope.ui.trace_overlay import TraceOverlay
+            self.trace_overlay = TraceOverlay(tracing.tracer(), self)
 
     def init_ui(self):
         main_widget = QWidget()
@@ -56,11 +91,37 @@ class MainWindow(QMainWindow):
         self.project_list = QListWidget()
         self.project_list.setCursor(Qt.PointingHandCursor)
         self.project_list.itemClicked.connect(self.filter_by_project)
+        self.project_list.addItem(QListWidgetItem("Tümü"))
+        self.project_list.setCurrentRow(0)
         sb_layout.addWidget(self.project_list)
+
+        # Etiketler: işaretlenenler tam eşleşmeyle filtreler, sayılar canlı güncellenir
+        tag_header = QHBoxLayout()
+        lbl_tags = QLabel("ETİKETLER")
+        lbl_tags.setStyleSheet("font-weight:bold; font-size:12px; opacity:0.7;")
+        tag_header.addWidget(lbl_tags)
+        tag_header.addStretch()
+        self.tag_match_combo = QComboBox()
+        self.tag_match_combo.addItems(["Hepsi", "Herhangi biri"])
+        self.tag_match_combo.setToolTip("Seçili etiketlerin hepsini (VE) ya da herhangi birini (VEYA) taşıyanlar")
+        self.tag_match_combo.currentIndexChanged.connect(self.refresh_data)
+        tag_header.addWidget(self.tag_match_combo)
+        sb_layout.addLayout(tag_header)
+
+        self.tag_list = QListWidget()
+        self.tag_list.setCursor(Qt.PointingHandCursor)
+        self.tag_list.itemChanged.connect(self.refresh_data)
+        sb_layout.addWidget(self.tag_list)
         
         self.stats_lbl = QLabel("...")
         self.stats_lbl.setStyleSheet("font-size: 12px; margin-top:10px; opacity:0.6;")
         sb_layout.addWidget(self.stats_lbl)
+
+        # Arşiv sadece istenince sorgulanır; arama "Arşiv" işaretliyken eşleşme sayısı burada görünür
+        self.archive_btn = QPushButton("Arşiv...")
+        self.archive_btn.setCursor(Qt.PointingHandCursor)
+        self.archive_btn.clicked.connect(self.open_archive)
+        sb_layout.addWidget(self.archive_btn)
         
         sb_layout.addStretch() 
         self.pomodoro = PomodoroWidget()
@@ -89,6 +150,16 @@ class MainWindow(QMainWindow):
         self.filter_combo.setFixedHeight(40)
         self.filter_combo.currentIndexChanged.connect(self.refresh_data)
 
+        # Arama sonuçlarının sıralaması (Alaka = bm25 puanı)
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems(["Tarihe Göre", "Alakaya Göre"])
+        self.sort_combo.setFixedHeight(40)
+        self.sort_combo.currentIndexChanged.connect(self.refresh_data)
+
+        self.archive_check = QCheckBox("Arşiv")
+        self.archive_check.setToolTip("Aramada arşivlenmiş görevleri de say (sonuçlar Arşiv penceresinde)")
+        self.archive_check.toggled.connect(self.refresh_data)
+
         # Görünüm Butonu
         self.view_toggle = QPushButton(" Liste")
         self.view_toggle.setIcon(self.style().standardIcon(QStyle.SP_FileDialogListView))
@@ -111,73 +182,142 @@ class MainWindow(QMainWindow):
         # Stil QSS dosyasından gelecek, burayı temiz bıraktık
         add_btn.clicked.connect(self.add_task)
 
+        # Her satırı ayrı görev olarak tek seferde ekle
+        bulk_add_btn = QPushButton(" Çoklu")
+        bulk_add_btn.setIcon(self.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        bulk_add_btn.setCursor(Qt.PointingHandCursor)
+        bulk_add_btn.setFixedHeight(40)
+        bulk_add_btn.clicked.connect(self.bulk_add_tasks)
+
         top_bar.addWidget(self.search_edit, 1)
         top_bar.addWidget(self.filter_combo)
+        top_bar.addWidget(self.sort_combo)
+        top_bar.addWidget(self.archive_check)
         top_bar.addWidget(self.view_toggle)
         top_bar.addWidget(self.stats_btn)
         top_bar.addWidget(add_btn)
+        top_bar.addWidget(bulk_add_btn)
         content_layout.addLayout(top_bar)
 
+        # --- TOPLU İŞLEM ÇUBUĞU (seçim varken görünür) ---
+        self.batch_bar = BatchActionBar()
+        self.batch_bar.status_requested.connect(self.on_batch_status)
+        self.batch_bar.retag_requested.connect(self.on_batch_retag)
+        self.batch_bar.due_requested.connect(self.on_batch_due)
+        self.batch_bar.delete_requested.connect(self.on_batch_delete)
+        self.batch_bar.clear_requested.connect(self.clear_selection)
+        content_layout.addWidget(self.batch_bar)
+
         # --- SAYFALAR (STACKED WIDGET GERİ GELDİ) ---
         self.stack = QStackedWidget()
         
-        # 1. Kanban Sayfası
-        self.kanban = KanbanBoard()
-        self.kanban.status_changed.connect(self.on_kanban_drop)
-        self.stack.addWidget(self.kanban)
-        
-        # 2. Liste Sayfası
-        self.simple_list = QListWidget()
-        self.simple_list.setSpacing(6)
-        self.simple_list.setSelectionMode(QListWidget.NoSelection)
-        self.stack.addWidget(self.simple_list)
+        # Pano ve Analiz sayfaları ilk açıldıklarında kurulur (_ensure_kanban / _ensure_stats_page)
+        self.kanban: KanbanBoard | None = None
+        self.stats_page = None
 
-        # 3. İstatistik Sayfası
-        self.stats_page = StatsWidget()
-        self.stack.addWidget(self.stats_page)
+        # Liste Sayfası (model/view: sadece görünen kartlar çizilir)
+        self.simple_list = TaskListView()
+        self.simple_list.set_subtask_loader(self.repo.list_subtasks)
+        self.simple_list.request_edit.connect(self.edit_task)
+        self.simple_list.request_delete.connect(self.delete_task)
+        self.simple_list.toggled_done.connect(self.on_task_done)
+        self.simple_list.toggled_subtask.connect(self.on_subtask_changed)
+        self.simple_list.selection_changed.connect(self.on_selection_changed)
+        self.stack.addWidget(self.simple_list)
         
         content_layout.addWidget(self.stack)
         main_layout.addWidget(content_widget)
         
         # Varsayılan olarak listeyi göster (Kanban yerine)
-        self.stack.setCurrentIndex(1) 
+        self.stack.setCurrentWidget(self.simple_list)
+
+    def _ensure_kanban(self) -> KanbanBoard:
+        if self.kanban is None:
+            self.kanban = KanbanBoard()
+            self.kanban.task_moved.connect(self.on_kanban_drop)
+            self.kanban.selection_changed.connect(self.on_selection_changed)
+            self.stack.addWidget(self.kanban)
+        return self.kanban
+
+    def _ensure_stats_page(self):
+        if self.stats_page is None:
+            # matplotlib sadece Analiz sayfası ilk açıldığında yüklenir
+            from taskscope.ui.stats_widget import StatsWidget
+            self.stats_page = StatsWidget(self.store)
+            self.stack.addWidget(self.stats_page)
+        return self.stats_page
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            # Pencere ekrana geldikten sonra, olay döngüsünün bir sonraki turunda
+            QTimer.singleShot(0, self._after_first_paint)
+
+    def _after_first_paint(self):
+        self.profile.mark("ilk çizim")
+        self.store.load()
+        self.refresh_data()
+        self.profile.mark("ilk veri yükleme")
+        # Bildirim servisi
+        self.notification_thread = NotificationWorker()
+        self.notification_thread.start()
+        self.change_watcher.start()
+        self.profile.mark("bildirim servisi")
+        self.profile.report()
+        if self.archive_days:
+            QTimer.singleShot(FIRST_RUN_DELAY_MS, self.run_archive)
+            self._archive_timer.start()
 
     def toggle_view(self):
         self.stats_btn.setChecked(False)
+        self.clear_selection()
         if self.view_toggle.isChecked():
-            self.stack.setCurrentIndex(0) # Kanban
+            self.stack.setCurrentWidget(self._ensure_kanban()) # Kanban
             self.view_toggle.setText(" Pano")
             self.view_toggle.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
         else:
-            self.stack.setCurrentIndex(1) # Liste
+            self.stack.setCurrentWidget(self.simple_list) # Liste
             self.view_toggle.setText(" Liste")
             self.view_toggle.setIcon(self.style().standardIcon(QStyle.SP_FileDialogListView))
         self.refresh_data()
 
     def toggle_stats(self):
+        self.clear_selection()
         if self.stats_btn.isChecked():
             self.view_toggle.setChecked(False)
             self.view_toggle.setText(" Görünüm")
-            self.stack.setCurrentIndex(2) # İstatistik
+            self.stack.setCurrentWidget(self._ensure_stats_page()) # İstatistik
             self.stats_page.refresh_stats()
         else:
-            self.stack.setCurrentIndex(1)
+            self.stack.setCurrentWidget(self.simple_list)
+            self.refresh_data()
 
     def filter_by_project(self, item):
-        txt = item.text()
-        self.current_project_filter = None if txt == "Tümü" else txt
+        # "Tümü" satırında veri yok (None)
+        self.current_project_filter = item.data(Qt.UserRole)
         self.refresh_data()
 
+    def _on_external_change(self, tables):
+        # Hangi satırların değiştiği bilinmiyor: sadece etkilenen görünümler yeniden yüklenir
+        if tables & {"tasks", "subtasks"}:
+            self.session.expire_all()
+            self.store.load()
+            if "tasks" in tables and self.notification_thread is not None:
+                self.notification_thread.on_tasks_changed("updated", None)
+        elif "archived_tasks" in tables and self.archive_check.isChecked():
+            self.refresh_data()
+
+    def _schedule_refresh(self, *_):
+        self._refresh_timer.start(0)
+
     def refresh_data(self):
-        # Sol Menü Projeler
-        current_row = self.project_list.currentRow()
-        self.project_list.clear()
-        self.project_list.addItem(QListWidgetItem("Tümü"))
-        for p in self.repo.get_projects():
-            if p: self.project_list.addItem(p)
-        self.project_list.setCurrentRow(current_row if current_row >= 0 else 0)
+        with span("refresh_data", "ui"):
+            self._refresh_data()
 
-        # Veri çekme (Hata kontrolü ile)
+    def _refresh_data(self):
+        self._refresh_timer.stop()
+        # Veri çekme (Hata kontrolü ile): sadece ilk sayfa(lar), kalanı kaydırdıkça gelir
         try:
             filter_txt = self.filter_combo.currentText()
             mode = "all"
@@ -185,77 +325,274 @@ class MainWindow(QMainWindow):
             elif filter_txt == "Bu Hafta": mode = "week"
             elif filter_txt == "Tamamlananlar": mode = "done"
 
-            tasks = self.repo.list_tasks(self.search_edit.text(), mode)
-            self.stats_lbl.setText(f"Toplam: {len(tasks)} görev")
+            search = self.search_edit.text()
+            order = "rank" if self.sort_combo.currentIndex() == 1 else "default"
+            tags = self.selected_tags()
+            match_all = self.tag_match_combo.currentIndex() == 0
+            project = self.current_project_filter
+
+            if search.strip():
+                # Tam metin arama FTS5 ile SQL'de
+                def fetch_page(cursor, limit=PAGE_SIZE, status=None):
+                    return self.repo.list_task_page(search, mode, order, cursor, limit, status, tags, match_all,
+                                                    project)
+
+                # Pano her zaman kullanıcının sürükleyerek verdiği sırayla gösterilir
+                def fetch_board_page(cursor, limit=PAGE_SIZE, status=None):
+                    return self.repo.list_task_page(search, mode, "board", cursor, limit, status, tags, match_all,
+                                                    project)
+
+                with span("refresh_data.count", "ui"):
+                    total = self.repo.count_tasks(search, mode, tags=tags, match_all=match_all, project=project)
+                    # VEYA'da daraltma yok: diğer etiketler seçime eklenebilsin diye tüm sonuç sayılır
+                    tag_counts = self.repo.tag_counts(search, mode, tags if match_all else (), match_all, project)
+            else:
+                # Filtre değişiklikleri bellekteki indekslerden (veri yerleşikse)
+                def fetch_page(cursor, limit=PAGE_SIZE, status=None):
+                    return self.store.list_page(mode, "default", cursor, limit, status, tags, match_all, project)
+
+                def fetch_board_page(cursor, limit=PAGE_SIZE, status=None):
+                    return self.store.list_page(mode, "board", cursor, limit, status, tags, match_all, project)
+
+                with span("refresh_data.count", "ui"):
+                    total = self.store.count(mode, tags, match_all, project)
+                    tag_counts = self.store.tag_counts(mode, tags if match_all else (), match_all, project)
+
+            self._sync_tag_list(tag_counts)
+
+            self.stats_lbl.setText(f"Toplam: {total} görev")
+            if search.strip() and self.archive_check.isChecked():
+                with span("refresh_data.count_archived", "ui"):
+                    archived = self.repo.count_archived(search)
+                self.archive_btn.setText(f"Arşivde {archived} eşleşme...")
+            else:
+                self.archive_btn.setText("Arşiv...")
+
+            # Görünümler (task_id, updated_at) anahtarıyla uzlaştırılır:
+            # sadece eklenen/silinen/değişen kartlara dokunulur. Gizli görünüm
+            # tazelenmez; görünür olduğunda (toggle_view) zaten yenilenir.
+            current = self.stack.currentWidget()
+            if current is self.simple_list:
+                # Yüklü pencere kadar satır tazelenir ki kaydırma konumu korunsun
+                with span("refresh_data.fetch", "ui"):
+                    rows, cursor = fetch_page(None, max(PAGE_SIZE, self.simple_list.loaded_count()))
+                with span("refresh_data.sync_list", "ui", rows=len(rows)):
+                    self.simple_list.sync_page(rows, cursor, fetch_page)
+            elif current is self.kanban:
+                with span("refresh_data.sync_kanban", "ui"):
+                    self.kanban.sync_pages(fetch_board_page, self._make_kanban_card, PAGE_SIZE)
+            elif current is self.stats_page:
+                self.stats_page.refresh_stats()
         except Exception as e:
             print(f"Veri hatası: {e}")
-            return
 
-        # Kanban Temizle
-        self.kanban.clear_all()
-        # Liste Temizle
-        self.simple_list.clear()
-
-        for t in tasks:
-            # Kanban Kartı
-            card_kanban = TaskCard(t.id, t.title, t.description, t.due_at, t.is_done, t.priority, t.tags, t.subtasks)
-            card_kanban.request_edit.connect(self.edit_task)
-            card_kanban.toggled_done.connect(self.on_task_done)
-            card_kanban.toggled_subtask.connect(self.on_subtask_changed)
-            self.kanban.add_task(t, card_kanban)
-            
-            # Liste Kartı
-            card_list = TaskCard(t.id, t.title, t.description, t.due_at, t.is_done, t.priority, t.tags, t.subtasks)
-            card_list.request_edit.connect(self.edit_task)
-            card_list.toggled_done.connect(self.on_task_done)
-            card_list.toggled_subtask.connect(self.on_subtask_changed)
-            
-            item = QListWidgetItem()
-            item.setSizeHint(card_list.sizeHint())
-            self.simple_list.addItem(item)
-            self.simple_list.setItemWidget(item, card_list)
-            
-        if self.stack.currentIndex() == 2:
-            self.stats_page.refresh_stats()
+    def _sync_project_list(self) -> None:
+        """Proje satırlarını yerinde günceller; sadece sayısı değişen satırın metnine dokunulur"""
+        with span("sync_project_list", "ui"):
+            counts = self.store.project_counts()
+            rows = {self.project_list.item(i).data(Qt.UserRole): self.project_list.item(i)
+                    for i in range(1, self.project_list.count())}
+            for name in [n for n in rows if n not in counts]:
+                self.project_list.takeItem(self.project_list.row(rows.pop(name)))
+            for name, (open_n, done_n) in counts.items():
+                text = f"{name} ({open_n}/{open_n + done_n})"
+                item = rows.get(name)
+                if item is None:
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.UserRole, name)
+                    # "Tümü" hep ilk satır; projeler ada göre
+                    self.project_list.insertItem(1 + sum(1 for n in rows if n.lower() < name.lower()), item)
+                    rows[name] = item
+                elif item.text() != text:
+                    item.setText(text)
+                item.setToolTip(f"{open_n} açık, {done_n} biten")
+            if self.current_project_filter is not None and self.current_project_filter not in counts:
+                # Filtrelenen projede görev kalmadı
+                self.current_project_filter = None
+                self.project_list.setCurrentRow(0)
+                self._schedule_refresh()
+
+    def selected_tags(self) -> list[str]:
+        return [self.tag_list.item(i).data(Qt.UserRole) for i in range(self.tag_list.count())
+                if self.tag_list.item(i).checkState() == Qt.Checked]
+
+    def _sync_tag_list(self, counts: dict[str, int]) -> None:
+        """Etiket listesini yerinde günceller: seçim ve kaydırma korunur, sadece değişen satırlara dokunulur"""
+        by_key = {tag_key(name): (name, n) for name, n in counts.items()}
+        self.tag_list.blockSignals(True)
+        try:
+            for i in reversed(range(self.tag_list.count())):
+                item = self.tag_list.item(i)
+                key = tag_key(item.data(Qt.UserRole))
+                if key not in by_key:
+                    # Seçili etiket sonuçta kalmasa da listeden düşmesin
+                    if item.checkState() == Qt.Checked:
+                        by_key[key] = (item.data(Qt.UserRole), 0)
+                    else:
+                        self.tag_list.takeItem(i)
+            existing = {tag_key(self.tag_list.item(i).data(Qt.UserRole)): self.tag_list.item(i)
+                        for i in range(self.tag_list.count())}
+            for key in sorted(by_key):
+                name, n = by_key[key]
+                text = f"{name} ({n})"
+                item = existing.get(key)
+                if item is None:
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.UserRole, name)
+                    item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                    item.setCheckState(Qt.Unchecked)
+                    # Alfabetik yerine ekle
+                    row = sum(1 for k in existing if k < key)
+                    self.tag_list.insertItem(row, item)
+                    existing[key] = item
+                elif item.text() != text:
+                    item.setText(text)
+        finally:
+            self.tag_list.blockSignals(False)
+
+    def _make_kanban_card(self, t) -> TaskCard:
+        card = TaskCard(t.id, t.title, t.description, t.due_at, t.is_done, t.priority, t.tags,
+                        subtask_counts=(t.subtask_done, t.subtask_total),
+                        subtask_loader=self.repo.list_subtasks, recurring=t.recurring)
+        card.request_edit.connect(self.edit_task)
+        card.request_delete.connect(self.delete_task)
+        card.toggled_done.connect(self.on_task_done)
+        card.toggled_subtask.connect(self.on_subtask_changed)
+        return card
+
+    # Yazmalardan sonra refresh_data çağrılmaz: commit edilince TaskStore sinyalleri yenilemeyi planlar.
+    # Aynı anahtarlı bekleyen yazma (ör. aynı kutunun art arda işaretlenmesi) yenisiyle birleşir.
+    def on_kanban_drop(self, task_id, new_status, after_id):
+        # Kart panoda zaten taşındı (iyimser); sadece o satır arka planda yazılır, yenileme yok
+        self.writer.submit("move_task", task_id, new_status, after_id, key=("move", task_id))
 
-    def on_kanban_drop(self, task_id, new_status):
-        # Basit statü güncelleme (todo -> done mantığı)
-        # Eğer kanban'da sürükle bırak yapıldıysa, veritabanını güncelle
-        # (Şimdilik repo'da update_status yok, basitçe done yapalım)
-        pass 
+    def on_write_failed(self, commands, message):
+        # İyimser değişiklikler kaydedilemedi: görünümleri veritabanındaki gerçek durumla eşitle
+        self.simple_list.invalidate()
+        if self.kanban is not None:
+            self.kanban.invalidate()
+        self.store.load()
+        QMessageBox.warning(self, "Kaydedilemedi", f"{len(commands)} değişiklik kaydedilemedi:\n{message}")
 
     def on_task_done(self, task_id, is_done):
-        self.repo.set_done(task_id, is_done)
-        self.refresh_data()
+        self.writer.submit("set_done", task_id, is_done, key=("done", task_id))
         
     def on_subtask_changed(self, subtask_id, is_done):
-        self.repo.set_subtask_done(subtask_id, is_done)
+        self.writer.submit("set_subtask_done", subtask_id, is_done, key=("subtask", subtask_id))
 
     def add_task(self):
-        dlg = TaskEditorDialog(self)
+        # Proje filtresi seçiliyse yeni görev o projeye açılır
+        dlg = TaskEditorDialog(self, project=self.current_project_filter or DEFAULT_PROJECT,
+                               projects=list(self.store.project_counts()))
         if dlg.exec():
             try:
-                title, desc, due, priority, tags, subtasks = dlg.get_values()
-                self.repo.create_task(title, desc, due, priority, tags, subtasks)
-                self.refresh_data()
+                title, desc, due, priority, tags, subtasks, reminders, project, recurrence = dlg.get_values()
+                self.writer.submit("create_task", title, desc, due, priority, tags, subtasks, reminders, project,
+                                   recurrence)
             except Exception as e:
                 QMessageBox.critical(self, "Hata", str(e))
 
     def edit_task(self, task_id):
+        # Diyalog bekleyen yazmalar uygulanmış hâli göstersin; yazıcı kendi oturumunda commit
+        # ettiğinden get_task bu oturumdaki eski nesneyi veritabanından tazeler
+        self.writer.flush()
         t = self.repo.get_task(task_id)
         if not t: return
-        dlg = TaskEditorDialog(self, t.title, t.description, t.due_at, t.priority, t.tags)
+        dlg = TaskEditorDialog(self, t.title, t.description, t.due_at, t.priority, t.tags, t.reminders,
+                               t.project, list(self.store.project_counts()), t.recurrence)
         if dlg.exec():
-            title, desc, due, priority, tags, _ = dlg.get_values()
-            self.repo.update_task(task_id, title, desc, due, priority, tags)
-            self.refresh_data()
+            title, desc, due, priority, tags, _, reminders, project, recurrence = dlg.get_values()
+            self.writer.submit("update_task", task_id, title, desc, due, priority, tags, reminders, project,
+                               recurrence, key=("edit", task_id))
             
+    # --- Toplu işlemler: her biri tek transaction + tek bildirim (tek yenileme) ---
+    def selected_task_ids(self) -> list[int]:
+        current = self.stack.currentWidget()
+        if current is self.kanban:
+            return self.kanban.selected_task_ids()
+        if current is self.simple_list:
+            return self.simple_list.selected_task_ids()
+        return []
+
+    def on_selection_changed(self):
+        self.batch_bar.set_count(len(self.selected_task_ids()))
+
+    def clear_selection(self):
+        if self.kanban is not None:
+            self.kanban.clear_selection()
+        self.simple_list.clearSelection()
+
+    def _run_batch(self, action, *args):
+        ids = self.selected_task_ids()
+        if not ids:
+            return
+        # Toplu işlem, önceki tekil yazmaların üzerine uygulanmalı
+        self.writer.flush()
+        try:
+            action(ids, *args)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
+            return
+        self.clear_selection()
+
+    def on_batch_status(self, status):
+        self._run_batch(self.repo.bulk_set_status, status)
+
+    def on_batch_retag(self):
+        text, ok = QInputDialog.getText(
+            self, "Etiketler", "Eklenecek etiketler (virgülle). Çıkarmak için başına - koyun:"
+        )
+        if not ok:
+            return
+        parts = [p.strip() for p in text.split(",") if p.strip()]
+        add = [p for p in parts if not p.startswith("-")]
+        remove = [p[1:].strip() for p in parts if p.startswith("-")]
+        if add or remove:
+            self._run_batch(self.repo.bulk_retag, add, remove)
+
+    def on_batch_due(self):
+        dlg = DueDateDialog(self)
+        if dlg.exec():
+            self._run_batch(self.repo.bulk_set_due, dlg.value())
+
+    def on_batch_delete(self):
+        n = len(self.selected_task_ids())
+        if n and QMessageBox.question(self, "Onay", f"{n} görev silinsin mi?") == QMessageBox.Yes:
+            self._run_batch(self.repo.bulk_delete)
+
+    def bulk_add_tasks(self):
+        text, ok = QInputDialog.getMultiLineText(self, "Çoklu Görev", "Her satır bir görev:")
+        if not ok:
+            return
+        items = [{"title": line} for line in text.splitlines() if line.strip()]
+        if items:
+            self.writer.flush()
+            try:
+                self.repo.bulk_create(items)
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", str(e))
+
+    def run_archive(self):
+        cutoff = archive_cutoff(self.archive_days)
+        if cutoff is not None:
+            self.writer.submit("archive_done", cutoff, key=("archive",))
+
+    def open_archive(self):
+        # Arşiv penceresi bekleyen yazmalar uygulanmış hâli göstersin
+        self.writer.flush()
+        search = self.search_edit.text() if self.archive_check.isChecked() else ""
+        ArchiveDialog(self.repo, search, self).exec()
+
     def delete_task(self, task_id):
          if QMessageBox.question(self, "Onay", "Silinsin mi?") == QMessageBox.Yes:
-            self.repo.delete_task(task_id)
-            self.refresh_data()
+            self.writer.submit("delete_task", task_id)
 
     def closeEvent(self, event):
-        self.notification_thread.stop()
+        # Bekleyen yazmaların hepsi commit edilmeden kapanma
+        self.writer.stop()
+        if self.notification_thread is not None:
+            self.notification_thread.stop()
+        self.change_watcher.stop()
+        self.store.close()
         self.session.close()
         super().closeEvent(event)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from bisect import bisect_left
+from typing import Hashable, Sequence
+
+
+@dataclass
+class ReconcilePlan:
+    """Eski satır listesini yenisine çeviren en küçük işlem kümesi.
+
+    Sırası: önce `remove` (eski indeksler, büyükten küçüğe), sonra `insert`
+    (yeni indeksler, küçükten büyüğe), en son `update` (yeni indeksler).
+    """
+    remove: list[int] = field(default_factory=list)
+    insert: list[int] = field(default_factory=list)
+    update: list[int] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.remove or self.insert or self.update)
+
+
+def _stable_positions(old_pos: list[int]) -> set[int]:
+    """Yerinde kalabilecek satırlar: eski konumların en uzun artan alt dizisi"""
+    tails: list[int] = []
+    tails_idx: list[int] = []
+    prev = [-1] * len(old_pos)
+    for i, p in enumerate(old_pos):
+        k = bisect_left(tails, p)
+        if k == len(tails):
+            tails.append(p)
+            tails_idx.append(i)
+        else:
+            tails[k] = p
+            tails_idx[k] = i
+        prev[i] = tails_idx[k - 1] if k > 0 else -1
+    keep = set()
+    i = tails_idx[-1] if tails_idx else -1
+    while i >= 0:
+        keep.add(i)
+        i = prev[i]
+    return keep
+
+
+def plan_reconcile(old: Sequence[tuple[Hashable, object]],
+                   new: Sequence[tuple[Hashable, object]]) -> ReconcilePlan:
+    """(anahtar, sürüm) çiftlerinden oluşan iki listeyi karşılaştırır.
+
+    Sürümü değişen satırlar güncellenir, sırası bozulan satırlar silinip
+    yeni yerine eklenir; diğer satırlara dokunulmaz.
+    """
+    old_index = {key: i for i, (key, _) in enumerate(old)}
+    plan = ReconcilePlan()
+
+    # Yeni listede hâlâ bulunan eski satırlar ve yeni sıradaki eski konumları
+    survivors = [(j, old_index[key]) for j, (key, _) in enumerate(new) if key in old_index]
+    stable = _stable_positions([p for _, p in survivors])
+    kept_new = {survivors[i][0] for i in stable}
+    kept_old = {survivors[i][1] for i in stable}
+
+    plan.remove = [i for i in range(len(old) - 1, -1, -1) if i not in kept_old]
+    for j, (key, version) in enumerate(new):
+        if j not in kept_new:
+            plan.insert.append(j)
+        elif old[old_index[key]][1] != version:
+            plan.update.append(j)
+    return plan
@@ -1,17 +1,14 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-from collections import Counter
 
-from taskscope.db.database import SessionLocal
-from taskscope.repositories.task_repo import TaskRepo
+from taskscope.services.task_store import TaskStore
+from taskscope.services.tracing import span
+from taskscope.ui.charts import ChartView, ProjectPieChart, StatusBarChart
 
 class StatsWidget(QWidget):
-    def __init__(self):
+    def __init__(self, store: TaskStore):
         super().__init__()
-        self.session = SessionLocal()
-        self.repo = TaskRepo(self.session)
+        # Ortak görev önbelleği: sayımlar bellekteki indekslerden (değilse toplama sorgularıyla)
+        self.store = store
         self.current_theme_is_dark = False 
         
         self.init_ui()
@@ -25,82 +22,48 @@ class StatsWidget(QWidget):
         self.title.setStyleSheet("font-size: 18px; font-weight: bold; margin: 10px;")
         layout.addWidget(self.title)
 
-        # Grafikler Yan Yana
+        # Özet: toplam / biten / geciken
+        self.summary_lbl = QLabel()
+        self.summary_lbl.setStyleSheet("font-size: 13px; margin: 0 10px;")
+        layout.addWidget(self.summary_lbl)
+
+        # Grafikler Yan Yana (arka planda çizilir, hazır görüntü gösterilir)
         charts_layout = QHBoxLayout()
         
         # 1. Grafik: Proje Dağılımı
-        self.fig1 = Figure(figsize=(4, 3), dpi=100)
-        self.canvas1 = FigureCanvas(self.fig1)
-        charts_layout.addWidget(self.canvas1)
+        self.project_chart = ChartView(ProjectPieChart())
+        charts_layout.addWidget(self.project_chart)
 
         # 2. Grafik: Statü Durumu
-        self.fig2 = Figure(figsize=(4, 3), dpi=100)
-        self.canvas2 = FigureCanvas(self.fig2)
-        charts_layout.addWidget(self.canvas2)
+        self.status_chart = ChartView(StatusBarChart())
+        charts_layout.addWidget(self.status_chart)
         
-        layout.addLayout(charts_layout)
+        layout.addLayout(charts_layout, 1)
 
     def update_theme(self, is_dark):
         """Temaya göre grafik renklerini güncelle"""
         self.current_theme_is_dark = is_dark
         
-        # Grafiklerin arka plan rengi
-        bg_color = '#2D3748' if is_dark else '#F5F7FA'
-        
-        self.fig1.patch.set_facecolor(bg_color)
-        self.fig2.patch.set_facecolor(bg_color)
-        
         # Yeniden çiz
         self.refresh_stats()
 
     def refresh_stats(self):
-        tasks = self.repo.list_tasks()
-        
-        # Tema Renkleri
-        text_color = '#E2E8F0' if self.current_theme_is_dark else '#333333'
-        
-        # --- Grafik 1: Pasta ---
-        self.fig1.clear()
-        ax1 = self.fig1.add_subplot(111)
-        
-        projects = [t.project for t in tasks if t.project]
-        proj_counts = Counter(projects)
-        colors = ['#FFB7B2', '#B5EAD7', '#C7CEEA', '#E2F0CB', '#FFDAC1']
+        with span("StatsWidget.refresh_stats", "ui"):
+            self._refresh_stats()
+
+    def _refresh_stats(self):
+        with span("StatsWidget.task_stats", "ui"):
+            stats = self.store.task_stats()
+        self.summary_lbl.setText(
+            f"Toplam: {stats.total}   |   Biten: {stats.done}   |   Geciken: {stats.overdue}"
+        )
         
-        if proj_counts:
-            wedges, texts, autotexts = ax1.pie(proj_counts.values(), labels=proj_counts.keys(), autopct='%1.1f%%', startangle=90, colors=colors)
-            
-            # Yazı renkleri
-            for t in texts: t.set_color(text_color)
-            for t in autotexts: t.set_color('#333') # İç yazılar her zaman koyu
-            
-            ax1.set_title("Proje Dağılımı", fontsize=10, color=text_color)
+        # Tema Renkleri: (grafik arka planı, yazı rengi)
+        if self.current_theme_is_dark:
+            theme = ('#2D3748', '#E2E8F0')
         else:
-            ax1.text(0.5, 0.5, "Veri Yok", ha='center', color=text_color)
-            
-        self.canvas1.draw()
+            theme = ('#F5F7FA', '#333333')
 
-        # --- Grafik 2: Sütun ---
-        self.fig2.clear()
-        ax2 = self.fig2.add_subplot(111)
-        
-        # Eksen renkleri
-        ax2.spines['bottom'].set_color(text_color)
-        ax2.spines['top'].set_color('none') 
-        ax2.spines['left'].set_color(text_color)
-        ax2.spines['right'].set_color('none')
-        ax2.tick_params(axis='x', colors=text_color)
-        ax2.tick_params(axis='y', colors=text_color)
-        ax2.set_facecolor("none") # Plot alanı şeffaf
-        
-        status_map = {'todo': 'Yapılacak', 'in_progress': 'Sürüyor', 'done': 'Bitti'}
-        statuses = [t.status for t in tasks]
-        status_counts = Counter(statuses)
-        
-        if status_counts:
-            labels = [status_map.get(k, k) for k in status_counts.keys()]
-            values = list(status_counts.values())
-            ax2.bar(labels, values, color=['#AECBFA', '#FDE994', '#A7FFEB'])
-            ax2.set_title("Görev Durumu", fontsize=10, color=text_color)
-            
-        self.canvas2.draw()
\ No newline at end of file
+        # Toplamlar değişmediyse ChartView hiç çizmez
+        self.project_chart.set_data(tuple(stats.by_project.items()), theme)
+        self.status_chart.set_data(tuple(stats.by_status.items()), theme)
@@ -6,6 +6,10 @@ from PySide6.QtWidgets import (
     QPushButton, QSizePolicy, QWidget
 )
 
+# Kart görünümü theme.qss'teki QFrame#TaskCard kurallarından gelir; kart başına
+# stylesheet ayrıştırılmaz, sadece bu dinamik özellikler ayarlanır.
+PRIORITY_LEVELS = {"Yüksek": "high", "Düşük": "low"}  # diğerleri "normal"
+
 class TaskCard(QFrame):
     toggled_done = Signal(int, bool)
     toggled_subtask = Signal(int, bool)
@@ -15,35 +19,22 @@ class TaskCard(QFrame):
     clicked = Signal(int)
 
     def __init__(self, task_id: int, title: str, description: str, due_at: datetime | None, 
-                 is_done: bool, priority: str, tags: str, subtasks: list = None):
+                 is_done: bool, priority: str, tags: str, subtasks: list = None,
+                 subtask_counts: tuple[int, int] | None = None, subtask_loader=None, recurring: bool = False):
         super().__init__()
         self.task_id = task_id
         self._expanded = False
-        self.subtasks = subtasks or []
+        # Alt görevler verilmediyse kart ilk açıldığında subtask_loader(task_id) ile yüklenir
+        self.subtasks = subtasks
+        self._subtask_loader = subtask_loader
 
         self.setObjectName("TaskCard")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
 
         self.setProperty("done", bool(is_done))
-        
-        # Önceliğe göre kenar rengi belirleyelim
-        border_color = "#86CDB9" # Varsayılan (Orta/Düşük)
-        if priority == "Yüksek":
-            border_color = "#E53E3E" # Kırmızı
-        elif priority == "Düşük":
-            border_color = "#38A169" # Yeşil
-
-        self.setStyleSheet(f"""
-            QFrame#TaskCard {{
-                background: #FFFFFF;
-                border: 1px solid {border_color};
-                border-left: 5px solid {border_color};
-                border-radius: 8px;
-            }}
-            QLabel#Title {{ font-size: 15px; font-weight: 700; color: #0F1E19; }}
-            QLabel#Meta {{ color: #718096; font-size: 11px; }}
-            QFrame#TaskCard[done="true"] QLabel#Title {{ color: #A0AEC0; text-decoration: line-through; }}
-        """)
+        self.setProperty("selected", False)
+        # Önceliğe göre kenar rengi (theme.qss)
+        self.setProperty("priority", PRIORITY_LEVELS.get(priority, "normal"))
 
         self.cb = QCheckBox()
         self.cb.setChecked(is_done)
@@ -54,48 +45,19 @@ class TaskCard(QFrame):
 
         # Meta Bilgisi: Tarih | Etiketler | Alt Görevler
         meta_parts = []
-        if due_at: meta_parts.append(due_at.strftime("%d.%m %H:%M"))
+        if due_at: meta_parts.append(("🔁 " if recurring else "") + due_at.strftime("%d.%m %H:%M"))
         if tags: meta_parts.append(f"🏷️ {tags}")
-        if self.subtasks:
-            done_count = sum(1 for s in self.subtasks if s.is_done)
-            meta_parts.append(f"✅ {done_count}/{len(self.subtasks)}")
+        if subtask_counts is None and self.subtasks:
+            subtask_counts = (sum(1 for s in self.subtasks if s.is_done), len(self.subtasks))
+        if subtask_counts and subtask_counts[1]:
+            meta_parts.append(f"✅ {subtask_counts[0]}/{subtask_counts[1]}")
             
         self.meta_lbl = QLabel("  |  ".join(meta_parts))
         self.meta_lbl.setObjectName("Meta")
         
-        # --- Detay Alanı ---
-        self.detail_widget = QWidget()
-        self.detail_layout = QVBoxLayout(self.detail_widget)
-        self.detail_layout.setContentsMargins(25, 5, 5, 5)
-        self.detail_widget.setVisible(False)
-        
-        if description:
-            desc_lbl = QLabel(description)
-            desc_lbl.setStyleSheet("color:#4A5568; font-style:italic;")
-            desc_lbl.setWordWrap(True)
-            self.detail_layout.addWidget(desc_lbl)
-            
-        for st in self.subtasks:
-            st_cb = QCheckBox(st.title)
-            st_cb.setChecked(st.is_done)
-            st_cb.stateChanged.connect(lambda state, sid=st.id: self.toggled_subtask.emit(sid, state == Qt.Checked))
-            self.detail_layout.addWidget(st_cb)
-
-        # Butonlar
-        action_row = QHBoxLayout()
-        self.edit_btn = QPushButton("Düzenle")
-        self.edit_btn.setFixedSize(60,25)
-        self.edit_btn.clicked.connect(self._emit_edit)
-        
-        self.del_btn = QPushButton("Sil")
-        self.del_btn.setFixedSize(40,25)
-        self.del_btn.setStyleSheet("color:#E53E3E;")
-        self.del_btn.clicked.connect(self._emit_delete)
-        
-        action_row.addStretch()
-        action_row.addWidget(self.edit_btn)
-        action_row.addWidget(self.del_btn)
-        self.detail_layout.addLayout(action_row)
+        # --- Detay Alanı: çoğu kart hiç açılmadığı için ilk açılışta kurulur ---
+        self._description = description
+        self.detail_widget: QWidget | None = None
 
         # Layout
         top = QHBoxLayout()
@@ -111,9 +73,8 @@ class TaskCard(QFrame):
         self.expand_btn.clicked.connect(self.toggle_expand)
         top.addWidget(self.expand_btn)
 
-        main = QVBoxLayout(self)
-        main.addLayout(top)
-        main.addWidget(self.detail_widget)
+        self._main_layout = QVBoxLayout(self)
+        self._main_layout.addLayout(top)
 
         self._apply_font_strike(bool(is_done))
 
@@ -124,18 +85,68 @@ class TaskCard(QFrame):
 
     def _on_done_changed(self, state: int):
         self.clicked.emit(self.task_id)
-        done = state == Qt.Checked
+        done = Qt.CheckState(state) == Qt.Checked
         self.setProperty("done", bool(done))
         self._apply_font_strike(bool(done))
         self.style().unpolish(self)
         self.style().polish(self)
         self.toggled_done.emit(self.task_id, done)
 
+    def _build_subtasks(self):
+        for st in self.subtasks:
+            st_cb = QCheckBox(st.title)
+            st_cb.setChecked(st.is_done)
+            st_cb.stateChanged.connect(lambda state, sid=st.id: self.toggled_subtask.emit(sid, Qt.CheckState(state) == Qt.Checked))
+            self.subtask_layout.addWidget(st_cb)
+
+    def _build_detail(self):
+        self.detail_widget = QWidget()
+        self.detail_layout = QVBoxLayout(self.detail_widget)
+        self.detail_layout.setContentsMargins(25, 5, 5, 5)
+
+        if self._description:
+            desc_lbl = QLabel(self._description)
+            desc_lbl.setObjectName("Description")
+            desc_lbl.setWordWrap(True)
+            self.detail_layout.addWidget(desc_lbl)
+
+        self.subtask_layout = QVBoxLayout()
+        self.detail_layout.addLayout(self.subtask_layout)
+        if self.subtasks is None:
+            self.subtasks = self._subtask_loader(self.task_id) if self._subtask_loader else []
+        self._build_subtasks()
+
+        # Butonlar
+        action_row = QHBoxLayout()
+        self.edit_btn = QPushButton("Düzenle")
+        self.edit_btn.setFixedSize(60,25)
+        self.edit_btn.clicked.connect(self._emit_edit)
+
+        self.del_btn = QPushButton("Sil")
+        self.del_btn.setObjectName("DeleteButton")
+        self.del_btn.setFixedSize(40,25)
+        self.del_btn.clicked.connect(self._emit_delete)
+
+        action_row.addStretch()
+        action_row.addWidget(self.edit_btn)
+        action_row.addWidget(self.del_btn)
+        self.detail_layout.addLayout(action_row)
+        self._main_layout.addWidget(self.detail_widget)
+
     def toggle_expand(self):
+        if self.detail_widget is None:
+            self._build_detail()
         self._expanded = not self._expanded
         self.detail_widget.setVisible(self._expanded)
         self.size_changed.emit(self.task_id)
 
+    def set_selected(self, selected: bool) -> None:
+        if self.property("selected") == selected:
+            return
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def _emit_edit(self): self.request_edit.emit(self.task_id)
     def _emit_delete(self): self.request_delete.emit(self.task_id)
     def mousePressEvent(self, event):
@@ -1,14 +1,28 @@
 from __future__ import annotations
 from datetime import datetime
 from PySide6.QtCore import QDateTime
+from taskscope.models.task import DEFAULT_REMINDERS, DEFAULT_PROJECT, parse_reminders
+from taskscope.models.recurrence import RuleError, describe, normalize_rule
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
     QDateTimeEdit, QCheckBox, QPushButton, QMessageBox, QComboBox
 )
 
+# Tekrar hazır seçenekleri; "Özel" satırında kural metni elle yazılır (COUNT / UNTIL eklenebilir)
+RECURRENCE_PRESETS = (
+    ("Tekrarlanmaz", ""),
+    ("Her gün", "FREQ=DAILY"),
+    ("Hafta içi her gün", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("Her hafta", "FREQ=WEEKLY"),
+    ("Her ay", "FREQ=MONTHLY"),
+    ("Özel", None),
+)
+
+
 class TaskEditorDialog(QDialog):
     def __init__(self, parent=None, title: str = "", description: str = "", due_at: datetime | None = None,
-                 priority: str = "Orta", tags: str = ""):
+                 priority: str = "Orta", tags: str = "", reminders: str = DEFAULT_REMINDERS,
+                 project: str = DEFAULT_PROJECT, projects: list[str] = (), recurrence: str | None = None):
         super().__init__(parent)
         self.setWindowTitle("Görev Detayları")
         self.setModal(True)
@@ -38,6 +52,15 @@ class TaskEditorDialog(QDialog):
         meta_layout.addWidget(self.tags_edit)
         # ---------------------------------------------
 
+        # Proje: mevcutlardan seçilir ya da yeni ad yazılır
+        self.project_combo = QComboBox()
+        self.project_combo.setEditable(True)
+        self.project_combo.addItems(sorted({DEFAULT_PROJECT, *projects, project or DEFAULT_PROJECT}, key=str.lower))
+        self.project_combo.setCurrentText(project or DEFAULT_PROJECT)
+        project_layout = QHBoxLayout()
+        project_layout.addWidget(QLabel("Proje:"))
+        project_layout.addWidget(self.project_combo, 1)
+
         # Alt Görevler
         self.subtasks_edit = QTextEdit()
         self.subtasks_edit.setPlaceholderText("Alt Görevler:\n- Madde 1\n- Madde 2")
@@ -54,6 +77,24 @@ class TaskEditorDialog(QDialog):
         self.due_edit.setEnabled(False)
         self.due_edit.setDateTime(QDateTime.currentDateTime().addSecs(3600))
 
+        # Hatırlatmalar: bitişten kaç dakika önce (0 = süre dolunca)
+        self.reminders_edit = QLineEdit()
+        self.reminders_edit.setPlaceholderText("Hatırlatma (dk önce, örn: 60, 15, 0)")
+        self.reminders_edit.setText(reminders)
+        self.reminders_edit.setEnabled(False)
+
+        # Tekrar: bitiş tarihi serinin başlangıcıdır
+        self.recurrence_combo = QComboBox()
+        self.recurrence_combo.addItems([label for label, _ in RECURRENCE_PRESETS])
+        self.recurrence_edit = QLineEdit(recurrence or "")
+        self.recurrence_edit.setPlaceholderText("Kural, örn: FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10")
+        self.recurrence_lbl = QLabel()
+        self.recurrence_lbl.setStyleSheet("opacity:0.7;")
+        recurrence_layout = QHBoxLayout()
+        recurrence_layout.addWidget(QLabel("Tekrar:"))
+        recurrence_layout.addWidget(self.recurrence_combo)
+        recurrence_layout.addWidget(self.recurrence_edit, 1)
+
         self.save_btn = QPushButton("Kaydet")
         self.cancel_btn = QPushButton("İptal")
 
@@ -69,11 +110,15 @@ class TaskEditorDialog(QDialog):
         layout.addWidget(self.desc_edit)
         
         layout.addLayout(meta_layout) # Meta satırını ekle
+        layout.addLayout(project_layout)
         
         layout.addWidget(QLabel("Alt Görevler"))
         layout.addWidget(self.subtasks_edit)
         layout.addWidget(self.has_due_cb)
         layout.addWidget(self.due_edit)
+        layout.addWidget(self.reminders_edit)
+        layout.addLayout(recurrence_layout)
+        layout.addWidget(self.recurrence_lbl)
         layout.addLayout(btn_row)
         self.setLayout(layout)
 
@@ -87,14 +132,47 @@ class TaskEditorDialog(QDialog):
             qdt = QDateTime.fromSecsSinceEpoch(int(due_at.timestamp()))
             self.due_edit.setDateTime(qdt)
 
+        self.reminders_edit.setEnabled(self.has_due_cb.isChecked())
         self.has_due_cb.toggled.connect(self.due_edit.setEnabled)
+        self.has_due_cb.toggled.connect(self.reminders_edit.setEnabled)
+        self._sync_recurrence_combo(self.recurrence_edit.text())
+        self.recurrence_combo.currentIndexChanged.connect(self._on_recurrence_preset)
+        self.recurrence_edit.textChanged.connect(self._sync_recurrence_combo)
+        for w in (self.recurrence_combo, self.recurrence_edit):
+            w.setEnabled(self.has_due_cb.isChecked())
+            self.has_due_cb.toggled.connect(w.setEnabled)
         self.cancel_btn.clicked.connect(self.reject)
         self.save_btn.clicked.connect(self._on_save)
 
+    def _on_recurrence_preset(self, index: int) -> None:
+        rule = RECURRENCE_PRESETS[index][1]
+        if rule is not None:
+            self.recurrence_edit.setText(rule)
+
+    def _sync_recurrence_combo(self, text: str) -> None:
+        try:
+            rule = normalize_rule(text) or ""
+        except RuleError as e:
+            rule = None
+            self.recurrence_lbl.setText(f"⚠️ {e}")
+        else:
+            self.recurrence_lbl.setText(describe(rule))
+        index = next((i for i, (_, r) in enumerate(RECURRENCE_PRESETS) if r is not None and r == rule),
+                     len(RECURRENCE_PRESETS) - 1)
+        self.recurrence_combo.blockSignals(True)
+        self.recurrence_combo.setCurrentIndex(index)
+        self.recurrence_combo.blockSignals(False)
+
     def _on_save(self) -> None:
         if not self.title_edit.text().strip():
             QMessageBox.warning(self, "Uyarı", "Başlık boş olamaz.")
             return
+        if self.has_due_cb.isChecked():
+            try:
+                normalize_rule(self.recurrence_edit.text())
+            except RuleError as e:
+                QMessageBox.warning(self, "Uyarı", f"Tekrar kuralı geçersiz: {e}")
+                return
         self.accept()
 
     def get_values(self) -> tuple:
@@ -104,8 +182,14 @@ class TaskEditorDialog(QDialog):
         
         priority = self.priority_combo.currentText()
         tags = self.tags_edit.text().strip()
+        project = self.project_combo.currentText().strip() or DEFAULT_PROJECT
         
         raw_subs = self.subtasks_edit.toPlainText().split('\n')
         subtasks = [s.strip() for s in raw_subs if s.strip()]
+
+        # Geçersiz girdiler atılır; boş bırakılırsa hatırlatma yok
+        reminders = ",".join(str(m) for m in parse_reminders(self.reminders_edit.text()))
+        # Tarihsiz görev tekrarlanamaz; "" = tekrar yok
+        recurrence = (normalize_rule(self.recurrence_edit.text()) or "") if due_at is not None else ""
         
-        return title, desc, due_at, priority, tags, subtasks
+        return title, desc, due_at, priority, tags, subtasks, reminders, project, recurrence
@@ -0,0 +1,473 @@
+from __future__ import annotations
+from datetime import datetime
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QRect, QSize, QEvent
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import (
+    QListView, QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionViewItem,
+    QAbstractItemView
+)
+
+from taskscope.ui.reconcile import plan_reconcile
+
+# Kart renkleri (TaskCard ile aynı palet)
+PRIORITY_COLORS = {"Yüksek": "#E53E3E", "Düşük": "#38A169"}
+DEFAULT_BORDER = "#86CDB9"
+SELECTED_BORDER = "#3182CE"
+SELECTED_FILL = "#EBF8FF"
+
+TaskIdRole = Qt.UserRole + 1
+ExpandedRole = Qt.UserRole + 2
+
+
+class TaskItem:
+    """Modelde tutulan hafif görev kaydı (ORM nesnesi yerine)"""
+    __slots__ = ("id", "title", "description", "due_at", "is_done", "priority", "tags",
+                 "subtasks", "subtask_total", "subtask_done", "updated_at", "expanded", "recurring")
+
+    def __init__(self, id: int, title: str, description: str, due_at: datetime | None,
+                 is_done: bool, priority: str, tags: str, subtask_total: int = 0, subtask_done: int = 0,
+                 updated_at: datetime | None = None, recurring: bool = False):
+        self.id = id
+        self.title = (title or "").strip()
+        self.description = description or ""
+        self.due_at = due_at
+        self.is_done = bool(is_done)
+        self.priority = priority
+        self.tags = tags or ""
+        # [id, başlık, bitti_mi] listeleri; kart ilk açıldığında yüklenir (None = yüklenmedi)
+        self.subtasks: list[list] | None = None
+        self.subtask_total = subtask_total
+        self.subtask_done = subtask_done
+        self.updated_at = updated_at
+        self.expanded = False
+        self.recurring = bool(recurring)
+
+    @classmethod
+    def from_row(cls, t) -> "TaskItem":
+        return cls(t.id, t.title, t.description, t.due_at, t.is_done, t.priority, t.tags,
+                   t.subtask_total, t.subtask_done, t.updated_at, t.recurring)
+
+    @property
+    def key(self) -> tuple:
+        return self.id, self.updated_at
+
+    def meta_text(self) -> str:
+        meta_parts = []
+        if self.due_at: meta_parts.append(("🔁 " if self.recurring else "") + self.due_at.strftime("%d.%m %H:%M"))
+        if self.tags: meta_parts.append(f"🏷️ {self.tags}")
+        if self.subtask_total:
+            meta_parts.append(f"✅ {self.subtask_done}/{self.subtask_total}")
+        return "  |  ".join(meta_parts)
+
+
+class TaskListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: list[TaskItem] = []
+        self._row_by_id: dict[int, int] = {}
+        # task_id -> SubTaskRow listesi; kart açılınca çağrılır
+        self.subtask_loader = None
+        # Sonsuz kaydırma: fetch_page(imleç) -> (satırlar, sonraki imleç)
+        self._fetch_page = None
+        self._cursor = None
+
+    # --- Qt arayüzü ---
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return item.title
+        if role == TaskIdRole:
+            return item.id
+        if role == ExpandedRole:
+            return item.expanded
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._cursor is not None and self._fetch_page is not None
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        rows, self._cursor = self._fetch_page(self._cursor)
+        # Araya giren yazmalar yüzünden bir satır iki sayfada görünebilir
+        new_items = [TaskItem.from_row(r) for r in rows if r.id not in self._row_by_id]
+        if not new_items:
+            return
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_items) - 1)
+        self._items.extend(new_items)
+        for row, item in enumerate(new_items, start=first):
+            self._row_by_id[item.id] = row
+        self.endInsertRows()
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # --- Veri yönetimi ---
+    def set_tasks(self, tasks) -> None:
+        self.beginResetModel()
+        self._items = [TaskItem.from_row(t) for t in tasks]
+        self._reindex()
+        self.endResetModel()
+
+    def sync_page(self, rows, cursor, fetch_page) -> bool:
+        """Yüklü pencereyi yeni ilk sayfa(lar)la uzlaştırır, kaydırınca fetch_page ile devam eder"""
+        relayout = self.sync_tasks(rows)
+        self._cursor = cursor
+        self._fetch_page = fetch_page
+        return relayout
+
+    def loaded_count(self) -> int:
+        return len(self._items)
+
+    def sync_tasks(self, tasks) -> bool:
+        """Sadece eklenen, silinen, yer değiştiren ve güncellenen satırlara dokunur.
+
+        Açık (expanded) bir kartın içeriği değiştiyse True döner.
+        """
+        new_items = [TaskItem.from_row(t) for t in tasks]
+        plan = plan_reconcile([i.key for i in self._items], [i.key for i in new_items])
+        if plan.is_empty():
+            return False
+        expanded = {i.id for i in self._items if i.expanded}
+        for item in new_items:
+            item.expanded = item.id in expanded
+            if item.expanded:
+                self._load_subtasks(item)
+
+        for first, last in _runs(plan.remove, step=-1):
+            self.beginRemoveRows(QModelIndex(), last, first)
+            del self._items[last:first + 1]
+            self.endRemoveRows()
+        for first, last in _runs(plan.insert, step=1):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._items[first:first] = new_items[first:last + 1]
+            self.endInsertRows()
+        relayout = False
+        for row in plan.update:
+            self._items[row] = new_items[row]
+            relayout = relayout or new_items[row].expanded
+            self._changed(row)
+        self._reindex()
+        return relayout
+
+    def invalidate(self) -> None:
+        """Sonraki uzlaştırmada tüm satırlar yenilensin (iyimser değişiklikleri geri almak için)"""
+        for item in self._items:
+            item.updated_at = None
+
+    def _reindex(self) -> None:
+        self._row_by_id = {item.id: row for row, item in enumerate(self._items)}
+
+    def item_at(self, row: int) -> TaskItem:
+        return self._items[row]
+
+    def row_of(self, task_id: int) -> int:
+        return self._row_by_id.get(task_id, -1)
+
+    def _changed(self, row: int) -> None:
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+    def set_done(self, row: int, done: bool) -> None:
+        self._items[row].is_done = done
+        self._changed(row)
+
+    def _load_subtasks(self, item: TaskItem) -> None:
+        if self.subtask_loader is not None:
+            item.subtasks = [[st.id, st.title, bool(st.is_done)] for st in self.subtask_loader(item.id)]
+        else:
+            item.subtasks = []
+
+    def set_expanded(self, row: int, expanded: bool) -> None:
+        item = self._items[row]
+        if expanded and item.subtasks is None:
+            self._load_subtasks(item)
+        item.expanded = expanded
+        self._changed(row)
+
+    def set_subtask_done(self, row: int, sub_index: int, done: bool) -> None:
+        item = self._items[row]
+        item.subtasks[sub_index][2] = done
+        item.subtask_done += 1 if done else -1
+        self._changed(row)
+
+
+def _runs(indices: list[int], step: int):
+    """Ardışık indeksleri (ilk, son) aralıklarına gruplar"""
+    start = prev = None
+    for i in indices:
+        if prev is not None and i == prev + step:
+            prev = i
+            continue
+        if start is not None:
+            yield start, prev
+        start = prev = i
+    if start is not None:
+        yield start, prev
+
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """Kartları widget oluşturmadan çizer; tıklamaları editorEvent ile yakalar"""
+    toggled_done = Signal(int, bool)
+    toggled_subtask = Signal(int, bool)
+    request_edit = Signal(int)
+    request_delete = Signal(int)
+
+    MARGIN = 12
+    CHECK = 18
+    LINE = 24
+    BTN_H = 24
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(15)
+        self.title_font.setBold(True)
+        self.meta_font = QFont()
+        self.meta_font.setPixelSize(11)
+        self.desc_font = QFont()
+        self.desc_font.setItalic(True)
+        self._title_h = QFontMetrics(self.title_font).height()
+        self._meta_h = QFontMetrics(self.meta_font).height()
+        self._collapsed_h = self.MARGIN * 2 + self._title_h + 4 + self._meta_h
+
+    # --- Yerleşim: paint ve editorEvent aynı hesabı kullanır ---
+    def _desc_height(self, item: TaskItem, width: int) -> int:
+        if not item.description:
+            return 0
+        fm = QFontMetrics(self.desc_font)
+        r = fm.boundingRect(QRect(0, 0, max(width, 50), 10000), Qt.TextWordWrap, item.description)
+        return r.height() + 6
+
+    def _layout(self, rect: QRect, item: TaskItem) -> dict:
+        m = self.MARGIN
+        card = rect.adjusted(2, 2, -2, -2)
+        lay = {"card": card}
+        top = card.top() + m
+        lay["check"] = QRect(card.left() + m, top + (self._title_h + self._meta_h - self.CHECK) // 2,
+                             self.CHECK, self.CHECK)
+        lay["expand"] = QRect(card.right() - m - 50, top + 4, 50, self.BTN_H)
+        text_left = lay["check"].right() + 10
+        text_w = lay["expand"].left() - 10 - text_left
+        lay["title"] = QRect(text_left, top, text_w, self._title_h)
+        lay["meta"] = QRect(text_left, top + self._title_h + 4, text_w, self._meta_h)
+        if not item.expanded:
+            return lay
+
+        # Detay alanı
+        y = top + self._title_h + 4 + self._meta_h + 8
+        detail_left = card.left() + m + 25
+        detail_w = card.right() - m - detail_left
+        dh = self._desc_height(item, detail_w)
+        lay["desc"] = QRect(detail_left, y, detail_w, dh)
+        y += dh
+        subs = []
+        for _ in item.subtasks:
+            subs.append(QRect(detail_left, y + (self.LINE - self.CHECK) // 2, self.CHECK, self.CHECK))
+            y += self.LINE
+        lay["subtasks"] = subs
+        y += 4
+        lay["delete"] = QRect(card.right() - m - 40, y, 40, self.BTN_H)
+        lay["edit"] = QRect(lay["delete"].left() - 8 - 60, y, 60, self.BTN_H)
+        lay["bottom"] = y + self.BTN_H + m
+        return lay
+
+    def sizeHint(self, option, index):
+        model = index.model()
+        item = model.item_at(index.row())
+        view = self.parent()
+        width = view.viewport().width() - 2 * view.spacing() if view is not None else option.rect.width()
+        if not item.expanded:
+            return QSize(width, self._collapsed_h + 4)
+        lay = self._layout(QRect(0, 0, width, 0), item)
+        return QSize(width, lay["bottom"] + 2)
+
+    # --- Çizim ---
+    def _draw_check(self, painter, rect: QRect, checked: bool, widget) -> None:
+        opt = QStyleOptionButton()
+        opt.rect = rect
+        opt.state = QStyle.State_Enabled | (QStyle.State_On if checked else QStyle.State_Off)
+        widget.style().drawPrimitive(QStyle.PE_IndicatorCheckBox, opt, painter, widget)
+
+    def _draw_button(self, painter, rect: QRect, text: str, color: str = "#0C1613") -> None:
+        painter.setPen(QPen(QColor("#1F9A79")))
+        painter.setBrush(QColor("#3CAF8B"))
+        painter.drawRoundedRect(rect, 8, 8)
+        painter.setPen(QColor(color))
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        item = index.model().item_at(index.row())
+        widget = option.widget
+        lay = self._layout(option.rect, item)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        border = QColor(PRIORITY_COLORS.get(item.priority, DEFAULT_BORDER))
+        card = lay["card"]
+        if option.state & QStyle.State_Selected:
+            painter.setPen(QPen(QColor(SELECTED_BORDER), 2))
+            painter.setBrush(QColor(SELECTED_FILL))
+        else:
+            painter.setPen(QPen(border, 1))
+            painter.setBrush(QColor("#FFFFFF"))
+        painter.drawRoundedRect(card, 8, 8)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(border)
+        painter.drawRoundedRect(QRect(card.left(), card.top(), 5, card.height()), 2, 2)
+
+        self._draw_check(painter, lay["check"], item.is_done, widget)
+
+        f = QFont(self.title_font)
+        f.setStrikeOut(item.is_done)
+        painter.setFont(f)
+        painter.setPen(QColor("#A0AEC0" if item.is_done else "#0F1E19"))
+        fm = QFontMetrics(f)
+        painter.drawText(lay["title"], Qt.AlignLeft | Qt.AlignVCenter,
+                         fm.elidedText(item.title, Qt.ElideRight, lay["title"].width()))
+
+        painter.setFont(self.meta_font)
+        painter.setPen(QColor("#718096"))
+        painter.drawText(lay["meta"], Qt.AlignLeft | Qt.AlignVCenter, item.meta_text())
+
+        painter.setFont(option.font)
+        self._draw_button(painter, lay["expand"], "Detay")
+
+        if item.expanded:
+            if item.description:
+                painter.setFont(self.desc_font)
+                painter.setPen(QColor("#4A5568"))
+                painter.drawText(lay["desc"], Qt.TextWordWrap, item.description)
+            painter.setFont(option.font)
+            for rect, st in zip(lay["subtasks"], item.subtasks):
+                self._draw_check(painter, rect, st[2], widget)
+                painter.setPen(QColor("#0F1E19"))
+                text_rect = QRect(rect.right() + 8, rect.top() - 3, lay["card"].right() - rect.right() - 20,
+                                  rect.height() + 6)
+                painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, st[1])
+            self._draw_button(painter, lay["edit"], "Düzenle")
+            self._draw_button(painter, lay["delete"], "Sil", "#E53E3E")
+        painter.restore()
+
+    # --- Etkileşim ---
+    def _hit_test(self, lay: dict, item: TaskItem, pos) -> tuple[str, int] | None:
+        """Tıklanan kontrol: ("check"|"expand"|"subtask"|"edit"|"delete", alt görev sırası)"""
+        if lay["check"].adjusted(-4, -4, 4, 4).contains(pos):
+            return "check", -1
+        if lay["expand"].contains(pos):
+            return "expand", -1
+        if item.expanded:
+            for i, rect in enumerate(lay["subtasks"]):
+                hit = QRect(rect.left() - 4, rect.top() - 4, lay["card"].right() - rect.left(), rect.height() + 8)
+                if hit.contains(pos):
+                    return "subtask", i
+            if lay["edit"].contains(pos):
+                return "edit", -1
+            if lay["delete"].contains(pos):
+                return "delete", -1
+        return None
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonDblClick:
+            self.request_edit.emit(model.item_at(index.row()).id)
+            return True
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease) \
+                or event.button() != Qt.LeftButton:
+            return False
+        row = index.row()
+        item = model.item_at(row)
+        hit = self._hit_test(self._layout(option.rect, item), item, event.position().toPoint())
+        if hit is None:
+            return False   # kartın boş yeri: seçim görünüme kalır
+        if event.type() == QEvent.MouseButtonPress:
+            return True    # kontrollere basmak seçimi değiştirmesin
+
+        action, sub = hit
+        if action == "check":
+            done = not item.is_done
+            model.set_done(row, done)
+            self.toggled_done.emit(item.id, done)
+        elif action == "expand":
+            model.set_expanded(row, not item.expanded)
+            self.sizeHintChanged.emit(index)
+        elif action == "subtask":
+            st = item.subtasks[sub]
+            model.set_subtask_done(row, sub, not st[2])
+            self.toggled_subtask.emit(st[0], st[2])
+        elif action == "edit":
+            self.request_edit.emit(item.id)
+        elif action == "delete":
+            self.request_delete.emit(item.id)
+        return True
+
+
+class TaskListView(QListView):
+    """Sadece görünen satırları çizen sanal görev listesi"""
+    toggled_done = Signal(int, bool)
+    toggled_subtask = Signal(int, bool)
+    request_edit = Signal(int)
+    request_delete = Signal(int)
+    selection_changed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.task_model = TaskListModel(self)
+        self.delegate = TaskCardDelegate(self)
+        self.setModel(self.task_model)
+        self.setItemDelegate(self.delegate)
+
+        self.setSpacing(3)
+        # Ctrl/Shift ile çoklu seçim; toplu işlemler seçili görevlere uygulanır
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(20)
+        # Büyük listelerde yerleşimi parça parça hesapla, arayüz donmasın
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(500)
+        self.setMouseTracking(True)
+
+        self.delegate.toggled_done.connect(self.toggled_done.emit)
+        self.delegate.toggled_subtask.connect(self.toggled_subtask.emit)
+        self.delegate.request_edit.connect(self.request_edit.emit)
+        self.delegate.request_delete.connect(self.request_delete.emit)
+        self.selectionModel().selectionChanged.connect(lambda *_: self.selection_changed.emit())
+
+    def set_subtask_loader(self, loader) -> None:
+        self.task_model.subtask_loader = loader
+
+    def set_tasks(self, tasks) -> None:
+        self.task_model.set_tasks(tasks)
+
+    def sync_tasks(self, tasks) -> None:
+        if self.task_model.sync_tasks(tasks):
+            self.scheduleDelayedItemsLayout()
+
+    def sync_page(self, rows, cursor, fetch_page) -> None:
+        if self.task_model.sync_page(rows, cursor, fetch_page):
+            self.scheduleDelayedItemsLayout()
+
+    def loaded_count(self) -> int:
+        return self.task_model.loaded_count()
+
+    def invalidate(self) -> None:
+        self.task_model.invalidate()
+
+    def selected_task_ids(self) -> list[int]:
+        rows = sorted(i.row() for i in self.selectionModel().selectedRows())
+        return [self.task_model.item_at(r).id for r in rows]
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Açık kartların yüksekliği genişliğe bağlı (açıklama satır kaydırma)
+        self.scheduleDelayedItemsLayout()
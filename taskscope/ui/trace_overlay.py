@@ -0,0 +1,58 @@
+from __future__ import annotations
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QLabel, QWidget
+
+from taskscope.services.tracing import Tracer
+
+# Kaplamada gösterilen satır sayısı ve yenileme aralığı
+ROWS = 8
+INTERVAL_MS = 1000
+
+
+class TraceOverlay(QLabel):
+    """İz açıkken pencerenin sağ üstünde son işlemlerin en yavaşlarını gösterir.
+
+    Fareyi engellemez; Ctrl+Shift+T ile gizlenip gösterilir.
+    """
+
+    def __init__(self, tracer: Tracer, parent: QWidget):
+        super().__init__(parent)
+        self.tracer = tracer
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setStyleSheet(
+            "background: rgba(20, 24, 32, 200); color: #E2E8F0; border-radius: 6px;"
+            "padding: 6px 8px; font-family: Consolas, monospace; font-size: 11px;"
+        )
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(INTERVAL_MS)
+        QShortcut(QKeySequence("Ctrl+Shift+T"), parent, self.toggle)
+        parent.installEventFilter(self)
+        self.refresh()
+
+    def toggle(self):
+        self.setHidden(not self.isHidden())
+        self.refresh()
+
+    def refresh(self):
+        # Pencere henüz gösterilmemiş olabilir; sadece kullanıcı gizlediyse atla
+        if self.isHidden():
+            return
+        lines = ["🧭 En yavaş son işlemler"]
+        for ms, cat, name in self.tracer.slowest(ROWS):
+            lines.append(f"{ms:8.1f} ms  {cat:<5} {name[:48]}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self._place()
+        self.raise_()
+
+    def _place(self):
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 12, 12)
+
+    def eventFilter(self, obj, event):
+        if event.type() == event.Type.Resize:
+            self._place()
+        return False